@@ -4,10 +4,49 @@ Core Module
 This module contains the fundamental classes for network topology representation.
 """
 
-from typing import Dict, List, Set, Optional, Any, Tuple
+from typing import Dict, Iterable, List, Set, Optional, Any, Tuple
 import networkx as nx # pyright: ignore[reportMissingModuleSource]
 from dataclasses import dataclass, field
 
+# Link attributes that feed routing costs; writing one bumps the link-state epoch
+_LINK_STATE_FIELDS = ("status", "delay", "bandwidth", "loss")
+
+# Bumped whenever any link's status, delay, bandwidth or loss is written
+_link_state_epoch = 0
+
+
+def link_state_epoch() -> int:
+    """
+    Get the current link-state epoch.
+
+    The epoch moves on whenever a link-state attribute of any link is written,
+    whichever topologies the link belongs to, so it can key caches of values
+    derived from link state.
+
+    Returns:
+        Current link-state epoch
+    """
+    return _link_state_epoch
+
+
+class _LinkStateField:
+    """
+    Descriptor for a Link attribute that feeds routing costs.
+
+    Only writes are intercepted; with no __get__, reads come straight from
+    the instance dict.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __set__(self, instance, value):
+        global _link_state_epoch
+        instance.__dict__[self.name] = value
+        _link_state_epoch += 1
+
 
 @dataclass
 class Link:
@@ -40,6 +79,11 @@ class Link:
                 self.loss == other.loss)
 
 
+for _name in _LINK_STATE_FIELDS:
+    setattr(Link, _name, _LinkStateField(_name))
+del _name
+
+
 @dataclass
 class Node:
     """
@@ -83,6 +127,13 @@ class Topology:
         self.nodes: Dict[str, Node] = {}
         self.links: Dict[Tuple[str, str], Link] = {}
         self.node_coordinates: Dict[str, Tuple[int, int]] = {}
+        # Bumped on every structural change so callers can cache adjacency
+        self._version = 0
+        # Bumped when coordinates move without a structural change
+        self._coords_version = 0
+        # Neighbor-ID index, rebuilt lazily when _version moves on
+        self._adjacency: Dict[str, List[str]] = {}
+        self._adjacency_version = -1
 
     def add_node(self, node: Node):
         """
@@ -93,6 +144,7 @@ class Topology:
         """
         self.graph.add_node(node.node_id)
         self.nodes[node.node_id] = node
+        self._version += 1
         if node.coordinates:
             self.node_coordinates[node.node_id] = node.coordinates
 
@@ -106,6 +158,22 @@ class Topology:
         self.graph.add_edge(link.node_a, link.node_b)
         link_key = tuple(sorted((link.node_a, link.node_b)))
         self.links[link_key] = link
+        self._version += 1
+
+    def extend_links(self, links: Iterable[Link]):
+        """
+        Add many links at once.
+
+        Equivalent to calling add_link for each link in order, but the graph
+        and link table are updated in bulk and the version moves only once.
+
+        Args:
+            links: Link objects to add
+        """
+        links = list(links)
+        self.graph.add_edges_from((link.node_a, link.node_b) for link in links)
+        self.links.update((tuple(sorted((link.node_a, link.node_b))), link) for link in links)
+        self._version += 1
 
     def remove_node(self, node_id: str):
         """
@@ -129,6 +197,7 @@ class Topology:
             del self.nodes[node_id]
             if node_id in self.node_coordinates:
                 del self.node_coordinates[node_id]
+            self._version += 1
 
     def remove_link(self, node_a: str, node_b: str):
         """
@@ -142,6 +211,7 @@ class Topology:
         if link_key in self.links:
             self.graph.remove_edge(node_a, node_b)
             del self.links[link_key]
+            self._version += 1
 
     def get_node(self, node_id: str) -> Optional[Node]:
         """
@@ -190,6 +260,37 @@ class Topology:
 
         return neighbors
 
+    def get_neighbor_ids(self, node_id: str) -> List[str]:
+        """
+        Get the IDs of all neighbor nodes of a given node.
+
+        Args:
+            node_id: Node ID
+
+        Returns:
+            List of neighbor node IDs (shared; do not modify)
+        """
+        return self.get_adjacency().get(node_id, [])
+
+    def get_adjacency(self) -> Dict[str, List[str]]:
+        """
+        Get the neighbor IDs of every node.
+
+        The index is built once per structural version of the topology, so
+        repeated traversals share it instead of walking the graph per node.
+
+        Returns:
+            Mapping of node ID to its neighbor IDs (shared; do not modify)
+        """
+        if self._adjacency_version != self._version:
+            nodes = self.nodes
+            self._adjacency = {
+                node_id: [neighbor_id for neighbor_id in neighbors if neighbor_id in nodes]
+                for node_id, neighbors in self.graph.adj.items()
+            }
+            self._adjacency_version = self._version
+        return self._adjacency
+
     def get_all_nodes(self) -> List[Node]:
         """
         Get all nodes in the topology.
@@ -265,6 +366,7 @@ class Topology:
         if node_id in self.nodes:
             self.nodes[node_id].coordinates = coordinates
             self.node_coordinates[node_id] = coordinates
+            self._coords_version += 1
 
     def get_node_coordinates(self, node_id: str) -> Optional[Tuple[int, int]]:
         """
@@ -339,6 +441,8 @@ class Topology:
             link_key = tuple(sorted((u, v)))
             self.links[link_key] = link
 
+        self._version += 1
+
     def __str__(self) -> str:
         """String representation of the topology."""
         return f"Topology with {len(self.nodes)} nodes and {len(self.links)} links"
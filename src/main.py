@@ -6,17 +6,19 @@ import queue
 import math
 import matplotlib.pyplot as plt  # pyright: ignore[reportMissingModuleSource]
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg  # pyright: ignore[reportMissingModuleSource]
+from matplotlib.backends.backend_pdf import PdfPages  # pyright: ignore[reportMissingModuleSource]
+import numpy as np  # pyright: ignore[reportMissingModuleSource]
 import random
 from typing import Dict, List, Tuple, Optional
 import json
 import os
 import sys
 import heapq
-import copy
 import re
 import zipfile
 import ipaddress
 import datetime
+from collections import defaultdict
 
 # Add the parent directory to the Python path to import src modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -31,11 +33,46 @@ from src.evaluation_metrics import EvaluationMetrics
 from src.visualization import NetworkVisualizer, MetricsVisualizer, SimulationDashboard
 from src.protocols import RIPRouter, OSPFRouter, RIPNetwork, OSPFNetwork
 from src.traffic_model import CBRGenerator, BurstyGenerator
-from src.config import QOS_WEIGHTS
+from src.config import QOS_WEIGHTS, DEFAULT_RANDOM_SEED
 
 # Import modern UI colors and styles
 from src.modern_ui import COLORS
 
+# Optional KD-tree for nearest-node queries; without SciPy a linear scan is used
+try:
+    from scipy.spatial import cKDTree  # pyright: ignore[reportMissingModuleSource]
+except ImportError:
+    cKDTree = None
+
+
+# Cell size in pixels of the node spatial hash used for click hit-testing
+_SPATIAL_CELL = 50
+
+# Coordinate rows are scanned directly until this many have been appended,
+# then go into a new KD-tree for nearest-node queries
+_KDTREE_BLOCK = 256
+
+
+def _edge_key(u, v):
+    """Canonical (sorted) key for an undirected link, without sorted()'s list allocation."""
+    return (u, v) if u <= v else (v, u)
+
+
+class _DragState:
+    """Mutable state of the node drag in progress, reused across drags."""
+    __slots__ = ("node", "x", "y", "total_dx", "total_dy", "pending_dx", "pending_dy", "original_coords")
+
+    def __init__(self):
+        self.node = None
+        self.x = 0
+        self.y = 0
+        self.total_dx = 0
+        self.total_dy = 0
+        self.pending_dx = 0
+        self.pending_dy = 0
+        self.original_coords = None
+
+
 class ToolTip:
     """
     It creates a tooltip for a given widget as the mouse goes on it.
@@ -252,6 +289,7 @@ class NetworkSimulator:
         self.canvas.tag_bind("device", "<ButtonRelease-1>", self.on_node_release)
         self.canvas.bind("<Button-1>", self.on_canvas_click)
         self.canvas.bind('<Motion>', self.on_canvas_hover) # Hover for metrics
+        self.canvas.bind("<Configure>", self.on_canvas_resize) # Draw items culled while off-screen
 
         # --- 3. Right Side Control Panel (Scrollable) ---
         self.right_container = ttk.Frame(self.content_pane, width=350)
@@ -519,9 +557,12 @@ class NetworkSimulator:
         
         # Initialize network storage
         self.node_coordinates = {}
+        # Adjacency: node -> {neighbor: None}, an insertion-ordered set giving O(1)
+        # membership and removal while keeping neighbour iteration reproducible
         self.network_graph = {}
-        self.all_nodes = []
+        self.all_nodes = {} # Insertion-ordered set of node names (values unused)
         self.broken_links = set()
+        self._broken_by_node = defaultdict(set) # node -> broken links touching it
         self.failed_nodes = set()
         self.topology = Topology()
         self.routing_engine = None
@@ -532,14 +573,37 @@ class NetworkSimulator:
         self.node_queues = {}
         self.eval_data = {}
         self.plots = {}
+        self._pdf_fig = None # Report figure, created on first PDF export and reused
         self.undo_stack = []
-        self.drag_data = {"x": 0, "y": 0, "node": None}
+        self._undo_pending = False # True while the top undo entries are uncopied references
+        self.drag = _DragState()
+        # Canvas item IDs from the last draw, so drags skip find_withtag scans
+        self.node_items = {}
+        self.link_item = {}
+        self.link_label_item = {}
+        self.link_glow_item = {}
+        self._drag_pending = False # A drag flush is scheduled with after_idle
+        self.link_by_tag = {} # Canvas link tag -> edge, for delete-mode clicks
+        # Packed (N, 2) copy of node_coordinates for drags and nearest-node
+        # queries; rebuilt lazily once stale (see _coord_index_stale). It is a
+        # view of the first N rows of a buffer that grows by doubling.
+        self._coord_buf = self._coord_arr = np.zeros((0, 2), dtype=np.float64)
+        # KD-trees over consecutive row ranges of the array, as
+        # (start, stop, tree); rebuilt on the next query once dirty
+        self._coord_trees = []
+        self._coord_trees_dirty = True
+        self._coord_idx = {}
+        self._coord_names = []
+        self._spatial = defaultdict(list) # (cell_x, cell_y) -> node names, built with the array
+        self._coord_src = None
+        self._coord_dirty = True
         self.animation_ids = {}
         self.active_protocol = None # Track active protocol for dynamic updates
         self.node_queues = {}
         self.link_utilization = {}
         self.simulation_running = False
         self.simulation_paused = False
+        self._rng = np.random.default_rng(DEFAULT_RANDOM_SEED) # Shared generator for traffic metrics
         
         # Manual Link Addition State
         self.adding_link_mode = False
@@ -634,8 +698,10 @@ class NetworkSimulator:
             self.canvas.delete("all")
             self.node_coordinates = {}
             self.network_graph = {}
-            self.all_nodes = []
-            self.broken_links.clear()
+            self.link_by_tag = {}
+            self.all_nodes = {}
+            self.broken_links = set()
+            self._broken_by_node = defaultdict(set)
             self.topology = Topology()
             
             import math
@@ -731,8 +797,10 @@ class NetworkSimulator:
         self.canvas.delete("all")
         self.node_coordinates = {}
         self.network_graph = {}
-        self.all_nodes = []
-        self.broken_links.clear()
+        self.link_by_tag = {}
+        self.all_nodes = {}
+        self.broken_links = set()
+        self._broken_by_node = defaultdict(set)
         self.topology = Topology()
         
         parsed_nodes = []
@@ -1107,8 +1175,10 @@ class NetworkSimulator:
 
     def zoom(self, factor):
         # Simple scaling of coordinates
+        self._materialize_undo_state()
         for node in self.node_coordinates:
             self.node_coordinates[node] = (self.node_coordinates[node][0] * factor, self.node_coordinates[node][1] * factor)
+        self._coord_dirty = True
         self.draw_topology()
 
     def fit_to_canvas(self):
@@ -1173,16 +1243,41 @@ class NetworkSimulator:
     # --- Node/Link Helper Methods ---
     def _add_node(self, name, coords):
         """Helper to add a node to our data structures."""
+        self._materialize_undo_state()
+        index_fresh = not self._coord_index_stale()
+        old_coords = self.node_coordinates.get(name)
         self.node_coordinates[name] = coords
-        self.network_graph[name] = []
-        self.all_nodes.append(name)
+        if index_fresh:
+            # Keep the packed coordinates current instead of repacking on the next query
+            if name in self._coord_idx:
+                self._coord_arr[self._coord_idx[name]] = coords
+                self._coord_trees_dirty = True
+                self._spatial_move(name, old_coords, coords)
+            else:
+                self._coord_idx[name] = len(self._coord_names)
+                self._coord_names.append(name)
+                self._append_coord(coords)
+                self._spatial[(int(coords[0] // _SPATIAL_CELL), int(coords[1] // _SPATIAL_CELL))].append(name)
+        self.network_graph[name] = {}
+        self.all_nodes[name] = None
 
     def _add_link(self, nodeA, nodeB):
         """Helper to add a bi-directional link."""
-        if nodeA in self.network_graph and nodeB not in self.network_graph[nodeA]:
-            self.network_graph[nodeA].append(nodeB)
-        if nodeB in self.network_graph and nodeA not in self.network_graph[nodeB]:
-            self.network_graph[nodeB].append(nodeA)
+        self._materialize_undo_state()
+        if nodeA in self.network_graph:
+            self.network_graph[nodeA][nodeB] = None
+        if nodeB in self.network_graph:
+            self.network_graph[nodeB][nodeA] = None
+        edge = _edge_key(nodeA, nodeB)
+        self.link_by_tag[f"link_{'_'.join(edge)}"] = edge
+
+    def _rebuild_link_index(self):
+        """Rebuilds link_by_tag after network_graph is replaced wholesale."""
+        self.link_by_tag = {}
+        for u, neighbors in self.network_graph.items():
+            for v in neighbors:
+                edge = _edge_key(u, v)
+                self.link_by_tag[f"link_{'_'.join(edge)}"] = edge
 
     def _get_distance(self, nodeA, nodeB):
         """Calculate distance between two nodes."""
@@ -1206,9 +1301,9 @@ class NetworkSimulator:
     def _update_option_menus(self):
         """Helper to refresh all dropdown menus with current nodes."""
         if not self.all_nodes:
-            self.all_nodes = [""] # Prevent errors if empty
+            self.all_nodes = {"": None} # Prevent errors if empty
 
-        node_list = self.all_nodes
+        node_list = list(self.all_nodes)
 
         # Clear old menus
         self.source_menu['menu'].delete(0, 'end')
@@ -1245,8 +1340,10 @@ class NetworkSimulator:
         self.canvas.delete("all")
         self.node_coordinates = {}
         self.network_graph = {}
-        self.all_nodes = []
-        self.broken_links.clear() # NEW: Reset broken links
+        self.link_by_tag = {}
+        self.all_nodes = {}
+        self.broken_links = set() # NEW: Reset broken links
+        self._broken_by_node = defaultdict(set)
 
         try:
             n_pcs = int(self.pc_entry.get())
@@ -1302,18 +1399,17 @@ class NetworkSimulator:
                 # Apply to Main
                 self.topology = new_topology
                 self.node_coordinates = self.topology.node_coordinates
-                self.all_nodes = list(self.topology.nodes.keys())
+                self.all_nodes = dict.fromkeys(self.topology.nodes)
                 self.network_graph = {}
                 for u, v in self.topology.graph.edges():
-                    if u not in self.network_graph: self.network_graph[u] = []
-                    if v not in self.network_graph: self.network_graph[v] = []
-                    self.network_graph[u].append(v)
-                    self.network_graph[v].append(u)
+                    self.network_graph.setdefault(u, {})[v] = None
+                    self.network_graph.setdefault(v, {})[u] = None
                 
                 # Ensure isolated nodes are in network_graph
                 for n in self.all_nodes:
                     if n not in self.network_graph:
-                        self.network_graph[n] = []
+                        self.network_graph[n] = {}
+                self._rebuild_link_index()
 
         except Exception as e:
             self.status_label.config(text=f"Status: Error generating layout. {e}", foreground="red")
@@ -1350,6 +1446,9 @@ class NetworkSimulator:
 
     def draw_topology(self, highlight_paths=None, optimal_path=None, optimal_color="green", highlight_nodes=None):
         """Draws all the nodes and links onto the canvas using NetworkVisualizer."""
+        # Remembered so a resize can redraw culled items with the same highlights
+        self._last_draw_args = dict(highlight_paths=highlight_paths, optimal_path=optimal_path,
+                                    optimal_color=optimal_color, highlight_nodes=highlight_nodes)
         self.canvas.delete("all") # Clear canvas
 
         # Create a temporary topology object for visualization
@@ -1358,29 +1457,13 @@ class NetworkSimulator:
 
         # Add nodes to topology
         for name, coords in self.node_coordinates.items():
-            node_type = "router" if name.startswith("R") else \
-                       "switch" if name.startswith("Switch") else \
-                       "hub" if name.startswith("Hub") else \
-                       "server" if name.startswith("Server") else \
-                       "firewall" if name.startswith("FW") else \
-                       "isp" if name.startswith("ISP") else \
-                       "ap" if name.startswith("AP") else \
-                       "load_balancer" if name.startswith("LB") else \
-                       "host"  # Default to host for PCs and others
-            node = Node(name, node_type=node_type, coordinates=coords)
-            temp_topology.add_node(node)
+            temp_topology.add_node(self._display_node(name, coords))
 
         # Determine which links to add
         # Add all links to topology
         for start_node, neighbors in self.network_graph.items():
             for end_node in neighbors:
-                # Get actual link data from self.topology
-                real_link = self.topology.get_link(start_node, end_node)
-                if real_link:
-                    temp_topology.add_link(real_link)
-                else:
-                    link = Link(start_node, end_node, delay=10.0, bandwidth=1000000.0, loss=0.0, status=True)
-                    temp_topology.add_link(link)
+                temp_topology.add_link(self._display_link(start_node, end_node))
 
         # Create visualizer and store it for animation
         self.visualizer = NetworkVisualizer(temp_topology, self.canvas)
@@ -1392,11 +1475,35 @@ class NetworkSimulator:
         link_costs = {}
         for link in temp_topology.get_all_links():
             cost = self.get_link_cost(link.node_a, link.node_b)
-            link_key = tuple(sorted((link.node_a, link.node_b)))
+            link_key = _edge_key(link.node_a, link.node_b)
             link_costs[link_key] = cost
 
         # Draw topology with custom icons and link metrics
         self.visualizer.draw_topology(failed_links=failed_links, highlight_paths=highlight_paths, link_costs=link_costs, optimal_path=optimal_path, optimal_color=optimal_color, node_queues=self.node_queues, link_utilization=self.link_utilization, highlight_nodes=highlight_nodes)
+        self.node_items = self.visualizer.node_items
+        self.link_item = self.visualizer.link_items
+        self.link_label_item = self.visualizer.link_label_items
+        self.link_glow_item = self.visualizer.link_glow_items
+
+    def _display_node(self, name, coords):
+        """Node object used for drawing, typed from the name prefix."""
+        node_type = "router" if name.startswith("R") else \
+                   "switch" if name.startswith("Switch") else \
+                   "hub" if name.startswith("Hub") else \
+                   "server" if name.startswith("Server") else \
+                   "firewall" if name.startswith("FW") else \
+                   "isp" if name.startswith("ISP") else \
+                   "ap" if name.startswith("AP") else \
+                   "load_balancer" if name.startswith("LB") else \
+                   "host"  # Default to host for PCs and others
+        return Node(name, node_type=node_type, coordinates=coords)
+
+    def _display_link(self, u, v):
+        """Actual link data from self.topology, or a default link for graph-only edges."""
+        real_link = self.topology.get_link(u, v)
+        if real_link:
+            return real_link
+        return Link(u, v, delay=10.0, bandwidth=1000000.0, loss=0.0, status=True)
 
     def find_shortest_path(self, start_node, end_node):
         """
@@ -1421,7 +1528,7 @@ class NetworkSimulator:
                     if neighbor in self.failed_nodes:
                         continue
                     # --- Check for broken link ---
-                    link = tuple(sorted((current_node, neighbor)))
+                    link = _edge_key(current_node, neighbor)
                     if link in self.broken_links:
                         continue # Ignore this path
                     # --- End of check ---
@@ -1605,8 +1712,11 @@ class NetworkSimulator:
             self.status_label.config(text=f"Status: No direct link between {node_a} and {node_b}.", foreground="red")
             return
             
-        link = tuple(sorted((node_a, node_b)))
+        link = _edge_key(node_a, node_b)
+        self._materialize_undo_state()
         self.broken_links.add(link)
+        self._broken_by_node[node_a].add(link)
+        self._broken_by_node[node_b].add(link)
         
         # Redraw topology to show broken link
         self.draw_topology()
@@ -1626,7 +1736,9 @@ class NetworkSimulator:
         """
         Clears the broken_links set and redraws.
         """
+        self._materialize_undo_state()
         self.broken_links.clear()
+        self._broken_by_node.clear()
         self.draw_topology()
         self.status_label.config(text="Status: All links restored.", foreground="blue")
         
@@ -1684,7 +1796,7 @@ class NetworkSimulator:
                 return self._reconstruct_path(came_from, end), current_cost
 
             for neighbor in self.network_graph.get(current, []):
-                if tuple(sorted((current, neighbor))) in self.broken_links:
+                if _edge_key(current, neighbor) in self.broken_links:
                     continue
                 
                 # Cost is distance for Dijkstra/OSPF
@@ -1710,7 +1822,7 @@ class NetworkSimulator:
                 return self._reconstruct_path(came_from, end), cost_so_far[end]
 
             for neighbor in self.network_graph.get(current, []):
-                if tuple(sorted((current, neighbor))) in self.broken_links:
+                if _edge_key(current, neighbor) in self.broken_links:
                     continue
                 
                 weight = self.get_link_cost(current, neighbor)
@@ -1734,7 +1846,7 @@ class NetworkSimulator:
         for _ in range(len(self.all_nodes) - 1):
             for u in self.all_nodes:
                 for v in self.network_graph.get(u, []):
-                    if tuple(sorted((u, v))) in self.broken_links:
+                    if _edge_key(u, v) in self.broken_links:
                         continue
                     
                     if metric == "distance":
@@ -1772,7 +1884,7 @@ class NetworkSimulator:
                 return path, cost
             
             for neighbor in self.network_graph.get(vertex, []):
-                if neighbor not in visited and tuple(sorted((vertex, neighbor))) not in self.broken_links:
+                if neighbor not in visited and _edge_key(vertex, neighbor) not in self.broken_links:
                     visited.add(neighbor)
                     queue.append((neighbor, path + [neighbor]))
         return None, float('inf')
@@ -2072,7 +2184,7 @@ class NetworkSimulator:
         current_links = set()
         for u, neighbors in self.network_graph.items():
             for v in neighbors:
-                current_links.add(tuple(sorted((u, v))))
+                current_links.add(_edge_key(u, v))
         
         topo_links = set(self.topology.links.keys())
         
@@ -2173,27 +2285,32 @@ class NetworkSimulator:
                 time.sleep(0.1)
             if not self.simulation_running: break
             
-            # Simulate Metrics
+            # Simulate Metrics (one vectorized draw per step instead of per-element calls)
+            rng = self._rng
+            links = list(self.topology.links.items())
+            n_nodes = len(self.all_nodes)
+            n_links = len(links)
             if t_type == "CBR":
                 # Stable
-                for node in self.all_nodes:
-                    self.node_queues[node] = random.uniform(0.1, 0.3)
-                for link in self.topology.links:
-                    self.link_utilization[link] = random.uniform(0.2, 0.4)
-                    # Update topology link metrics (Low Delay/Loss)
-                    self.topology.links[link].delay = 10 + random.uniform(0, 5)
-                    self.topology.links[link].loss = 0.01
+                queues = rng.uniform(0.1, 0.3, size=n_nodes)
+                utils = rng.uniform(0.2, 0.4, size=n_links)
+                # Low Delay/Loss
+                delays = 10 + rng.uniform(0, 5, size=n_links)
+                losses = np.full(n_links, 0.01)
             else:
-                # Bursty
-                for node in self.all_nodes:
-                    # Random spikes
-                    self.node_queues[node] = random.uniform(0.0, 0.9) if random.random() > 0.6 else 0.1
-                for link in self.topology.links:
-                    util = random.uniform(0.0, 1.0) if random.random() > 0.6 else 0.2
-                    self.link_utilization[link] = util
-                    # Update topology link metrics (High Delay/Loss)
-                    self.topology.links[link].delay = 10 + (util * 100)
-                    self.topology.links[link].loss = util * 0.1
+                # Bursty: random spikes over a low baseline
+                queues = np.where(rng.random(n_nodes) > 0.6, rng.uniform(0.0, 0.9, size=n_nodes), 0.1)
+                utils = np.where(rng.random(n_links) > 0.6, rng.uniform(0.0, 1.0, size=n_links), 0.2)
+                # High Delay/Loss
+                delays = 10 + utils * 100
+                losses = utils * 0.1
+
+            self.node_queues.update(zip(self.all_nodes, queues.tolist()))
+            for (link_key, link), util, delay, loss in zip(links, utils.tolist(), delays.tolist(), losses.tolist()):
+                self.link_utilization[link_key] = util
+                # Update topology link metrics
+                link.delay = delay
+                link.loss = loss
 
             # Recalculate Path (OSPF/QoS)
             # We use Dijkstra here to simulate OSPF reacting to new costs
@@ -2276,7 +2393,7 @@ class NetworkSimulator:
             "timestamp": time.time(),
             "topology": {
                 "type": self.topology_var.get(),
-                "nodes": self.all_nodes,
+                "nodes": list(self.all_nodes),
                 "links": [list(link) for link in self.topology.links.keys()]
             },
             "routing_metrics": [],
@@ -2301,9 +2418,17 @@ class NetworkSimulator:
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export JSON: {str(e)}")
 
+    def _new_pdf_page(self):
+        """Returns the shared report figure, cleared and ready for a new page."""
+        if self._pdf_fig is None:
+            self._pdf_fig = plt.Figure(figsize=(8.5, 11))
+        else:
+            self._pdf_fig.clear()
+        ax = self._pdf_fig.add_subplot(111)
+        ax.axis('off')
+        return self._pdf_fig, ax
+
     def _export_to_pdf(self, filename):
-        from matplotlib.backends.backend_pdf import PdfPages  # pyright: ignore[reportMissingModuleSource]
-        import datetime
         import networkx as nx  # type: ignore
 
         with PdfPages(filename) as pdf:
@@ -2358,12 +2483,11 @@ class NetworkSimulator:
             elif gamma > alpha and gamma > beta: qos_focus = "Loss Optimized"
 
             # --- Page 1 ---
-            fig = plt.figure(figsize=(8.5, 11))
-            plt.axis('off')
+            fig, ax = self._new_pdf_page()
             
             # Header
             y = 0.95
-            plt.text(0.5, y, "Network Simulation Report", ha='center', fontsize=16, weight='bold')
+            ax.text(0.5, y, "Network Simulation Report", ha='center', fontsize=16, weight='bold')
             y -= 0.05
             
             info_text = (
@@ -2373,69 +2497,67 @@ class NetworkSimulator:
                 f"User Mode: {user_mode}\n"
                 f"Topology Type: {topo_type}"
             )
-            plt.text(0.1, y, info_text, va='top', fontsize=10, family='monospace')
+            ax.text(0.1, y, info_text, va='top', fontsize=10, family='monospace')
             y -= 0.15
             
             # 1. Overview
-            plt.text(0.1, y, "1. Network Overview", weight='bold', fontsize=12)
+            ax.text(0.1, y, "1. Network Overview", weight='bold', fontsize=12)
             y -= 0.03
-            plt.text(0.1, y, "This report presents the results of a network simulation performed using the NetTopoGen framework.\nThe objective is to analyze routing behavior, QoS impact, and network resilience.", va='top', fontsize=10, wrap=True)
+            ax.text(0.1, y, "This report presents the results of a network simulation performed using the NetTopoGen framework.\nThe objective is to analyze routing behavior, QoS impact, and network resilience.", va='top', fontsize=10, wrap=True)
             y -= 0.08
 
             # 2. Topology
-            plt.text(0.1, y, "2. Topology Configuration", weight='bold', fontsize=12)
+            ax.text(0.1, y, "2. Topology Configuration", weight='bold', fontsize=12)
             y -= 0.03
-            plt.text(0.1, y, "2.1 Device Summary", weight='bold', fontsize=10)
+            ax.text(0.1, y, "2.1 Device Summary", weight='bold', fontsize=10)
             y -= 0.08
             
             dev_data = [[k, v] for k,v in counts.items()]
-            plt.table(cellText=dev_data, colLabels=["Device Type", "Count"], loc='top', bbox=[0.1, y, 0.8, 0.08])
+            ax.table(cellText=dev_data, colLabels=["Device Type", "Count"], loc='top', bbox=[0.1, y, 0.8, 0.08])
             y -= 0.05
             
-            plt.text(0.1, y, "2.2 Connectivity Summary", weight='bold', fontsize=10)
+            ax.text(0.1, y, "2.2 Connectivity Summary", weight='bold', fontsize=10)
             y -= 0.03
             conn_text = (
                 f"Average node degree: {avg_degree:.1f}\n"
                 f"Redundant paths available: {redundant}\n"
                 f"Single point of failure: {spof}"
             )
-            plt.text(0.1, y, conn_text, va='top', fontsize=10)
+            ax.text(0.1, y, conn_text, va='top', fontsize=10)
             y -= 0.1
             
             # 3. Link Characteristics
-            plt.text(0.1, y, "3. Link Characteristics", weight='bold', fontsize=12)
+            ax.text(0.1, y, "3. Link Characteristics", weight='bold', fontsize=12)
             y -= 0.08
             link_data = [
                 ["Delay (ms)", f"{link_stats['Delay (ms)'][0]:.1f}", f"{link_stats['Delay (ms)'][1]:.1f}", f"{link_stats['Delay (ms)'][2]:.1f}"],
                 ["Bandwidth (Mbps)", f"{link_stats['Bandwidth (Mbps)'][0]:.0f}", f"{link_stats['Bandwidth (Mbps)'][1]:.0f}", f"{link_stats['Bandwidth (Mbps)'][2]:.1f}"],
                 ["Packet Loss (%)", f"{link_stats['Packet Loss (%)'][0]:.1f}", f"{link_stats['Packet Loss (%)'][1]:.1f}", f"{link_stats['Packet Loss (%)'][2]:.2f}"]
             ]
-            plt.table(cellText=link_data, colLabels=["Metric", "Min", "Max", "Avg"], loc='top', bbox=[0.1, y, 0.8, 0.08])
+            ax.table(cellText=link_data, colLabels=["Metric", "Min", "Max", "Avg"], loc='top', bbox=[0.1, y, 0.8, 0.08])
             y -= 0.1
             
             # 4. QoS
-            plt.text(0.1, y, "4. QoS Configuration", weight='bold', fontsize=12)
+            ax.text(0.1, y, "4. QoS Configuration", weight='bold', fontsize=12)
             y -= 0.03
-            plt.text(0.1, y, "Cost = α·Delay + β·(1/Bandwidth) + γ·Loss", fontsize=10, style='italic')
+            ax.text(0.1, y, "Cost = α·Delay + β·(1/Bandwidth) + γ·Loss", fontsize=10, style='italic')
             y -= 0.08
             qos_data = [
                 ["α (Delay)", f"{alpha}"],
                 ["β (Bandwidth)", f"{beta}"],
                 ["γ (Loss)", f"{gamma}"]
             ]
-            plt.table(cellText=qos_data, colLabels=["Parameter", "Value"], loc='top', bbox=[0.1, y, 0.4, 0.08])
-            plt.text(0.6, y+0.04, f"QoS Focus: {qos_focus}", fontsize=10, weight='bold')
+            ax.table(cellText=qos_data, colLabels=["Parameter", "Value"], loc='top', bbox=[0.1, y, 0.4, 0.08])
+            ax.text(0.6, y+0.04, f"QoS Focus: {qos_focus}", fontsize=10, weight='bold')
             
             pdf.savefig(fig)
-            plt.close(fig)
 
             # --- Page 2 ---
-            fig = plt.figure(figsize=(8.5, 11))
-            plt.axis('off')
+            fig, ax = self._new_pdf_page()
             y = 0.95
             
             # 5. Routing Algo
-            plt.text(0.1, y, "5. Routing Algorithm Evaluation", weight='bold', fontsize=12)
+            ax.text(0.1, y, "5. Routing Algorithm Evaluation", weight='bold', fontsize=12)
             y -= 0.15
             
             algo_data = []
@@ -2444,13 +2566,13 @@ class NetworkSimulator:
                 algo_data.append([vals[0], vals[1], vals[2]])
                 
             if algo_data:
-                plt.table(cellText=algo_data, colLabels=["Algorithm", "Hop Count", "Total Cost"], loc='top', bbox=[0.1, y, 0.8, 0.15])
+                ax.table(cellText=algo_data, colLabels=["Algorithm", "Hop Count", "Total Cost"], loc='top', bbox=[0.1, y, 0.8, 0.15])
             else:
-                plt.text(0.1, y+0.05, "No algorithms evaluated.", fontsize=10)
+                ax.text(0.1, y+0.05, "No algorithms evaluated.", fontsize=10)
             y -= 0.1
             
             # 6. Optimal Path
-            plt.text(0.1, y, "6. Optimal Path Selection", weight='bold', fontsize=12)
+            ax.text(0.1, y, "6. Optimal Path Selection", weight='bold', fontsize=12)
             y -= 0.03
             
             opt_path_text = self.optimal_path_label.cget("text").replace("Optimal Path: ", "").replace("Selected Path ", "")
@@ -2465,11 +2587,11 @@ class NetworkSimulator:
                 f"Minimum Cost: {min_cost}\n"
                 f"Reason: Lowest composite QoS cost under current weight configuration."
             )
-            plt.text(0.1, y, opt_text, va='top', fontsize=10, wrap=True)
+            ax.text(0.1, y, opt_text, va='top', fontsize=10, wrap=True)
             y -= 0.15
             
             # 7. Traffic
-            plt.text(0.1, y, "7. Traffic Simulation Results", weight='bold', fontsize=12)
+            ax.text(0.1, y, "7. Traffic Simulation Results", weight='bold', fontsize=12)
             y -= 0.15
             
             traffic_data = []
@@ -2485,13 +2607,13 @@ class NetworkSimulator:
                     t_display.append(["Packet Loss", row[2]])
                     t_display.append(["Path Used", row[3]])
                     t_display.append(["-", "-"])
-                plt.table(cellText=t_display, colLabels=["Metric", "Value"], loc='top', bbox=[0.1, y, 0.8, 0.15])
+                ax.table(cellText=t_display, colLabels=["Metric", "Value"], loc='top', bbox=[0.1, y, 0.8, 0.15])
             else:
-                plt.text(0.1, y+0.05, "No traffic simulation run.", fontsize=10)
+                ax.text(0.1, y+0.05, "No traffic simulation run.", fontsize=10)
             y -= 0.1
             
             # 8. Fault Injection
-            plt.text(0.1, y, "8. Fault Injection Analysis", weight='bold', fontsize=12)
+            ax.text(0.1, y, "8. Fault Injection Analysis", weight='bold', fontsize=12)
             y -= 0.03
             
             faults_text = "None"
@@ -2503,14 +2625,14 @@ class NetworkSimulator:
                 else: faults_text += "\n"
                 faults_text += f"Links Broken: {', '.join(links_str)}"
                 
-            plt.text(0.1, y, f"Injected Faults: {faults_text}", va='top', fontsize=10, wrap=True)
+            ax.text(0.1, y, f"Injected Faults: {faults_text}", va='top', fontsize=10, wrap=True)
             y -= 0.05
             if faults_text != "None":
-                plt.text(0.1, y, "Observation: The routing engine recomputed paths where possible.", va='top', fontsize=10)
+                ax.text(0.1, y, "Observation: The routing engine recomputed paths where possible.", va='top', fontsize=10)
             y -= 0.1
             
             # 9. Visualization Summary
-            plt.text(0.1, y, "9. Visualization Summary", weight='bold', fontsize=12)
+            ax.text(0.1, y, "9. Visualization Summary", weight='bold', fontsize=12)
             y -= 0.03
             vis_text = (
                 "• Active routing paths highlighted using color coding\n"
@@ -2518,28 +2640,27 @@ class NetworkSimulator:
                 "• Packet flow animated hop-by-hop\n"
                 "• QoS changes reflected instantly in path selection"
             )
-            plt.text(0.1, y, vis_text, va='top', fontsize=10)
+            ax.text(0.1, y, vis_text, va='top', fontsize=10)
             y -= 0.1
             
             # 10. Key Observations
-            plt.text(0.1, y, "10. Key Observations", weight='bold', fontsize=12)
+            ax.text(0.1, y, "10. Key Observations", weight='bold', fontsize=12)
             y -= 0.03
             obs_text = (
                 "• QoS-aware routing adapts effectively to changing network conditions\n"
                 "• Fault injection demonstrates network resilience\n"
                 "• Visualization enhances understanding of routing dynamics"
             )
-            plt.text(0.1, y, obs_text, va='top', fontsize=10)
+            ax.text(0.1, y, obs_text, va='top', fontsize=10)
             y -= 0.1
             
             # 11. Conclusion
-            plt.text(0.1, y, "11. Conclusion", weight='bold', fontsize=12)
+            ax.text(0.1, y, "11. Conclusion", weight='bold', fontsize=12)
             y -= 0.03
             conc_text = "The simulation confirms that NetTopoGen effectively models realistic network behavior, supports QoS-aware routing, and enables interactive exploration of routing protocols and fault scenarios."
-            plt.text(0.1, y, conc_text, va='top', fontsize=10, wrap=True)
+            ax.text(0.1, y, conc_text, va='top', fontsize=10, wrap=True)
             
             pdf.savefig(fig)
-            plt.close(fig)
 
     def export_packet_tracer(self):
         """
@@ -2591,7 +2712,7 @@ class NetworkSimulator:
                 for u in sorted_nodes:
                     if u not in self.network_graph: continue
                     for v in sorted(self.network_graph[u]):
-                        link_key = tuple(sorted((u, v)))
+                        link_key = _edge_key(u, v)
                         if link_key in processed_links: continue
                         processed_links.add(link_key)
                         
@@ -2724,24 +2845,49 @@ class NetworkSimulator:
             self.canvas.config(cursor="")
 
     def save_state(self):
+        # Only reference the live structures here; the copy is taken by
+        # _materialize_undo_state once something actually mutates them.
         state = {
-            "coords": copy.deepcopy(self.node_coordinates),
-            "graph": copy.deepcopy(self.network_graph),
-            "broken": copy.deepcopy(self.broken_links),
-            "nodes": list(self.all_nodes)
+            "snapshot": None,
+            "refs": (self.node_coordinates, self.network_graph, self.broken_links, self.all_nodes)
         }
         self.undo_stack.append(state)
+        self._undo_pending = True
         if len(self.undo_stack) > 10: self.undo_stack.pop(0)
 
+    def _materialize_undo_state(self):
+        """Copies any pending undo entries before the live structures change."""
+        if not self._undo_pending:
+            return
+        for state in reversed(self.undo_stack):
+            if state["snapshot"] is not None:
+                break
+            coords, graph, broken, nodes = state.pop("refs")
+            # Coordinates and broken links hold immutable tuples, so only the
+            # adjacency sets need copying one level deep.
+            state["snapshot"] = {
+                "coords": coords.copy(),
+                "graph": {node: neighbors.copy() for node, neighbors in graph.items()},
+                "broken": broken.copy(),
+                "nodes": nodes.copy()
+            }
+        self._undo_pending = False
+
     def undo(self):
         if not self.undo_stack:
             self.status_label.config(text="Status: Nothing to undo", foreground="orange")
             return
-        state = self.undo_stack.pop()
+        self._materialize_undo_state()
+        state = self.undo_stack.pop()["snapshot"]
         self.node_coordinates = state["coords"]
         self.network_graph = state["graph"]
         self.broken_links = state["broken"]
         self.all_nodes = state["nodes"]
+        self._broken_by_node = defaultdict(set)
+        for link in self.broken_links:
+            self._broken_by_node[link[0]].add(link)
+            self._broken_by_node[link[1]].add(link)
+        self._rebuild_link_index()
         self.draw_topology()
         self._update_option_menus()
 
@@ -2755,11 +2901,17 @@ class NetworkSimulator:
         self._add_node(name, (x, y))
         
         # Auto-connect to nearest
-        nearest = self._get_nearest_node(name, [n for n in self.all_nodes if n != name])
+        nearest = self._get_nearest_indexed(name)
         if nearest:
             self._add_link(name, nearest)
         
-        self.draw_topology()
+        if self.visualizer:
+            # Only the new node and its link need drawing
+            self.visualizer.draw_node(self._display_node(name, (x, y)))
+            if nearest:
+                self.visualizer.draw_link(self._display_link(name, nearest), self.get_link_cost(name, nearest))
+        else:
+            self.draw_topology()
         self._update_option_menus()
 
     def enable_add_link_mode(self):
@@ -2783,15 +2935,15 @@ class NetworkSimulator:
         self.save_state()
         self._add_link(u, v)
         # Add to topology object as well to ensure consistency
-        if not self.topology.get_link(u, v):
-             self.topology.add_link(Link(u, v))
+        link = self.topology.get_link(u, v)
+        if not link:
+            link = Link(u, v)
+            self.topology.add_link(link)
         
         # Randomize metrics for new link
-        link = self.topology.get_link(u, v)
-        if link:
-            link.delay = random.uniform(1, 50)
-            link.bandwidth = 1e9
-            link.loss = 0.0
+        link.delay = random.uniform(1, 50)
+        link.bandwidth = 1e9
+        link.loss = 0.0
 
         self.draw_topology()
         self._update_option_menus()
@@ -2812,16 +2964,20 @@ class NetworkSimulator:
     def delete_node_manual(self, node):
         """Deletes a node and its connections."""
         self.save_state()
+        self._materialize_undo_state()
         # Remove from data structures
-        if node in self.all_nodes: self.all_nodes.remove(node)
+        self.all_nodes.pop(node, None)
         if node in self.node_coordinates: del self.node_coordinates[node]
+        self._coord_dirty = True
         
         # Remove from graph
         if node in self.network_graph:
             neighbors = self.network_graph[node]
             for neighbor in neighbors:
-                if neighbor in self.network_graph and node in self.network_graph[neighbor]:
-                    self.network_graph[neighbor].remove(node)
+                if neighbor in self.network_graph:
+                    self.network_graph[neighbor].pop(node, None)
+                edge = _edge_key(node, neighbor)
+                self.link_by_tag.pop(f"link_{'_'.join(edge)}", None)
             del self.network_graph[node]
             
         # Remove from topology
@@ -2829,11 +2985,11 @@ class NetworkSimulator:
             self.topology.remove_node(node)
         
         # Remove broken links referencing this node
-        to_remove = set()
-        for link in self.broken_links:
-            if node in link:
-                to_remove.add(link)
-        self.broken_links -= to_remove
+        for link in self._broken_by_node.pop(node, ()):
+            self.broken_links.discard(link)
+            peer = link[1] if link[0] == node else link[0]
+            if peer in self._broken_by_node:
+                self._broken_by_node[peer].discard(link)
         
         self.draw_topology()
         self._update_option_menus()
@@ -2842,31 +2998,40 @@ class NetworkSimulator:
     def delete_link_manual(self, u, v):
         """Deletes a link between two nodes."""
         self.save_state()
+        self._materialize_undo_state()
         # Remove from graph
-        if u in self.network_graph and v in self.network_graph[u]:
-            self.network_graph[u].remove(v)
-        if v in self.network_graph and u in self.network_graph[v]:
-            self.network_graph[v].remove(u)
+        if u in self.network_graph:
+            self.network_graph[u].pop(v, None)
+        if v in self.network_graph:
+            self.network_graph[v].pop(u, None)
             
         # Remove from topology
         self.topology.remove_link(u, v)
         
         # Remove from broken links
-        link_tuple = tuple(sorted((u, v)))
+        link_tuple = _edge_key(u, v)
+        self.link_by_tag.pop(f"link_{'_'.join(link_tuple)}", None)
         if link_tuple in self.broken_links:
             self.broken_links.remove(link_tuple)
+            self._broken_by_node[u].discard(link_tuple)
+            self._broken_by_node[v].discard(link_tuple)
             
-        self.draw_topology()
+        if self.visualizer:
+            self.visualizer.erase_link(u, v)
+        else:
+            self.draw_topology()
         self.status_label.config(text=f"Deleted link {u}-{v}", foreground="blue")
 
     def clear_topology_manual(self):
         """Clears the entire topology."""
         if messagebox.askyesno("Clear Topology", "Are you sure you want to delete all nodes and links?"):
             self.save_state()
-            self.all_nodes = []
+            self.all_nodes = {}
             self.node_coordinates = {}
             self.network_graph = {}
+            self.link_by_tag = {}
             self.broken_links = set()
+            self._broken_by_node = defaultdict(set)
             self.topology = Topology()
             self.draw_topology()
             self._update_option_menus()
@@ -2875,49 +3040,53 @@ class NetworkSimulator:
     def on_node_press(self, event):
         if not self.manual_mode.get():
             return
-        item = self.canvas.find_closest(event.x, event.y)[0]
-        tags = self.canvas.gettags(item)
-        if "device" in tags:
+        node_name = self._node_at(self.canvas.canvasx(event.x), self.canvas.canvasy(event.y))
+        if node_name is None:
+            # Not near an indexed node centre; fall back to Tk's hit test
+            item = self.canvas.find_closest(event.x, event.y)[0]
+            tags = self.canvas.gettags(item)
+            if "device" not in tags:
+                return
             # Safe extraction of node name
-            node_name = None
             for tag in tags:
                 if tag.startswith("device_"):
                     node_name = tag.replace("device_", "")
                     break
-            
-            if not node_name: return
+        
+        if not node_name: return
 
-            # Handle Delete Mode
-            if self.deleting_mode:
-                self.delete_node_manual(node_name)
-                return "break"
+        # Handle Delete Mode
+        if self.deleting_mode:
+            self.delete_node_manual(node_name)
+            return "break"
 
-            # Handle Link Addition Mode
-            if self.adding_link_mode:
-                if self.link_source_node is None:
-                    self.link_source_node = node_name
-                    self.status_label.config(text=f"Manual Mode: Source {node_name} selected. Select Destination.", foreground="orange")
+        # Handle Link Addition Mode
+        if self.adding_link_mode:
+            if self.link_source_node is None:
+                self.link_source_node = node_name
+                self.status_label.config(text=f"Manual Mode: Source {node_name} selected. Select Destination.", foreground="orange")
+            else:
+                if node_name != self.link_source_node:
+                    source = self.link_source_node
+                    self.add_link_manual(source, node_name)
+                    self.adding_link_mode = False
+                    self.link_source_node = None
+                    self.canvas.config(cursor="")
+                    self.status_label.config(text=f"Manual Mode: Link added between {source} and {node_name}.", foreground="blue")
                 else:
-                    if node_name != self.link_source_node:
-                        source = self.link_source_node
-                        self.add_link_manual(source, node_name)
-                        self.adding_link_mode = False
-                        self.link_source_node = None
-                        self.canvas.config(cursor="")
-                        self.status_label.config(text=f"Manual Mode: Link added between {source} and {node_name}.", foreground="blue")
-                    else:
-                        self.status_label.config(text="Manual Mode: Cannot link node to itself. Select different node.", foreground="red")
-                return
+                    self.status_label.config(text="Manual Mode: Cannot link node to itself. Select different node.", foreground="red")
+            return
 
-            # Normal Drag Logic
-            self.drag_data["node"] = node_name
-            self.drag_data["item"] = item
-            self.drag_data["x"] = event.x
-            self.drag_data["y"] = event.y
-            self.drag_data["total_dx"] = 0
-            self.drag_data["total_dy"] = 0
-            self.drag_data["original_coords"] = self.node_coordinates[node_name]
-            self.save_state() # Save before drag starts
+        # Normal Drag Logic
+        self.drag.node = node_name
+        self.drag.x = event.x
+        self.drag.y = event.y
+        self.drag.total_dx = 0
+        self.drag.total_dy = 0
+        self.drag.pending_dx = 0
+        self.drag.pending_dy = 0
+        self.drag.original_coords = self.node_coordinates[node_name]
+        self.save_state() # Save before drag starts
 
     def on_canvas_click(self, event):
         """Handles clicks on the canvas (mainly for selecting links)."""
@@ -2940,99 +3109,250 @@ class NetworkSimulator:
                 break
         
         if link_tag:
-            # Iterate network_graph to find matching tag (Source of truth for visuals)
-            seen_edges = set()
-            for u, neighbors in self.network_graph.items():
-                for v in neighbors:
-                    edge = tuple(sorted((u, v)))
-                    if edge in seen_edges: continue
-                    seen_edges.add(edge)
-                    
-                    expected_tag = f"link_{'_'.join(edge)}"
-                    if expected_tag == link_tag:
-                        self.delete_link_manual(edge[0], edge[1])
-                        return
+            edge = self.link_by_tag.get(link_tag)
+            if edge:
+                self.delete_link_manual(*edge)
+
+    def on_canvas_resize(self, event):
+        # The visualizer skips off-screen items; redraw once the view grows over them
+        if self.visualizer and (self.visualizer.culled_nodes or self.visualizer.culled_links):
+            self.draw_topology(**self._last_draw_args)
 
     def on_node_drag(self, event):
         if not self.manual_mode.get():
             return
-        if self.drag_data["node"]:
-            dx = event.x - self.drag_data["x"]
-            dy = event.y - self.drag_data["y"]
-
-            node = self.drag_data["node"]
-
-            # Move all canvas items for this node (icon and label share the node ID tag)
-            node_items = self.canvas.find_withtag(node)
-            for item in node_items:
-                self.canvas.move(item, dx, dy)
-
-            # Accumulate total displacement
-            self.drag_data["total_dx"] += dx
-            self.drag_data["total_dy"] += dy
-
-            # Update coordinates in real-time during drag
-            ox, oy = self.drag_data["original_coords"]
-            new_coords = (ox + self.drag_data["total_dx"], oy + self.drag_data["total_dy"])
-            self.node_coordinates[node] = new_coords
-
-            # Update topology object coordinates
-            if node in self.topology.nodes:
-                self.topology.nodes[node].coordinates = new_coords
-
-            # Update visualizer's node positions for dynamic updates
-            if self.visualizer:
-                self.visualizer.node_positions[node] = new_coords
+        if self.drag.node:
+            dx = event.x - self.drag.x
+            dy = event.y - self.drag.y
+            if not (dx or dy):
+                return
+            self._materialize_undo_state() # First real motion commits the undo entry
+
+            # Accumulate displacement; the canvas catches up once per idle cycle
+            self.drag.total_dx += dx
+            self.drag.total_dy += dy
+            self.drag.pending_dx += dx
+            self.drag.pending_dy += dy
+            self.drag.x = event.x
+            self.drag.y = event.y
+
+            if not self._drag_pending:
+                self._drag_pending = True
+                self.root.after_idle(self._flush_drag)
+
+    def _flush_drag(self):
+        """Applies the motion accumulated since the last flush to the canvas and models."""
+        if not self._drag_pending:
+            return
+        self._drag_pending = False
+        node = self.drag.node
+        if not node:
+            return
 
-            # Update connected links and their labels in real-time with smooth animation
-            self._update_connected_links(node)
+        dx = self.drag.pending_dx
+        dy = self.drag.pending_dy
+        self.drag.pending_dx = 0
+        self.drag.pending_dy = 0
+
+        # Canvas commands for this frame are collected and sent to Tcl in one eval
+        # rather than one Python->Tcl round trip per item
+        canvas = str(self.canvas)
+        cmds = [f"{canvas} move {item} {dx} {dy}" for item in self.node_items.get(node, ())]
+
+        # Update coordinates in real-time during drag
+        ox, oy = self.drag.original_coords
+        new_coords = (ox + self.drag.total_dx, oy + self.drag.total_dy)
+        self.node_coordinates[node] = new_coords
+        if node in self._coord_idx:
+            self._coord_arr[self._coord_idx[node]] = new_coords
+            self._coord_trees_dirty = True
+
+        # Update topology object coordinates
+        if node in self.topology.nodes:
+            self.topology.nodes[node].coordinates = new_coords
 
-            self.drag_data["x"] = event.x
-            self.drag_data["y"] = event.y
+        # Update connected links and their labels in real-time with smooth animation
+        self._update_connected_links(node, cmds)
+        if cmds:
+            self.canvas.tk.eval("\n".join(cmds))
 
     def on_node_release(self, event):
-        if self.drag_data["node"]:
-            node = self.drag_data["node"]
-            ox, oy = self.drag_data["original_coords"]
-            self.node_coordinates[node] = (ox + self.drag_data["total_dx"], oy + self.drag_data["total_dy"])
-        self.drag_data["node"] = None
+        if self.drag.node:
+            node = self.drag.node
+            if self.drag.total_dx or self.drag.total_dy:
+                self._flush_drag() # Apply any motion still waiting for idle
+                ox, oy = self.drag.original_coords
+                self.node_coordinates[node] = (ox + self.drag.total_dx, oy + self.drag.total_dy)
+                if not self._coord_index_stale():
+                    self._spatial_move(node, (ox, oy), self.node_coordinates[node])
+                # The visualizer only needs the final position (e.g. for packet animation)
+                if self.visualizer:
+                    self.visualizer.node_positions[node] = self.node_coordinates[node]
+            elif self._undo_pending:
+                # Click without a drag changed nothing, so drop its undo entry
+                self.undo_stack.pop()
+                self._undo_pending = any(state["snapshot"] is None for state in self.undo_stack)
+        self.drag.node = None
+
+    def _index_coordinates(self):
+        """Packs node_coordinates into an (N, 2) array with a name -> row index."""
+        self._coord_names = list(self.node_coordinates)
+        self._coord_idx = {name: i for i, name in enumerate(self._coord_names)}
+        self._coord_buf = self._coord_arr = np.array(list(self.node_coordinates.values()),
+                                                     dtype=np.float64).reshape(-1, 2)
+        self._coord_trees_dirty = True
+        self._spatial = defaultdict(list)
+        for name, (x, y) in zip(self._coord_names, self._coord_arr.tolist()):
+            self._spatial[(int(x // _SPATIAL_CELL), int(y // _SPATIAL_CELL))].append(name)
+        self._coord_src = self.node_coordinates
+        self._coord_dirty = False
+
+    def _append_coord(self, coords):
+        """Appends a row to the packed coordinate array, doubling its buffer when full."""
+        n = len(self._coord_arr)
+        if n == len(self._coord_buf):
+            buf = np.empty((max(2 * n, 16), 2), dtype=np.float64)
+            buf[:n] = self._coord_arr
+            self._coord_buf = buf
+        self._coord_buf[n] = coords
+        self._coord_arr = self._coord_buf[:n + 1]
+
+    def _spatial_move(self, name, old, new):
+        """Moves a node between spatial-hash cells."""
+        old_cell = (int(old[0] // _SPATIAL_CELL), int(old[1] // _SPATIAL_CELL))
+        new_cell = (int(new[0] // _SPATIAL_CELL), int(new[1] // _SPATIAL_CELL))
+        if old_cell != new_cell and name in self._spatial.get(old_cell, ()):
+            self._spatial[old_cell].remove(name)
+            self._spatial[new_cell].append(name)
+
+    def _node_at(self, x, y):
+        """Node whose centre is nearest to (x, y) within one cell, or None."""
+        if self._coord_index_stale():
+            self._index_coordinates()
+        cx, cy = int(x // _SPATIAL_CELL), int(y // _SPATIAL_CELL)
+        best, best_d2 = None, _SPATIAL_CELL ** 2
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                for name in self._spatial.get((gx, gy), ()):
+                    px, py = self.node_coordinates[name]
+                    d2 = (px - x) ** 2 + (py - y) ** 2
+                    if d2 <= best_d2:
+                        best, best_d2 = name, d2
+        return best
+
+    def _coord_index_stale(self):
+        # Paths that rebind node_coordinates or add nodes behind _add_node's back
+        # change the dict's identity or size; in-place moves set _coord_dirty.
+        return (self._coord_dirty or self._coord_src is not self.node_coordinates
+                or len(self._coord_names) != len(self.node_coordinates))
+
+    def _get_nearest_indexed(self, node):
+        """Nearest other node to the given one, from the packed coordinate array."""
+        if self._coord_index_stale():
+            self._index_coordinates()
+        row = self._coord_idx.get(node)
+        if row is None or len(self._coord_names) < 2:
+            return None
+        point = self._coord_arr[row]
+        if cKDTree is None:
+            d2 = ((self._coord_arr - point) ** 2).sum(axis=1)
+            d2[row] = np.inf
+            return self._coord_names[int(np.argmin(d2))]
+
+        # Rows not yet in a tree are scanned; each tree gives its nearest
+        # point other than the queried row
+        covered = self._update_coord_trees()
+        d2 = ((self._coord_arr[covered:] - point) ** 2).sum(axis=1)
+        if row >= covered:
+            d2[row - covered] = np.inf
+        best, best_d2 = None, np.inf
+        if len(d2):
+            best = covered + int(np.argmin(d2))
+            best_d2 = d2[best - covered]
+        for start, stop, tree in self._coord_trees:
+            if start <= row < stop:
+                if stop - start < 2:
+                    continue
+                (distance, other), (index, second) = tree.query(point, k=2)
+                if start + index == row:
+                    distance, index = other, second
+            else:
+                distance, index = tree.query(point)
+            if distance * distance < best_d2:
+                best, best_d2 = start + int(index), distance * distance
+        return self._coord_names[best] if best is not None else None
 
-    def _update_connected_links(self, node):
+    def _update_coord_trees(self):
+        """
+        Brings the KD-trees up to date with the packed coordinate array.
+        Full blocks of appended rows get a tree of their own, and equal-sized
+        trees are merged like a binary counter, so there are O(log N) trees
+        and each row is rebuilt into a tree O(log N) times. A dirty index
+        (e.g. after a move) is rebuilt as one tree. Returns the number of
+        leading rows covered by trees; the rest are left to a direct scan.
+        """
+        arr = self._coord_arr
+        n = len(arr)
+        if self._coord_trees_dirty:
+            covered = n - n % _KDTREE_BLOCK
+            self._coord_trees = [(0, covered, cKDTree(arr[:covered]))] if covered else []
+            self._coord_trees_dirty = False
+        trees = self._coord_trees
+        covered = trees[-1][1] if trees else 0
+        while n - covered >= _KDTREE_BLOCK:
+            start, stop = covered, covered + _KDTREE_BLOCK
+            while trees and trees[-1][1] - trees[-1][0] == stop - start:
+                start = trees.pop()[0]
+            trees.append((start, stop, cKDTree(arr[start:stop])))
+            covered = stop
+        return covered
+
+    def _update_connected_links(self, node, cmds=None):
         """
         Update positions of all links connected to the given node directly during drag.
+        Only the dragged node moves, so neighbour positions come from the array
+        packed at drag start and endpoints/midpoints are computed in one pass.
+        Canvas commands are appended to cmds when given (the caller evals them),
+        otherwise they are evaluated here as one script.
         """
-        if node not in self.network_graph:
+        if node not in self.network_graph or node not in self.node_coordinates:
             return
 
         # Get connected nodes
-        connected_nodes = self.network_graph[node]
+        neighbors = [n for n in self.network_graph[node] if n in self._coord_idx]
+        if not neighbors:
+            return
 
-        for connected_node in connected_nodes:
-            if connected_node not in self.node_coordinates:
-                continue
+        flush = cmds is None
+        if flush:
+            cmds = []
+        canvas = str(self.canvas)
 
-            # Get updated positions
-            pos_a = self.node_coordinates[node]
-            pos_b = self.node_coordinates[connected_node]
+        idx = np.fromiter((self._coord_idx[n] for n in neighbors), dtype=np.intp, count=len(neighbors))
+        pos_a = self.node_coordinates[node]
+        ends = self._coord_arr[idx]
+        mids = (ends + np.asarray(pos_a, dtype=np.float64)) * 0.5
 
+        for connected_node, pos_b, mid in zip(neighbors, ends.tolist(), mids.tolist()):
             # Create link key (sorted tuple of node names)
-            link_key = tuple(sorted((node, connected_node)))
+            link_key = _edge_key(node, connected_node)
+            segment = f"{pos_a[0]} {pos_a[1]} {pos_b[0]} {pos_b[1]}"
 
-            # Construct tags used by NetworkVisualizer
-            link_tag = f"link_{'_'.join(link_key)}"
-            label_tag = f"link_label_{'_'.join(link_key)}"
-
-            # Update link line position directly
-            link_items = self.canvas.find_withtag(link_tag)
-            if link_items:
-                self.canvas.coords(link_items[0], pos_a[0], pos_a[1], pos_b[0], pos_b[1])
+            # Update link line (and optimal-path glow) position directly
+            line_item = self.link_item.get(link_key)
+            if line_item:
+                cmds.append(f"{canvas} coords {line_item} {segment}")
+            glow_item = self.link_glow_item.get(link_key)
+            if glow_item:
+                cmds.append(f"{canvas} coords {glow_item} {segment}")
 
             # Update link label position
-            label_items = self.canvas.find_withtag(label_tag)
-            if label_items:
-                mid_x = (pos_a[0] + pos_b[0]) / 2
-                mid_y = (pos_a[1] + pos_b[1]) / 2
-                self.canvas.coords(label_items[0], mid_x, mid_y)
+            label_item = self.link_label_item.get(link_key)
+            if label_item:
+                cmds.append(f"{canvas} coords {label_item} {mid[0]} {mid[1]}")
+
+        if flush and cmds:
+            self.canvas.tk.eval("\n".join(cmds))
 
 # --- Main code to run the application ---
 if __name__ == "__main__":
@@ -23,8 +23,13 @@ class AdvancedNetworkUI:
         self.root.geometry("1400x900")
         self.root.configure(bg=COLORS["bg_dark"])
 
+        self._link_styles = {}  # link line item -> (color, glow width)
+        self._glow_item = None    # Glow of the currently hovered link
+
         self.setup_styles()
         self.setup_layout()
+        self.canvas.tag_bind("smart_link", "<Enter>", self._show_link_glow)
+        self.canvas.tag_bind("smart_link", "<Leave>", self._hide_link_glow)
         self.draw_workspace_grid()
         self.render_sample_topology()
         self.create_floating_property_card()
@@ -163,10 +168,16 @@ class AdvancedNetworkUI:
         self.metrics_labels["Throughput"].config(text="1.2 Gbps")
         self.metrics_labels["Active Path Cost"].config(text="10")
 
-    def draw_workspace_grid(self):
-        for i in range(0, 2000, 50):
-            self.canvas.create_line(i, 0, i, 2000, fill=COLORS["grid"], width=1)
-            self.canvas.create_line(0, i, 2000, i, fill=COLORS["grid"], width=1)
+    def draw_workspace_grid(self, size=2000, step=50):
+        # One tiled image instead of a canvas line per grid row/column, so
+        # hit-testing and redraws don't walk dozens of background items.
+        # Pixels never written stay transparent, letting the canvas bg show.
+        tile = tk.PhotoImage(width=step, height=step)
+        tile.put(COLORS["grid"], to=(0, 0, step, 1))
+        tile.put(COLORS["grid"], to=(0, 0, 1, step))
+        self._grid_img = tk.PhotoImage(width=size, height=size)
+        self._grid_img.tk.call(self._grid_img, "copy", tile, "-to", 0, 0, size, size)
+        self.canvas.create_image(0, 0, anchor="nw", image=self._grid_img)
 
     def render_sample_topology(self):
         # Draw Links first (so they stay behind nodes)
@@ -207,10 +218,23 @@ class AdvancedNetworkUI:
             
         width = 2 + (bandwidth / 500) # Thickness based on bandwidth
         
-        # Glow Effect (Shadow line)
-        self.canvas.create_line(x1, y1, x2, y2, fill=color, width=width+2, stipple="gray50")
-        # Main Line
-        self.canvas.create_line(x1, y1, x2, y2, fill=color, width=width, dash=dash)
+        # Main Line; its glow (shadow line) is only drawn while hovered
+        line = self.canvas.create_line(x1, y1, x2, y2, fill=color, width=width, dash=dash, tags=("smart_link",))
+        self._link_styles[line] = (color, width + 2)
+
+    def _show_link_glow(self, event):
+        self._hide_link_glow()
+        line = self.canvas.find_withtag("current")
+        if not line or line[0] not in self._link_styles:
+            return
+        color, glow_width = self._link_styles[line[0]]
+        self._glow_item = self.canvas.create_line(*self.canvas.coords(line[0]), fill=color, width=glow_width, stipple="gray50")
+        self.canvas.tag_lower(self._glow_item, line[0])
+
+    def _hide_link_glow(self, event=None):
+        if self._glow_item is not None:
+            self.canvas.delete(self._glow_item)
+            self._glow_item = None
 
     def create_floating_property_card(self):
         """Creates the floating dark-mode card seen in your reference image."""
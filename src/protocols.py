@@ -4,18 +4,111 @@ Protocols Module
 This module implements routing protocols like RIP and OSPF.
 """
 
+import os
 import time
 import heapq
-from typing import Dict, List, Tuple, Optional, Any, Set
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, NamedTuple, Tuple, Optional, Any, Set
+import numpy as np  # pyright: ignore[reportMissingModuleSource]
 from src.core import Topology
+
+# Optional compiled SPF; without SciPy the pure-Python radix heap is used
+try:
+    from scipy.sparse import csr_matrix  # pyright: ignore[reportMissingModuleSource]
+    from scipy.sparse.csgraph import dijkstra as csgraph_dijkstra  # pyright: ignore[reportMissingModuleSource]
+except ImportError:
+    csr_matrix = None
+    csgraph_dijkstra = None
 from src.config import RIP_UPDATE_INTERVAL, RIP_TIMEOUT, RIP_GARBAGE_COLLECTION, OSPF_UPDATE_INTERVAL, INITIAL_CONVERGENCE_TIME
 
+# Clock for timers and route ages. Monotonic, so wall-clock adjustments can't
+# expire routes early or produce negative intervals. LSA timestamps and
+# receive times stay wall-clock time since they record when an
+# advertisement was originated or seen.
+_now = time.monotonic
+
+# OSPF costs are integers (reference bandwidth 10^8 bps, floored, minimum 1),
+# so SPF distances are ints and can use a radix heap. Standard Ethernet
+# rates are looked up directly.
+_OSPF_REFERENCE_BANDWIDTH = 100_000_000
+_OSPF_COSTS = {10e6: 10, 100e6: 1, 1e9: 1, 10e9: 1}
+_UNREACHABLE = 1 << 62  # Distance sentinel for unreached nodes
+
+# Below this many nodes, building the CSR matrix costs more than the
+# compiled Dijkstra saves
+_COMPILED_SPF_MIN_NODES = 256
+
+# Routers x graph nodes in one SPF round before a process pool pays off
+_PARALLEL_SPF_MIN_WORK = 1_000_000
+
+# Process-wide router ID interning: each ID string gets a small int for the
+# lifetime of the process, so LSAs carry ints instead of strings. SPF graphs
+# map these to their own dense numbering (see _SPFGraph), so array sizes
+# follow the network rather than every ID the process has seen.
+_ID_POOL: Dict[str, int] = {}
+_ID_REV: List[str] = []
+
+
+def intern_id(router_id: str) -> int:
+    """
+    Get the process-wide integer ID of a router.
+
+    Args:
+        router_id: Router identifier
+
+    Returns:
+        Integer ID (index into _ID_REV)
+    """
+    rid = _ID_POOL.get(router_id)
+    if rid is None:
+        rid = _ID_POOL[router_id] = len(_ID_REV)
+        _ID_REV.append(router_id)
+    return rid
+
+
+class LSA(NamedTuple):
+    """
+    OSPF Link State Advertisement.
+
+    Immutable, so every router that learns an advertisement stores the
+    same object; timestamp is when it was originated, and each router keeps
+    its own receive times alongside its LSDB. Links are stored as parallel
+    sequences (all point-to-point): neighbors[i], an interned router ID
+    (see intern_id), is reached at costs[i].
+    """
+    router_id: str
+    neighbors: array
+    costs: array
+    sequence_number: int
+    timestamp: float
+
+
+class _SPFGraph(NamedTuple):
+    """
+    Directed cost graph of an LSDB, numbered densely for SPF.
+
+    adj[i] holds (local index, cost) pairs for node i, names[i] is its
+    router ID and index maps interned router IDs to local indices. Shared
+    by routers with the same LSDB, so never mutated in place.
+    """
+    adj: List[List[Tuple[int, int]]]
+    names: List[str]
+    index: Dict[int, int]
+
 
 class RIPRouter:
     """
     RIP (Routing Information Protocol) router implementation.
     """
 
+    __slots__ = ("router_id", "_rid", "topology", "_cached_links", "_cached_version",
+                 "routing_table", "_routing_table_view", "_expiry_heap",
+                 "neighbors", "_updates_cache", "_updates_dirty", "update_interval", "timeout",
+                 "garbage_collection", "last_update", "last_full_update")
+
     def __init__(self, router_id: str, topology: Topology):
         """
         Initialize RIP router.
@@ -25,49 +118,142 @@ class RIPRouter:
             topology: Network topology
         """
         self.router_id = router_id
+        self._rid = intern_id(router_id)
         self.topology = topology
+        self._cached_links: List[Tuple[str, Any]] = []
+        self._cached_version = -1
 
         # RIP routing table: destination -> (next_hop, cost, timestamp)
         self.routing_table: Dict[str, Tuple[str, int, float]] = {}
+        self._routing_table_view = MappingProxyType(self.routing_table)
+
+        # Min-heap of (garbage-collection deadline, destination)
+        self._expiry_heap: List[Tuple[float, str]] = []
 
         # Neighbor information
         self.neighbors: Set[str] = set()
 
+        # Per-neighbor advertisements, rebuilt only after the table changes
+        self._updates_cache: Optional[Dict[str, Dict[str, int]]] = None
+        self._updates_dirty = True
+
         # Protocol parameters
         self.update_interval = RIP_UPDATE_INTERVAL
         self.timeout = RIP_TIMEOUT
         self.garbage_collection = RIP_GARBAGE_COLLECTION
 
         # Timestamps
-        self.last_update = time.time()
-        self.last_full_update = 0
+        self.last_update = _now()
+        self.last_full_update = float('-inf')  # Never sent, so the first update is due at once
 
         # Initialize routing table
         self._initialize_routing_table()
 
+    def _topology_links(self) -> List[Tuple[str, Any]]:
+        """
+        Get this router's (neighbor ID, link) pairs from the topology.
+
+        Cached against the topology's version, so repeated initialization
+        doesn't re-walk adjacency until the topology actually changes.
+
+        Returns:
+            List of (neighbor ID, Link) for neighbors joined by a link
+        """
+        version = self.topology._version
+        if self._cached_version != version:
+            router_id, topology = self.router_id, self.topology
+            self._cached_links = [(neighbor_id, link)
+                                  for neighbor_id in topology.get_neighbor_ids(router_id)
+                                  for link in (topology.get_link(router_id, neighbor_id),)
+                                  if link]
+            self._cached_version = version
+        return self._cached_links
+
     def _initialize_routing_table(self):
         """Initialize routing table with directly connected networks."""
+        now = _now()
+
         # Add directly connected neighbors
-        for neighbor in self.topology.get_neighbors(self.router_id):
-            link = self.topology.get_link(self.router_id, neighbor)
-            if link:
-                # RIP cost is typically 1 for each hop
-                cost = 1
-                self.routing_table[neighbor.node_id] = (neighbor.node_id, cost, time.time())
-                self.neighbors.add(neighbor.node_id)
+        for neighbor_id, _ in self._topology_links():
+            # RIP cost is typically 1 for each hop
+            cost = 1
+            self._install_route(neighbor_id, neighbor_id, cost, now)
+            self.neighbors.add(neighbor_id)
 
         # Add self with cost 0
-        self.routing_table[self.router_id] = (self.router_id, 0, time.time())
+        self._install_route(self.router_id, self.router_id, 0, now)
+        self._updates_dirty = True
+
+    def _install_route(self, destination: str, next_hop: str, cost: int, timestamp: float):
+        """
+        Install a route and schedule its garbage collection.
+
+        Args:
+            destination: Destination node
+            next_hop: Next hop node
+            cost: Route cost
+            timestamp: Time the route was learned
+        """
+        self.routing_table[destination] = (next_hop, cost, timestamp)
+        heapq.heappush(self._expiry_heap, (timestamp + self.garbage_collection, destination))
 
-    def update_routing_table(self, neighbor_updates: Dict[str, Dict[str, int]]):
+    def _expire_routes(self, now: float) -> bool:
+        """
+        Remove routes whose garbage-collection deadline has passed.
+
+        Only heap entries that are due get looked at. Entries for routes
+        that were refreshed or removed since are stale and just dropped.
+
+        Args:
+            now: Current time
+
+        Returns:
+            True if any route was removed
+        """
+        heap = self._expiry_heap
+        removed = False
+        while heap and heap[0][0] < now:
+            deadline, dest = heapq.heappop(heap)
+            entry = self.routing_table.get(dest)
+            if entry is not None and entry[2] + self.garbage_collection == deadline:
+                del self.routing_table[dest]
+                removed = True
+        return removed
+
+    def update_routing_table(self, neighbor_updates: Dict[str, Dict[str, int]], batch_limit: int = 128):
         """
         Update routing table based on neighbor advertisements.
 
         Args:
             neighbor_updates: Updates from neighbors (neighbor -> {dest: cost})
+            batch_limit: Advertised routes to process per batch
+
+        Returns:
+            True if routing table was updated
         """
-        current_time = time.time()
         updated = False
+        for batch_updated in self.iter_update_batches(neighbor_updates, batch_limit):
+            updated = updated or batch_updated
+        return updated
+
+    def iter_update_batches(self, neighbor_updates: Dict[str, Dict[str, int]], batch_limit: int = 128):
+        """
+        Apply neighbor advertisements in batches, yielding between them.
+
+        Lets a caller interleave other work (link events, timers) with a
+        large update instead of stalling until all of it is applied.
+
+        Args:
+            neighbor_updates: Updates from neighbors (neighbor -> {dest: cost})
+            batch_limit: Advertised routes to process per batch
+
+        Yields:
+            True if the batch just applied changed the routing table
+        """
+        current_time = _now()
+        routing_table = self.routing_table
+        updated = False
+        processed = 0
 
         for neighbor, routes in neighbor_updates.items():
             if neighbor not in self.neighbors:
@@ -86,27 +272,33 @@ class RIPRouter:
                     new_cost = 16
 
                 # Update if better route found or existing route timed out
-                if (destination not in self.routing_table or
-                    new_cost < self.routing_table[destination][1] or
-                    current_time - self.routing_table[destination][2] > self.timeout):
+                entry = routing_table.get(destination)
+                if (entry is None or
+                    new_cost < entry[1] or
+                    current_time - entry[2] > self.timeout):
 
                     if new_cost < 16:  # Don't install infinite routes
-                        self.routing_table[destination] = (neighbor, new_cost, current_time)
+                        self._install_route(destination, neighbor, new_cost, current_time)
                         updated = True
 
+                processed += 1
+                if processed == batch_limit:
+                    yield self._finish_batch(updated, current_time)
+                    processed = 0
+                    updated = False
+
         # Clean up expired routes
-        expired_routes = []
-        for dest, (_, _, timestamp) in self.routing_table.items():
-            if current_time - timestamp > self.garbage_collection:
-                expired_routes.append(dest)
+        if self._expire_routes(current_time):
+            updated = True
 
-        for dest in expired_routes:
-            if dest in self.routing_table:
-                del self.routing_table[dest]
-                updated = True
+        yield self._finish_batch(updated, current_time)
 
+    def _finish_batch(self, updated: bool, current_time: float) -> bool:
+        """Record a batch's changes; returns whether it updated the table."""
         if updated:
             self.last_update = current_time
+            self._updates_dirty = True
+        return updated
 
     def get_routing_updates(self) -> Dict[str, Dict[str, int]]:
         """
@@ -115,20 +307,25 @@ class RIPRouter:
         Returns:
             Updates for each neighbor (neighbor -> {dest: cost})
         """
+        if not self._updates_dirty and self._updates_cache is not None:
+            return self._updates_cache
+
+        # One pass over the table: advertised costs plus, per next hop, the
+        # destinations to poison when advertising back to it
+        base = {}
+        poisoned: Dict[str, Dict[str, int]] = {}
+        for dest, (next_hop, cost, _) in self.routing_table.items():
+            base[dest] = cost
+            poisoned.setdefault(next_hop, {})[dest] = 16  # Poisoned reverse
+
+        # Split horizon with poisoned reverse
         updates = {}
-
         for neighbor in self.neighbors:
-            neighbor_update = {}
-
-            for dest, (next_hop, cost, _) in self.routing_table.items():
-                # Split horizon with poisoned reverse
-                if next_hop == neighbor:
-                    neighbor_update[dest] = 16  # Poisoned reverse
-                else:
-                    neighbor_update[dest] = cost
-
-            updates[neighbor] = neighbor_update
+            reverse = poisoned.get(neighbor)
+            updates[neighbor] = {**base, **reverse} if reverse else dict(base)
 
+        self._updates_cache = updates
+        self._updates_dirty = False
         return updates
 
     def get_route(self, destination: str) -> Optional[Tuple[str, int]]:
@@ -145,15 +342,24 @@ class RIPRouter:
             next_hop, cost, timestamp = self.routing_table[destination]
 
             # Check if route is still valid
-            if time.time() - timestamp <= self.timeout:
+            if _now() - timestamp <= self.timeout:
                 return (next_hop, cost)
 
         return None
 
-    def get_routing_table(self) -> Dict[str, Tuple[str, int, float]]:
+    def get_routing_table(self) -> Mapping[str, Tuple[str, int, float]]:
         """
         Get current routing table.
 
+        Returns:
+            Read-only live view of the routing table
+        """
+        return self._routing_table_view
+
+    def snapshot(self) -> Dict[str, Tuple[str, int, float]]:
+        """
+        Get a copy of the routing table that later updates won't change.
+
         Returns:
             Routing table dictionary
         """
@@ -166,11 +372,11 @@ class RIPRouter:
         Returns:
             True if update should be sent
         """
-        return time.time() - self.last_full_update >= self.update_interval
+        return _now() - self.last_full_update >= self.update_interval
 
     def mark_update_sent(self):
         """Mark that a full update has been sent."""
-        self.last_full_update = time.time()
+        self.last_full_update = _now()
 
     def add_neighbor(self, neighbor_id: str):
         """
@@ -180,6 +386,7 @@ class RIPRouter:
             neighbor_id: Neighbor router ID
         """
         self.neighbors.add(neighbor_id)
+        self._updates_dirty = True
 
     def remove_neighbor(self, neighbor_id: str):
         """
@@ -191,14 +398,14 @@ class RIPRouter:
         if neighbor_id in self.neighbors:
             self.neighbors.remove(neighbor_id)
 
-            # Remove routes that used this neighbor as next hop
-            routes_to_remove = []
-            for dest, (next_hop, _, _) in self.routing_table.items():
-                if next_hop == neighbor_id:
-                    routes_to_remove.append(dest)
+            # Remove routes that used this neighbor as next hop. Deleted in
+            # place rather than rebuilt, so views from get_routing_table stay
+            # live; the delete loop only touches the affected routes.
+            routing_table = self.routing_table
+            for dest in [dest for dest, route in routing_table.items() if route[0] == neighbor_id]:
+                del routing_table[dest]
 
-            for dest in routes_to_remove:
-                del self.routing_table[dest]
+            self._updates_dirty = True
 
 
 class OSPFRouter:
@@ -206,6 +413,14 @@ class OSPFRouter:
     OSPF (Open Shortest Path First) router implementation.
     """
 
+    __slots__ = ("router_id", "_rid", "topology", "_cached_links", "_cached_version",
+                 "routing_table", "lsdb", "neighbors",
+                 "_routing_table_view", "_lsdb_view", "_neighbors_view",
+                 "update_interval", "initial_convergence_time", "last_update", "convergence_time",
+                 "_lsdb_dirty", "_spf_signature", "_spf_graph",
+                 "_spf_dist", "_spf_prev", "_spf_hop", "_spf_changed", "_spf_full", "_pending_flood",
+                 "_lsa_rx_time")
+
     def __init__(self, router_id: str, topology: Topology):
         """
         Initialize OSPF router.
@@ -215,56 +430,94 @@ class OSPFRouter:
             topology: Network topology
         """
         self.router_id = router_id
+        self._rid = intern_id(router_id)
         self.topology = topology
+        self._cached_links: List[Tuple[str, Any]] = []
+        self._cached_version = -1
 
-        # OSPF routing table: destination -> (next_hop, cost, path)
-        self.routing_table: Dict[str, Tuple[str, float, List[str]]] = {}
+        # OSPF routing table: destination -> (next_hop, cost); paths are
+        # rebuilt on demand from the last SPF (see get_path)
+        self.routing_table: Dict[str, Tuple[str, int]] = {}
 
-        # Link State Database (LSDB)
-        self.lsdb: Dict[str, Dict[str, Any]] = {}
+        # Link State Database (LSDB), and when each LSA was received
+        self.lsdb: Dict[str, LSA] = {}
+        self._lsa_rx_time: Dict[str, float] = {}
 
         # Neighbor information
         self.neighbors: Dict[str, Dict[str, Any]] = {}
 
+        # Read-only views handed out by the getters instead of copies
+        self._routing_table_view = MappingProxyType(self.routing_table)
+        self._lsdb_view = MappingProxyType(self.lsdb)
+        self._neighbors_view = MappingProxyType(self.neighbors)
+
         # Protocol parameters
         self.update_interval = OSPF_UPDATE_INTERVAL
         self.initial_convergence_time = INITIAL_CONVERGENCE_TIME
 
         # Timestamps
-        self.last_update = time.time()
+        self.last_update = _now()
         self.convergence_time = 0
 
+        # SPF cache: skip recomputation until the LSDB changes
+        self._lsdb_dirty = True
+        self._spf_signature: Optional[FrozenSet[Tuple[str, int]]] = None
+
+        # Last SPF state, kept so LSAs that only add links or lower costs can
+        # be applied incrementally instead of rerunning SPF from scratch
+        self._spf_graph: Optional[_SPFGraph] = None
+        self._spf_dist: Optional[array] = None
+        self._spf_prev: Optional[array] = None
+        self._spf_hop: Optional[array] = None
+        self._spf_changed: Dict[str, None] = {}
+        self._spf_full = True
+
         # Initialize
         self._initialize_ospf()
 
+        # Router IDs whose LSAs were learned but not yet flooded onwards
+        # (a dict used as an insertion-ordered set)
+        self._pending_flood: Dict[str, None] = {router_id: None}
+
+    def _topology_links(self) -> List[Tuple[str, Any]]:
+        """
+        Get this router's (neighbor ID, link) pairs from the topology.
+
+        Cached against the topology's version, so repeated initialization
+        doesn't re-walk adjacency until the topology actually changes.
+
+        Returns:
+            List of (neighbor ID, Link) for neighbors joined by a link
+        """
+        version = self.topology._version
+        if self._cached_version != version:
+            router_id, topology = self.router_id, self.topology
+            self._cached_links = [(neighbor_id, link)
+                                  for neighbor_id in topology.get_neighbor_ids(router_id)
+                                  for link in (topology.get_link(router_id, neighbor_id),)
+                                  if link]
+            self._cached_version = version
+        return self._cached_links
+
     def _initialize_ospf(self):
         """Initialize OSPF structures."""
-        # Add self to LSDB
-        self.lsdb[self.router_id] = {
-            "router_id": self.router_id,
-            "links": [],
-            "sequence_number": 1,
-            "timestamp": time.time()
-        }
-
-        # Add directly connected links
-        for neighbor in self.topology.get_neighbors(self.router_id):
-            link = self.topology.get_link(self.router_id, neighbor)
-            if link:
-                self.lsdb[self.router_id]["links"].append({
-                    "neighbor": neighbor.node_id,
-                    "cost": self._calculate_link_cost(link),
-                    "type": "p2p"  # Point-to-point
-                })
-
-        # Initialize neighbors
-        for neighbor in self.topology.get_neighbors(self.router_id):
-            self.neighbors[neighbor.node_id] = {
+        # Add directly connected links and initialize neighbors in one pass
+        link_neighbors = array('i')
+        link_costs = array('i')
+        now = _now()
+        for neighbor_id, link in self._topology_links():
+            link_neighbors.append(intern_id(neighbor_id))
+            link_costs.append(self._calculate_link_cost(link))
+
+            self.neighbors[neighbor_id] = {
                 "state": "init",
-                "last_seen": time.time()
+                "last_seen": now
             }
 
-    def _calculate_link_cost(self, link) -> float:
+        # Add self to LSDB
+        self.lsdb[self.router_id] = LSA(self.router_id, link_neighbors, link_costs, 1, time.time())
+
+    def _calculate_link_cost(self, link) -> int:
         """
         Calculate OSPF link cost.
 
@@ -276,8 +529,12 @@ class OSPFRouter:
         """
         # OSPF cost is typically based on bandwidth
         # Cost = 10^8 / bandwidth (in bps)
-        if link.bandwidth > 0:
-            return 100000000 / link.bandwidth
+        bandwidth = link.bandwidth
+        cost = _OSPF_COSTS.get(bandwidth)
+        if cost is not None:
+            return cost
+        if bandwidth > 0:
+            return max(1, int(_OSPF_REFERENCE_BANDWIDTH // bandwidth))
         else:
             return 1000  # Default high cost
 
@@ -288,123 +545,324 @@ class OSPFRouter:
         Returns:
             True if routing table was updated
         """
-        start_time = time.time()
+        if not self._begin_spf():
+            return False
 
-        # Build graph from LSDB
-        graph = self._build_topology_graph()
+        start_time = time.perf_counter()
+        if self._needs_full_spf():
+            # Build integer-indexed graph from LSDB and run Dijkstra from self
+            graph = self._build_topology_graph()
+            settled = self._adopt_spf(graph, *self._dijkstra(graph.adj, graph.index[self._rid]))
+        else:
+            settled = self._incremental_spf(list(self._spf_changed))
 
-        # Run Dijkstra from self
-        distances, previous = self._dijkstra(graph, self.router_id)
+        return self._finish_spf(settled, start_time)
 
-        # Update routing table
-        updated = False
-        for dest, distance in distances.items():
-            if dest != self.router_id and distance < float('inf'):
-                # Find next hop
-                next_hop = self._get_next_hop(previous, dest)
+    def _begin_spf(self) -> bool:
+        """
+        Decide whether SPF has anything to do.
 
-                # Get path
-                path = self._reconstruct_path(previous, dest)
+        Returns:
+            False if the cached routing table and convergence time still hold
+        """
+        if not self._lsdb_dirty:
+            return False
+        self._lsdb_dirty = False
+
+        # Order-insensitive, so routers that learned the same LSAs in a
+        # different order still match (and can share a graph)
+        signature = frozenset((router_id, lsa.sequence_number)
+                              for router_id, lsa in self.lsdb.items())
+        if signature == self._spf_signature:
+            self._spf_changed = {}
+            return False
+        self._spf_signature = signature
+        return True
 
-                # Update routing table
-                if (dest not in self.routing_table or
-                    distance < self.routing_table[dest][1]):
-                    self.routing_table[dest] = (next_hop, distance, path)
-                    updated = True
+    def _needs_full_spf(self) -> bool:
+        """Check whether pending LSDB changes require a full SPF run."""
+        return self._spf_full or self._spf_dist is None
 
-        self.convergence_time = time.time() - start_time
-        self.last_update = time.time()
+    def _adopt_spf(self, graph: _SPFGraph, distances: array, previous: array,
+                   settled: List[int]) -> List[int]:
+        """
+        Keep a full SPF result as the base for later incremental runs.
 
-        return updated
+        Returns:
+            settled, for chaining into _finish_spf
+        """
+        self._spf_graph = graph
+        self._spf_dist, self._spf_prev = distances, previous
+        self._spf_hop = array('i', [-1]) * len(graph.adj)
+        return settled
 
-    def _build_topology_graph(self) -> Dict[str, Dict[str, float]]:
+    def _finish_spf(self, settled: List[int], start_time: float) -> bool:
         """
-        Build topology graph from LSDB.
+        Install routes for the nodes settled by the last SPF run.
+
+        Args:
+            settled: Local node indices in settle order
+            start_time: perf_counter() value when the run started
 
         Returns:
-            Graph as adjacency list with costs
+            True if routing table was updated
         """
-        graph = {}
-
-        for router_id, lsa in self.lsdb.items():
-            graph[router_id] = {}
+        self._spf_changed = {}
+        self._spf_full = False
+
+        # Update routing table; router IDs are only resolved for changed routes.
+        # Nodes settle after their predecessor, so each next hop is inherited
+        # from the predecessor's instead of walking back to the source.
+        graph = self._spf_graph
+        names = graph.names
+        source = graph.index[self._rid]
+        distances, previous = self._spf_dist, self._spf_prev
+        updated = False
+        routing_table = self.routing_table
+        hops = self._spf_hop
+        for index in settled:
+            parent = previous[index]
+            if parent == -1:
+                continue
+            hop = hops[index] = index if parent == source else hops[parent]
+
+            # Only write routes that actually changed, so steady-state runs
+            # leave the table (and anything derived from it) untouched
+            route = (names[hop], distances[index])
+            dest = names[index]
+            if routing_table.get(dest) != route:
+                routing_table[dest] = route
+                updated = True
 
-            for link in lsa["links"]:
-                neighbor = link["neighbor"]
-                cost = link["cost"]
-                graph[router_id][neighbor] = cost
+        self.convergence_time = time.perf_counter() - start_time
+        self.last_update = _now()
 
-        return graph
+        return updated
 
-    def _dijkstra(self, graph: Dict[str, Dict[str, float]], source: str) -> Tuple[Dict[str, float], Dict[str, str]]:
+    def _build_topology_graph(self) -> _SPFGraph:
         """
-        Run Dijkstra's algorithm.
+        Build topology graph from LSDB, numbering only the routers it mentions.
 
-        Args:
-            graph: Graph as adjacency list
-            source: Source node
+        Local indices follow interned ID order, so SPF breaks ties as it
+        would over interned IDs. Advertised neighbors whose LSA hasn't
+        arrived are leaves without outgoing links.
 
         Returns:
-            Tuple of (distances, previous nodes)
+            SPF graph of the LSDB
+        """
+        lsdb = self.lsdb
+        ids = sorted(set(map(intern_id, lsdb)).union(*(lsa.neighbors for lsa in lsdb.values())))
+        index = {node: i for i, node in enumerate(ids)}
+        adj: List[List[Tuple[int, int]]] = [[] for _ in ids]
+        for router_id, lsa in lsdb.items():
+            adj[index[intern_id(router_id)]] = list(zip(map(index.__getitem__, lsa.neighbors), lsa.costs))
+        return _SPFGraph(adj, [_ID_REV[node] for node in ids], index)
+
+    def _incremental_spf(self, changed_routers: List[str]) -> List[int]:
         """
-        distances = {node: float('inf') for node in graph}
-        distances[source] = 0
-        previous = {node: None for node in graph}
+        Apply LSAs that only added links or lowered costs to the last SPF.
 
-        pq = [(0, source)]
+        The changed routers' adjacency rows are rebuilt, every neighbor whose
+        distance improves through a changed router seeds the heap, and
+        Dijkstra restarts from those seeds. Nodes whose distance can't
+        improve are never touched.
 
-        while pq:
-            current_distance, current = heapq.heappop(pq)
+        Args:
+            changed_routers: Routers whose LSAs changed since the last SPF
 
-            if current_distance > distances[current]:
-                continue
+        Returns:
+            Local indices of nodes whose distance improved
+        """
+        # The graph may be shared with other routers (see OSPFNetwork), so
+        # rows are replaced in a private copy of the outer list, and the
+        # numbering is copied before routers new to the graph are added
+        graph = self._spf_graph
+        adj = list(graph.adj)
+        names, index = graph.names, graph.index
+        dist, prev = self._spf_dist, self._spf_prev
+
+        seeds = []
+        for router_id in changed_routers:
+            lsa = self.lsdb[router_id]
+            new = [node for node in dict.fromkeys((intern_id(router_id), *lsa.neighbors))
+                   if node not in index]
+            if new:
+                if index is graph.index:
+                    names, index = list(names), dict(index)
+                for node in new:
+                    index[node] = len(names)
+                    names.append(_ID_REV[node])
+                    adj.append([])
+                dist.extend(array('q', [_UNREACHABLE]) * len(new))
+                prev.extend(array('i', [-1]) * len(new))
+                self._spf_hop.extend(array('i', [-1]) * len(new))
+
+            u = index[intern_id(router_id)]
+            row = adj[u] = list(zip(map(index.__getitem__, lsa.neighbors), lsa.costs))
+            du = dist[u]
+            for v, weight in row:
+                if du + weight < dist[v]:
+                    dist[v] = du + weight
+                    prev[v] = u
+                    seeds.append(v)
+
+        self._spf_graph = _SPFGraph(adj, names, index)
+        return self._relax(adj, dist, prev, seeds)
+
+    @classmethod
+    def _dijkstra(cls, adj: List[List[Tuple[int, int]]], source: int) -> Tuple[array, array, List[int]]:
+        """
+        Run Dijkstra's algorithm from a single source.
 
-            for neighbor, weight in graph[current].items():
-                distance = current_distance + weight
+        Args:
+            adj: Adjacency lists of (index, cost)
+            source: Source node index
 
-                if distance < distances[neighbor]:
-                    distances[neighbor] = distance
-                    previous[neighbor] = current
-                    heapq.heappush(pq, (distance, neighbor))
+        Returns:
+            Tuple of (distances (_UNREACHABLE for none), previous node indices
+            (-1 for none), indices of reachable nodes in settle order)
+        """
+        n = len(adj)
+        if csgraph_dijkstra is not None and n >= _COMPILED_SPF_MIN_NODES:
+            return cls._dijkstra_compiled(adj, source)
 
-        return distances, previous
+        dist = array('q', [_UNREACHABLE]) * n
+        prev = array('i', [-1]) * n
+        dist[source] = 0
+        return dist, prev, cls._relax(adj, dist, prev, [source])
 
-    def _get_next_hop(self, previous: Dict[str, str], destination: str) -> str:
+    @staticmethod
+    def _dijkstra_compiled(adj: List[List[Tuple[int, int]]], source: int) -> Tuple[array, array, List[int]]:
         """
-        Get next hop to destination.
+        Run Dijkstra in SciPy's compiled csgraph over a CSR copy of the graph.
 
         Args:
-            previous: Previous nodes from Dijkstra
-            destination: Target destination
+            adj: Adjacency lists of (index, cost)
+            source: Source node index
 
         Returns:
-            Next hop node
+            Same as _dijkstra
+        """
+        n = len(adj)
+        rows = np.repeat(np.arange(n), [len(row) for row in adj])
+        edges = np.array([edge for row in adj for edge in row], dtype=np.int64).reshape(-1, 2)
+        graph = csr_matrix((edges[:, 1], (rows, edges[:, 0])), shape=(n, n))
+
+        d, p = csgraph_dijkstra(graph, directed=True, indices=source, return_predecessors=True)
+
+        # Costs are at least 1, so sorting by distance puts every node after
+        # its predecessor, matching the settle order of the heap version
+        reached = np.flatnonzero(np.isfinite(d))
+        order = reached[np.argsort(d[reached], kind='stable')]
+
+        dist_np = np.full(n, _UNREACHABLE, dtype=np.int64)
+        dist_np[reached] = d[reached]
+        prev_np = np.where(p < 0, -1, p).astype(np.int32)
+
+        dist = array('q')
+        dist.frombytes(dist_np.tobytes())
+        prev = array('i')
+        prev.frombytes(prev_np.tobytes())
+        return dist, prev, order.tolist()
+
+    @staticmethod
+    def _relax(adj: List[List[Tuple[int, int]]], dist: array, prev: array, seeds: List[int]) -> List[int]:
         """
-        current = destination
-        while previous[current] is not None and previous[current] != self.router_id:
-            current = previous[current]
-        return current
+        Settle nodes outward from seeds using a radix heap.
+
+        Distances are integers and popped keys never decrease, so an entry
+        lives in the bucket given by the highest bit where its key differs
+        from the last popped key. Popping only rescans the first non-empty
+        bucket. An improved distance leaves its old entry behind; stale
+        entries are dropped whenever their bucket is redistributed (so they
+        don't pile up) and otherwise skipped when popped. dist and prev are
+        updated in place.
+
+        Args:
+            adj: Adjacency lists of (index, cost)
+            dist: Distances, already set for the seeds
+            prev: Previous node indices
+            seeds: Nodes to start from
 
-    def _reconstruct_path(self, previous: Dict[str, str], destination: str) -> List[str]:
+        Returns:
+            Indices of settled nodes, in settle order
+        """
+        settled = []
+        if not seeds:
+            return settled
+
+        buckets: List[List[Tuple[int, int]]] = [[] for _ in range(64)]
+        last = min(dist[node] for node in seeds)
+        for node in seeds:
+            key = dist[node]
+            buckets[(key ^ last).bit_length()].append((key, node))
+        size = len(seeds)
+        done = bytearray(len(adj))
+
+        while size:
+            bucket = buckets[0]
+            if not bucket:
+                # Refill bucket 0 from the first non-empty bucket
+                i = 1
+                while not buckets[i]:
+                    i += 1
+                entries = buckets[i]
+                buckets[i] = []
+                live = [entry for entry in entries if entry[0] == dist[entry[1]]]
+                size -= len(entries) - len(live)
+                if not live:
+                    continue
+                last = min(live)[0]
+                for entry in live:
+                    buckets[(entry[0] ^ last).bit_length()].append(entry)
+                bucket = buckets[0]
+
+            key, current = bucket.pop()
+            size -= 1
+            if done[current] or key > dist[current]:
+                continue  # Stale entry
+            done[current] = 1
+            settled.append(current)
+
+            for neighbor, weight in adj[current]:
+                distance = key + weight
+                if distance < dist[neighbor]:
+                    dist[neighbor] = distance
+                    prev[neighbor] = current
+                    buckets[(distance ^ last).bit_length()].append((distance, neighbor))
+                    size += 1
+
+        return settled
+
+    @staticmethod
+    def _trace(previous: array, destination: int, source: int) -> Tuple[int, List[int]]:
         """
-        Reconstruct path from Dijkstra results.
+        Walk the predecessor chain once for both next hop and path.
 
         Args:
-            previous: Previous nodes from Dijkstra
-            destination: Target destination
+            previous: Previous node indices from Dijkstra
+            destination: Target destination index
+            source: Source node index
 
         Returns:
-            Path as list of nodes
+            Tuple of (next hop index, path as list of node indices)
         """
-        path = []
-        current = destination
-        while current is not None:
-            path.append(current)
-            current = previous[current]
+        parent = previous[destination]
+        if parent == source:
+            return destination, [source, destination]
+
+        path = [destination]
+        next_hop = current = destination
+        while parent != -1:
+            path.append(parent)
+            if parent == source:
+                next_hop = current
+            current = parent
+            parent = previous[current]
         path.reverse()
-        return path
+        return next_hop, path
 
-    def update_lsdb(self, neighbor_lsa: Dict[str, Any]):
+    def update_lsdb(self, neighbor_lsa: LSA):
         """
         Update Link State Database with neighbor's LSA.
 
@@ -414,30 +872,57 @@ class OSPFRouter:
         Returns:
             True if LSDB was updated
         """
-        router_id = neighbor_lsa["router_id"]
-        sequence_number = neighbor_lsa["sequence_number"]
+        router_id = neighbor_lsa.router_id
+        old_lsa = self.lsdb.get(router_id)
 
         # Check if we have newer information
-        if (router_id in self.lsdb and
-            self.lsdb[router_id]["sequence_number"] >= sequence_number):
+        if old_lsa is not None and old_lsa.sequence_number >= neighbor_lsa.sequence_number:
             return False
 
-        # Update LSDB
-        self.lsdb[router_id] = neighbor_lsa.copy()
-        self.lsdb[router_id]["timestamp"] = time.time()
+        # Update LSDB. LSAs are immutable, so the sender's object is stored
+        # as-is and the receive time goes in a side table.
+        self.lsdb[router_id] = neighbor_lsa
+        self._lsa_rx_time[router_id] = time.time()
+        self._pending_flood[router_id] = None
+
+        # A refresh with identical links still has to be flooded onwards,
+        # but leaves SPF untouched
+        if (old_lsa is not None and old_lsa.neighbors == neighbor_lsa.neighbors and
+                old_lsa.costs == neighbor_lsa.costs):
+            return True
+
+        # Links that were removed or got more expensive need a full SPF;
+        # anything else can be applied to the last SPF incrementally
+        if not self._spf_full:
+            if old_lsa is not None:
+                new_costs = dict(zip(neighbor_lsa.neighbors, neighbor_lsa.costs))
+                if any(new_costs.get(neighbor, _UNREACHABLE) > cost
+                       for neighbor, cost in zip(old_lsa.neighbors, old_lsa.costs)):
+                    self._spf_full = True
+            self._spf_changed[router_id] = None
+        self._lsdb_dirty = True
 
         return True
 
-    def get_lsa(self) -> Dict[str, Any]:
+    def get_lsa(self) -> LSA:
         """
         Get this router's Link State Advertisement.
 
         Returns:
-            LSA dictionary
+            LSA (immutable)
+        """
+        return self.lsdb[self.router_id]
+
+    def get_lsdb(self) -> Mapping[str, LSA]:
+        """
+        Get the Link State Database.
+
+        Returns:
+            Read-only live view of the LSDB
         """
-        return self.lsdb[self.router_id].copy()
+        return self._lsdb_view
 
-    def get_route(self, destination: str) -> Optional[Tuple[str, float, List[str]]]:
+    def get_route(self, destination: str) -> Optional[Tuple[str, int]]:
         """
         Get route to destination.
 
@@ -445,27 +930,72 @@ class OSPFRouter:
             destination: Destination node
 
         Returns:
-            Tuple of (next_hop, cost, path) or None
+            Tuple of (next_hop, cost) or None
         """
         return self.routing_table.get(destination)
 
-    def get_routing_table(self) -> Dict[str, Tuple[str, float, List[str]]]:
+    def get_path(self, destination: str) -> Optional[List[str]]:
+        """
+        Get the path to destination from the last SPF run.
+
+        Args:
+            destination: Destination node
+
+        Returns:
+            Path as list of router IDs, or None if unreachable
+        """
+        graph, dist = self._spf_graph, self._spf_dist
+        if dist is None:
+            return None
+        index = graph.index.get(_ID_POOL.get(destination))
+        if index is None or dist[index] == _UNREACHABLE:
+            return None
+        _, path = self._trace(self._spf_prev, index, graph.index[self._rid])
+        names = graph.names
+        return [names[i] for i in path]
+
+    def get_route_with_path(self, destination: str) -> Optional[Tuple[str, int, List[str]]]:
+        """
+        Get route to destination together with its path.
+
+        Args:
+            destination: Destination node
+
+        Returns:
+            Tuple of (next_hop, cost, path) or None
+        """
+        route = self.routing_table.get(destination)
+        if route is None:
+            return None
+        path = self.get_path(destination)
+        return (route[0], route[1], path if path is not None else [])
+
+    def get_routing_table(self) -> Mapping[str, Tuple[str, int]]:
         """
         Get current routing table.
 
+        Returns:
+            Read-only live view of the routing table
+        """
+        return self._routing_table_view
+
+    def snapshot(self) -> Dict[str, Tuple[str, int]]:
+        """
+        Get a copy of the routing table that later updates won't change.
+
         Returns:
             Routing table dictionary
         """
         return self.routing_table.copy()
 
-    def get_neighbors(self) -> Dict[str, Dict[str, Any]]:
+    def get_neighbors(self) -> Mapping[str, Dict[str, Any]]:
         """
         Get neighbor information.
 
         Returns:
-            Neighbor status dictionary
+            Read-only live view of the neighbor status dictionary
         """
-        return self.neighbors.copy()
+        return self._neighbors_view
 
     def should_send_update(self) -> bool:
         """
@@ -474,7 +1004,7 @@ class OSPFRouter:
         Returns:
             True if update should be sent
         """
-        return time.time() - self.last_update >= self.update_interval
+        return _now() - self.last_update >= self.update_interval
 
     def get_convergence_time(self) -> float:
         """
@@ -495,7 +1025,7 @@ class OSPFRouter:
         if neighbor_id not in self.neighbors:
             self.neighbors[neighbor_id] = {
                 "state": "init",
-                "last_seen": time.time()
+                "last_seen": _now()
             }
 
     def remove_neighbor(self, neighbor_id: str):
@@ -511,11 +1041,28 @@ class OSPFRouter:
             # Remove from LSDB if present
             if neighbor_id in self.lsdb:
                 del self.lsdb[neighbor_id]
+                self._lsa_rx_time.pop(neighbor_id, None)
+                self._lsdb_dirty = True
+                self._spf_full = True
 
             # Trigger SPF recalculation
             self.run_spf()
 
 
+def _spf_worker(adj: List[List[Tuple[int, int]]], sources: List[int]) -> List[Tuple[array, array, List[int]]]:
+    """
+    Run full SPF from several sources over one graph (process pool task).
+
+    Args:
+        adj: Adjacency lists of (local index, cost)
+        sources: Local indices to run SPF from
+
+    Returns:
+        One (distances, previous, settled) result per source
+    """
+    return [OSPFRouter._dijkstra(adj, source) for source in sources]
+
+
 class RIPNetwork:
     """
     RIP network simulation with multiple routers.
@@ -536,46 +1083,114 @@ class RIPNetwork:
             if node.node_type == "router":
                 self.routers[node_id] = RIPRouter(node_id, topology)
 
+        # Dense indexing for the vectorized distance-vector exchange. Routers
+        # come first, so a router's index is also its destination column.
+        self.router_index = {router_id: i for i, router_id in enumerate(self.routers)}
+
+    def _build_adjacency(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build the router-to-router neighbor edges, grouped by receiving router.
+
+        Returns:
+            Tuple of (receiving router indices, advertising neighbor indices)
+        """
+        src, nbr = [], []
+        for i, router in enumerate(self.routers.values()):
+            for neighbor_id in router.neighbors:
+                k = self.router_index.get(neighbor_id)
+                if k is not None:
+                    src.append(i)
+                    nbr.append(k)
+        order = np.lexsort((nbr, src))
+        return (np.asarray(src, dtype=np.intp)[order],
+                np.asarray(nbr, dtype=np.intp)[order])
+
     def run_protocol(self, max_iterations: int = 50):
         """
         Run RIP protocol until convergence or max iterations.
 
+        Each round every router relaxes its distance vector against its
+        neighbors' vectors from the previous round, with split horizon and
+        poisoned reverse, as one batch of NumPy operations over a
+        router x destination matrix.
+
         Args:
             max_iterations: Maximum number of iterations
         """
-        for iteration in range(max_iterations):
-            updated = False
-
-            # Collect updates from all routers
-            all_updates = {}
-            for router_id, router in self.routers.items():
-                all_updates[router_id] = router.get_routing_updates()
-
-            # Send updates to neighbors
-            for router_id, router in self.routers.items():
-                neighbor_updates = {}
-
-                for neighbor_id in router.neighbors:
-                    if neighbor_id in all_updates:
-                        neighbor_updates[neighbor_id] = all_updates[neighbor_id][router_id]
-
-                if router.update_routing_table(neighbor_updates):
-                    updated = True
-
-            # Mark updates as sent
-            for router in self.routers.values():
-                router.mark_update_sent()
-
-            # Check for convergence
-            if not updated:
-                break
-
-    def get_routing_tables(self) -> Dict[str, Dict[str, Tuple[str, int, float]]]:
+        routers = list(self.routers.values())
+        n = len(routers)
+        if n == 0:
+            return
+
+        # Destination columns: routers first, then anything else in the tables
+        dest_index = dict(self.router_index)
+        for router in routers:
+            for dest in router.routing_table:
+                if dest not in dest_index:
+                    dest_index[dest] = len(dest_index)
+        dests = list(dest_index)
+
+        # D[i, j]: cost from router i to destination j (16 = unreachable)
+        # NH[i, j]: destination column of the next hop, -1 for none
+        D = np.full((n, len(dests)), 16, dtype=np.int8)
+        NH = np.full((n, len(dests)), -1, dtype=np.int32)
+        for i, router in enumerate(routers):
+            for dest, (next_hop, cost, _) in router.routing_table.items():
+                j = dest_index[dest]
+                D[i, j] = min(cost, 16)
+                NH[i, j] = dest_index.get(next_hop, -1)
+        D_initial, NH_initial = D.copy(), NH.copy()
+
+        # Rebuilt per run so add_neighbor/remove_neighbor calls take effect
+        src, nbr = self._build_adjacency()
+        if len(src):
+            starts = np.flatnonzero(np.r_[True, src[1:] != src[:-1]])
+            receivers = src[starts]
+            # Tie-break equal costs on the lowest neighbor index
+            nbr_col = nbr[:, None].astype(np.int64)
+
+            for iteration in range(max_iterations):
+                # Neighbor advertisements, poisoned where the route points back
+                cand = np.minimum(D[nbr].astype(np.int64) + 1, 16)
+                cand[NH[nbr] == src[:, None]] = 16
+
+                # Best advertisement per receiving router and destination
+                key = np.minimum.reduceat(cand * n + nbr_col, starts, axis=0)
+                best_cost = key // n
+                best_hop = key % n
+
+                current = D[receivers]
+                mask = best_cost < np.minimum(current, 16)
+                mask &= best_cost < 16
+                if not mask.any():
+                    break
+
+                rows, cols = np.nonzero(mask)
+                D[receivers[rows], cols] = best_cost[rows, cols]
+                NH[receivers[rows], cols] = best_hop[rows, cols]
+
+        # Write changed entries back to the per-router tables
+        current_time = _now()
+        changed = (D != D_initial) | (NH != NH_initial)
+        for i in np.flatnonzero(changed.any(axis=1)):
+            router = routers[i]
+            for j in np.flatnonzero(changed[i]):
+                cost = int(D[i, j])
+                if cost < 16:
+                    router._install_route(dests[j], dests[NH[i, j]], cost, current_time)
+            router.last_update = current_time
+            router._updates_dirty = True
+
+        # Mark updates as sent
+        for router in routers:
+            router.mark_update_sent()
+
+    def get_routing_tables(self) -> Dict[str, Mapping[str, Tuple[str, int, float]]]:
         """
         Get routing tables from all routers.
 
         Returns:
-            Dictionary of routing tables
+            Dictionary of read-only routing table views
         """
         return {router_id: router.get_routing_table()
                 for router_id, router in self.routers.items()}
@@ -601,6 +1216,15 @@ class OSPFNetwork:
             if node.node_type == "router":
                 self.routers[node_id] = OSPFRouter(node_id, topology)
 
+        self._peers: Dict[str, List[OSPFRouter]] = {}
+        self._peers_version = -1
+
+        # Worker processes for SPF; None picks automatically by round size
+        self.spf_workers: Optional[int] = None
+
+        # SPF graphs of the last round, by LSDB signature, shared by routers
+        self._compiled_graphs: Dict[FrozenSet[Tuple[str, int]], _SPFGraph] = {}
+
     def run_protocol(self, max_iterations: int = 10):
         """
         Run OSPF protocol until convergence.
@@ -608,36 +1232,123 @@ class OSPFNetwork:
         Args:
             max_iterations: Maximum number of iterations
         """
-        # Flood LSAs
+        routers = self.routers
+
+        # Flooding adjacencies: directly linked routers, shared by all routers
+        # and rebuilt only when the topology changes
+        if self._peers_version != self.topology._version:
+            self._peers = {router_id: [routers[neighbor_id]
+                                       for neighbor_id, _ in router._topology_links()
+                                       if neighbor_id in routers]
+                           for router_id, router in routers.items()}
+            self._peers_version = self.topology._version
+        peers = self._peers
+
         for iteration in range(max_iterations):
             updated = False
 
-            # Collect LSAs from all routers
-            lsas = {}
-            for router_id, router in self.routers.items():
-                lsas[router_id] = router.get_lsa()
+            # Flood newly learned LSAs along adjacencies until no router has
+            # anything left to pass on
+            queue = deque(router for router in routers.values() if router._pending_flood)
+            while queue:
+                sender = queue.popleft()
+                pending = sender._pending_flood
+                if not pending:
+                    continue
+                sender._pending_flood = {}
+                lsas = [sender.lsdb[router_id] for router_id in pending if router_id in sender.lsdb]
 
-            # Flood LSAs to all routers
-            for router_id, router in self.routers.items():
-                for sender_id, lsa in lsas.items():
-                    if sender_id != router_id:
-                        if router.update_lsdb(lsa):
+                for receiver in peers[sender.router_id]:
+                    was_idle = not receiver._pending_flood
+                    for lsa in lsas:
+                        if receiver.update_lsdb(lsa):
                             updated = True
+                    if was_idle and receiver._pending_flood:
+                        queue.append(receiver)
 
-            # Run SPF on all routers
-            for router in self.routers.values():
-                router.run_spf()
+            # Run SPF only where the LSDB changed (or SPF has never run)
+            self._run_spf_round()
 
             # Check for convergence
             if not updated:
                 break
 
-    def get_routing_tables(self) -> Dict[str, Dict[str, Tuple[str, float, List[str]]]]:
+    def _run_spf_round(self):
+        """
+        Run SPF on every router whose LSDB changed.
+
+        Routers with identical LSDBs (the usual case after flooding) share
+        one compiled graph, built once per round instead of once per router.
+        Full SPF runs are independent per router, so when the round is large
+        enough they go to a process pool, with each graph sent once per
+        chunk of sources.
+        """
+        pending = [router for router in self.routers.values()
+                   if router._lsdb_dirty and router._begin_spf()]
+        full = [router for router in pending if router._needs_full_spf()]
+
+        # Group routers by LSDB signature and compile each distinct graph once
+        groups: Dict[FrozenSet[Tuple[str, int]], List[OSPFRouter]] = {}
+        for router in full:
+            groups.setdefault(router._spf_signature, []).append(router)
+        graphs = {signature: self._compiled_graphs.get(signature) or members[0]._build_topology_graph()
+                  for signature, members in groups.items()}
+        if graphs:
+            self._compiled_graphs = graphs
+
+        work = sum(len(members) * len(graphs[signature].adj) for signature, members in groups.items())
+        if full and self._use_spf_pool(work):
+            start_time = time.perf_counter()
+            workers = self.spf_workers or os.cpu_count() or 1
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                jobs = []
+                for signature, members in groups.items():
+                    graph = graphs[signature]
+                    size = -(-len(members) // workers)
+                    for i in range(0, len(members), size):
+                        chunk = members[i:i + size]
+                        future = pool.submit(_spf_worker, graph.adj,
+                                             [graph.index[router._rid] for router in chunk])
+                        jobs.append((graph, chunk, future))
+
+                for graph, chunk, future in jobs:
+                    for router, result in zip(chunk, future.result()):
+                        router._finish_spf(router._adopt_spf(graph, *result), start_time)
+        else:
+            for signature, members in groups.items():
+                graph = graphs[signature]
+                for router in members:
+                    start_time = time.perf_counter()
+                    result = router._dijkstra(graph.adj, graph.index[router._rid])
+                    router._finish_spf(router._adopt_spf(graph, *result), start_time)
+
+        for router in pending:
+            if not router._needs_full_spf() and router._spf_changed:
+                start_time = time.perf_counter()
+                router._finish_spf(router._incremental_spf(list(router._spf_changed)), start_time)
+
+    def _use_spf_pool(self, work: int) -> bool:
+        """
+        Decide whether a round of full SPF runs is worth a process pool.
+
+        Args:
+            work: Full SPF runs times the node count of their graph, summed
+                over the round
+
+        Returns:
+            True to run them in worker processes
+        """
+        if self.spf_workers is not None:
+            return self.spf_workers > 1
+        # Pool start-up and pickling only pay off on large rounds
+        return (os.cpu_count() or 1) > 1 and work >= _PARALLEL_SPF_MIN_WORK
+
+    def get_routing_tables(self) -> Dict[str, Mapping[str, Tuple[str, int]]]:
         """
         Get routing tables from all routers.
 
         Returns:
-            Dictionary of routing tables
+            Dictionary of read-only routing table views
         """
         return {router_id: router.get_routing_table()
                 for router_id, router in self.routers.items()}
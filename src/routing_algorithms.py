@@ -5,11 +5,261 @@ This module implements various routing algorithms for network path computation.
 """
 
 import heapq
+import os
 import time
-from typing import Dict, List, Tuple, Optional, Any, Set
-from src.core import Topology
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, List, Sequence, Tuple, Optional, Any, Set
+import numpy as np  # pyright: ignore[reportMissingModuleSource]
+from src.core import Topology, link_state_epoch
 from src.config import QOS_WEIGHTS
 
+# Optional JIT for point-to-point Dijkstra; without Numba the pure-Python
+# loop is used
+try:
+    from numba import njit  # pyright: ignore[reportMissingModuleSource]
+except ImportError:
+    njit = None
+
+# Number of buckets used by BucketQueue; the bucket width is derived from the
+# largest link cost so queued keys never wrap onto a live bucket
+_BUCKET_COUNT = 64
+
+# All-pairs Dijkstra switches to a dense Floyd-Warshall on graphs at least
+# this dense and below this size (memory grows with the square of the node
+# count); sparser graphs run one Dijkstra per source
+_FLOYD_WARSHALL_MIN_DENSITY = 0.2
+_FLOYD_WARSHALL_MAX_NODES = 1500
+
+# Minimum sources x edges before per-source Dijkstra runs go to a pool
+_PARALLEL_SSSP_MIN_WORK = 2_000_000
+
+
+def _dijkstra_csr(indptr, indices, weights, source, target):
+    """
+    Dijkstra over CSR arrays with an array-backed binary heap.
+
+    Written in the Numba nopython subset; mirrors RoutingEngine._dijkstra,
+    including reaching nodes over infinite-cost links.
+
+    Args:
+        indptr: CSR row offsets (n + 1)
+        indices: CSR column indices (m)
+        weights: CSR edge costs (m)
+        source: Source row
+        target: Target row
+
+    Returns:
+        Tuple of (predecessor array, -1 for none; distance array)
+    """
+    n = indptr.shape[0] - 1
+    dist = np.full(n, np.inf)
+    pred = np.full(n, -1, dtype=np.int32)
+    seen = np.zeros(n, dtype=np.bool_)
+    dist[source] = 0.0
+    seen[source] = True
+
+    # Each push follows an improvement, so m + 1 slots always suffice
+    heap_keys = np.empty(indices.shape[0] + 1)
+    heap_nodes = np.empty(indices.shape[0] + 1, dtype=np.int32)
+    heap_keys[0] = 0.0
+    heap_nodes[0] = source
+    size = 1
+
+    while size > 0:
+        key = heap_keys[0]
+        node = heap_nodes[0]
+        size -= 1
+        last_key = heap_keys[size]
+        last_node = heap_nodes[size]
+        i = 0
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            if child + 1 < size and (heap_keys[child + 1] < heap_keys[child] or (
+                    heap_keys[child + 1] == heap_keys[child] and heap_nodes[child + 1] < heap_nodes[child])):
+                child += 1
+            if heap_keys[child] < last_key or (heap_keys[child] == last_key and heap_nodes[child] < last_node):
+                heap_keys[i] = heap_keys[child]
+                heap_nodes[i] = heap_nodes[child]
+                i = child
+            else:
+                break
+        heap_keys[i] = last_key
+        heap_nodes[i] = last_node
+
+        if key > dist[node]:
+            continue  # Stale entry
+        if node == target:
+            break
+
+        for e in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[e]
+            new_cost = dist[node] + weights[e]
+            if not seen[neighbor] or new_cost < dist[neighbor]:
+                seen[neighbor] = True
+                dist[neighbor] = new_cost
+                pred[neighbor] = node
+                i = size
+                size += 1
+                while i > 0:
+                    parent = (i - 1) // 2
+                    if heap_keys[parent] < new_cost or (heap_keys[parent] == new_cost and heap_nodes[parent] <= neighbor):
+                        break
+                    heap_keys[i] = heap_keys[parent]
+                    heap_nodes[i] = heap_nodes[parent]
+                    i = parent
+                heap_keys[i] = new_cost
+                heap_nodes[i] = neighbor
+
+    return pred, dist
+
+
+_dijkstra_csr_jit = njit(cache=True)(_dijkstra_csr) if njit is not None else None
+
+
+def _dijkstra_lists(adj: List[List[Tuple[int, float]]], bucket_scale: Optional[float],
+                    source_row: int, target_row: int) -> Tuple[List[Optional[float]], List[int]]:
+    """
+    Pure-Python Dijkstra over per-row adjacency lists.
+
+    Args:
+        adj: (neighbor row, cost) pairs per row, in CSR order
+        bucket_scale: BucketQueue scale, or None to use a binary heap
+        source_row: Source row
+        target_row: Row to stop at, or -1 for all destinations
+
+    Returns:
+        Tuple of (cost per row, None if unreached; predecessor row, -1 for none)
+    """
+    # Priority queue: (cost, row); rows follow node ID order, so ties
+    # break as they would on node IDs
+    if bucket_scale is not None:
+        pq = BucketQueue(bucket_scale, _BUCKET_COUNT)
+        push, pop = pq.insert, pq.extract_min
+    else:
+        pq = []
+        heappush = heapq.heappush
+        push = lambda priority, node: heappush(pq, (priority, node))
+        pop = partial(heapq.heappop, pq)
+    push(0, source_row)
+
+    # Integer-indexed state; None marks rows not reached yet
+    dist: List[Optional[float]] = [None] * len(adj)
+    pred = [-1] * len(adj)
+    dist[source_row] = 0
+
+    while pq:
+        current_cost, current = pop()
+
+        # Skip stale entries superseded by a cheaper push
+        if current_cost > dist[current]:
+            continue
+
+        if current == target_row:
+            break
+
+        for neighbor, edge_cost in adj[current]:
+            # current_cost equals dist[current] past the stale check
+            new_cost = current_cost + edge_cost
+
+            best = dist[neighbor]
+            if best is None or new_cost < best:
+                dist[neighbor] = new_cost
+                push(new_cost, neighbor)
+                pred[neighbor] = current
+
+    return dist, pred
+
+
+# CSR graph of the parent's RoutingEngine, installed once per pool worker
+_worker_graph: Optional[Tuple[List[List[Tuple[int, float]]], Optional[float]]] = None
+
+
+def _init_sssp_worker(adj: List[List[Tuple[int, float]]], bucket_scale: Optional[float]):
+    """
+    Store the shared graph in a pool worker (process pool initializer).
+
+    Args:
+        adj: (neighbor row, cost) pairs per row
+        bucket_scale: BucketQueue scale, or None to use a binary heap
+    """
+    global _worker_graph
+    _worker_graph = (adj, bucket_scale)
+
+
+def _sssp_worker(source_rows: List[int]) -> List[Tuple[array, array]]:
+    """
+    Run single-source Dijkstra from several rows (process pool task).
+
+    Args:
+        source_rows: Rows to search from
+
+    Returns:
+        One compact (distances, predecessors) pair per source; unreached
+        rows have predecessor -1
+    """
+    results = []
+    for source_row in source_rows:
+        dist, pred = _dijkstra_lists(*_worker_graph, source_row, -1)
+        results.append((array('d', [float('inf') if cost is None else cost for cost in dist]), array('i', pred)))
+    return results
+
+
+class BucketQueue:
+    """
+    Monotone priority queue of (cost, node) pairs for Dijkstra.
+
+    Keys are spread over a circular array of buckets by scaling them to
+    integers; each bucket is a small binary heap, so extract_min stays exact
+    for float costs while most pushes and pops touch only a few entries.
+    """
+
+    def __init__(self, scale: float, size: int):
+        """
+        Initialize bucket queue.
+
+        Args:
+            scale: Multiplier mapping a cost to its integer bucket key
+            size: Number of buckets; must exceed max_edge_cost * scale + 1
+        """
+        self.scale = scale
+        self.size = size
+        self.buckets: List[List[Tuple[float, str]]] = [[] for _ in range(size)]
+        self.cursor = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def insert(self, cost: float, node: str):
+        """
+        Insert a node with the given cost (never below the last extracted).
+
+        Args:
+            cost: Priority of the entry
+            node: Node ID
+        """
+        heapq.heappush(self.buckets[int(cost * self.scale) % self.size], (cost, node))
+        self.count += 1
+
+    def extract_min(self) -> Tuple[float, str]:
+        """
+        Remove and return the entry with the lowest cost.
+
+        Returns:
+            Tuple of (cost, node)
+        """
+        buckets = self.buckets
+        cursor = self.cursor
+        while not buckets[cursor]:
+            cursor = (cursor + 1) % self.size
+        self.cursor = cursor
+        self.count -= 1
+        return heapq.heappop(buckets[cursor])
+
 
 class RoutingEngine:
     """
@@ -27,6 +277,37 @@ class RoutingEngine:
         self.topology = topology
         self.qos_weights = qos_weights or QOS_WEIGHTS.copy()
 
+        # Directed (u, v) -> cost for every operational link, rebuilt when the
+        # topology structure, any link's state or the QoS weights change
+        self._cost_cache: Dict[Tuple[str, str], float] = {}
+        self._cost_cache_key: Optional[Tuple[Any, ...]] = None
+        # Bumped whenever the cached costs change, for caches derived from them
+        self._cost_epoch = 0
+        # BucketQueue scale for the cached costs, None to use a binary heap
+        self._bucket_scale: Optional[float] = None
+
+        # Node coordinates as an (n, 2) array (NaN when unset) plus the row
+        # of each node, rebuilt when the topology or coordinates change
+        self._coords: np.ndarray = np.empty((0, 2))
+        self._node_index: Dict[str, int] = {}
+        self._coords_key: Optional[Tuple[int, int]] = None
+
+        # CSR view of the cost cache for the compiled Dijkstra
+        self._csr: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, List[str], Dict[str, int]]] = None
+        # Same graph as per-row (neighbor row, cost) lists for Python loops
+        self._adj_py: List[List[Tuple[int, float]]] = []
+        self._csr_key: Optional[int] = None
+
+        # Whether straight-line distance never exceeds link cost: (key, flag)
+        self._consistency_cache: Optional[Tuple[Tuple[Any, ...], bool]] = None
+
+        # Worker processes for all-source Dijkstra; None picks automatically
+        self.sssp_workers: Optional[int] = None
+
+        # Last all-pairs result: ((algorithm, strategy, cost epoch,
+        # (structure, link-state, coordinate versions)), routes)
+        self._apsp_cache: Optional[Tuple[Tuple[Any, ...], Dict[Tuple[str, str], Tuple[List[str], float]]]] = None
+
     def compute_route(self, algorithm: str, source: str, target: str) -> Tuple[Optional[List[str]], float]:
         """
         Compute route using specified algorithm.
@@ -61,44 +342,109 @@ class RoutingEngine:
         Returns:
             Tuple of (path, cost)
         """
-        # Priority queue: (cost, node)
-        pq = [(0, source)]
-        came_from = {source: None}
-        cost_so_far = {source: 0}
+        node_index = self._ensure_csr()[4]
+        source_row = node_index.get(source)
+        target_row = node_index.get(target)
+        if source_row is None or target_row is None:
+            return None, float('inf')
 
-        while pq:
-            current_cost, current = heapq.heappop(pq)
+        dist, pred = self._dijkstra_sssp(source_row, target_row)
+        return self._trace_route(dist, pred, source_row, target_row)
 
-            if current == target:
-                break
+    def _dijkstra_sssp(self, source_row: int, target_row: int = -1) -> Tuple[Sequence[Any], Sequence[int]]:
+        """
+        Dijkstra from one source, settling every reachable node unless a target is given.
 
-            for neighbor in self.topology.graph.neighbors(current):
-                link = self.topology.get_link(current, neighbor)
-                if not link or not link.status:
-                    continue
+        Nodes are addressed by their CSR row (see _ensure_csr).
+
+        Args:
+            source_row: Source row
+            target_row: Row to stop at, or -1 for all destinations
+
+        Returns:
+            Tuple of (cost per row, predecessor row per row or -1); a row is
+            reached if it is the source or has a predecessor
+        """
+        indptr, indices, weights, _, _ = self._ensure_csr()
 
-                # Calculate edge cost using QoS weights
-                edge_cost = self._calculate_link_cost(link)
-                new_cost = cost_so_far[current] + edge_cost
+        if _dijkstra_csr_jit is not None:
+            pred, dist = _dijkstra_csr_jit(indptr, indices, weights, source_row, target_row)
+            return dist, pred
 
-                if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
-                    cost_so_far[neighbor] = new_cost
-                    priority = new_cost
-                    heapq.heappush(pq, (priority, neighbor))
-                    came_from[neighbor] = current
+        return _dijkstra_lists(self._adj_py, self._bucket_scale, source_row, target_row)
 
-        if target not in came_from:
+    def _trace_route(self, dist: Sequence[Any], pred: Sequence[int], source_row: int,
+                     target_row: int) -> Tuple[Optional[List[str]], float]:
+        """
+        Rebuild a route from a shortest-path tree over CSR rows.
+
+        Args:
+            dist: Cost per row
+            pred: Predecessor row per row, -1 for none
+            source_row: Source row
+            target_row: Target row
+
+        Returns:
+            Tuple of (path, cost) or (None, inf) if the target was not reached
+        """
+        if target_row != source_row and pred[target_row] == -1:
             return None, float('inf')
 
-        # Reconstruct path
+        nodes = self._csr[3]
         path = []
-        current = target
-        while current is not None:
-            path.append(current)
-            current = came_from[current]
+        current = target_row
+        while current != -1:
+            path.append(nodes[current])
+            current = pred[current]
         path.reverse()
 
-        return path, cost_so_far[target]
+        cost = dist[target_row]
+        return path, cost if isinstance(cost, int) else float(cost)
+
+    def _ensure_csr(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str], Dict[str, int]]:
+        """
+        Get the cost cache as CSR arrays, rebuilding them if stale.
+
+        Returns:
+            Tuple of (indptr, indices, weights, nodes, node ID to row mapping)
+        """
+        costs = self._link_costs()
+        if self._csr_key != self._cost_epoch:
+            # Rows in ID order so heap ties break as on node IDs, and each
+            # row keeps networkx neighbor order
+            nodes = sorted(self.topology.graph.nodes())
+            node_index = {node: i for i, node in enumerate(nodes)}
+            adjacency = self.topology.graph.adj
+            get_cost = costs.get
+            adj = []
+            for node in nodes:
+                row = []
+                for neighbor in adjacency[node]:
+                    edge_cost = get_cost((node, neighbor))
+                    if edge_cost is not None:
+                        row.append((node_index[neighbor], edge_cost))
+                adj.append(row)
+
+            indptr = np.zeros(len(nodes) + 1, dtype=np.int32)
+            np.cumsum([len(row) for row in adj], out=indptr[1:])
+            edges = [edge for row in adj for edge in row]
+            indices = np.array([neighbor for neighbor, _ in edges], dtype=np.int32)
+            weights = np.array([edge_cost for _, edge_cost in edges], dtype=np.float64)
+            self._csr = (indptr, indices, weights, nodes, node_index)
+            self._adj_py = adj
+            self._csr_key = self._cost_epoch
+        return self._csr
+
+    def _edge_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get every operational directed edge as packed parallel arrays.
+
+        Returns:
+            Tuple of (tail rows, head rows, costs), grouped by tail row
+        """
+        indptr, indices, weights, nodes, _ = self._ensure_csr()
+        tails = np.repeat(np.arange(len(nodes), dtype=np.int32), np.diff(indptr))
+        return tails, indices, weights
 
     def _astar(self, source: str, target: str) -> Tuple[Optional[List[str]], float]:
         """
@@ -111,43 +457,72 @@ class RoutingEngine:
         Returns:
             Tuple of (path, cost)
         """
-        pq = [(0, source)]  # (f_score, node)
-        came_from = {source: None}
-        g_score = {source: 0}  # Cost from start to node
-        f_score = {source: self._heuristic(source, target)}
+        node_index = self._ensure_csr()[4]
+        adj = self._adj_py
+        source_row = node_index.get(source)
+        target_row = node_index.get(target)
+        if source_row is None or target_row is None:
+            return None, float('inf')
+
+        # The heuristic only depends on the node for a fixed target, so
+        # evaluate it for every node at once (same values as _heuristic);
+        # the coordinate table shares the CSR row order
+        coords = self._coordinate_table()[0]
+        if np.isnan(coords[target_row, 0]):
+            estimates = [0.0] * len(node_index)
+            consistent = True  # Plain Dijkstra
+        else:
+            consistent = self._heuristic_is_consistent()
+            delta = coords - coords[target_row]
+            distances = np.sqrt(delta[:, 0] * delta[:, 0] + delta[:, 1] * delta[:, 1])
+            estimates = np.nan_to_num(distances, nan=0.0).tolist()  # No heuristic information
+
+        # Integer-indexed state; None marks rows not reached yet
+        n = len(node_index)
+        g_score: List[Optional[float]] = [None] * n  # Cost from start to node
+        f_score: List[Optional[float]] = [None] * n
+        pred = [-1] * n
+        g_score[source_row] = 0
+        f_score[source_row] = estimates[source_row]
+        pq = [(0, source_row)]  # (f_score, row)
+
+        # With a consistent heuristic an expanded node is final, so it is
+        # closed and never relaxed again; otherwise nodes may be reopened
+        closed = [False] * n
+
+        # Hot-loop lookups bound to locals
+        heappush = heapq.heappush
+        heappop = heapq.heappop
 
         while pq:
-            _, current = heapq.heappop(pq)
+            current_f, current = heappop(pq)
 
-            if current == target:
+            # Skip stale entries superseded by a cheaper push
+            if current_f > f_score[current]:
+                continue
+
+            if current == target_row:
                 break
 
-            for neighbor in self.topology.graph.neighbors(current):
-                link = self.topology.get_link(current, neighbor)
-                if not link or not link.status:
+            if consistent:
+                closed[current] = True
+
+            current_g = g_score[current]
+            for neighbor, edge_cost in adj[current]:
+                if closed[neighbor]:
                     continue
 
-                edge_cost = self._calculate_link_cost(link)
-                tentative_g_score = g_score[current] + edge_cost
+                tentative_g_score = current_g + edge_cost
 
-                if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
-                    came_from[neighbor] = current
+                best = g_score[neighbor]
+                if best is None or tentative_g_score < best:
+                    pred[neighbor] = current
                     g_score[neighbor] = tentative_g_score
-                    f_score[neighbor] = tentative_g_score + self._heuristic(neighbor, target)
-                    heapq.heappush(pq, (f_score[neighbor], neighbor))
-
-        if target not in came_from:
-            return None, float('inf')
-
-        # Reconstruct path
-        path = []
-        current = target
-        while current is not None:
-            path.append(current)
-            current = came_from[current]
-        path.reverse()
+                    neighbor_f = tentative_g_score + estimates[neighbor]
+                    f_score[neighbor] = neighbor_f
+                    heappush(pq, (neighbor_f, neighbor))
 
-        return path, g_score[target]
+        return self._trace_route(g_score, pred, source_row, target_row)
 
     def _bellman_ford(self, source: str, target: str) -> Tuple[Optional[List[str]], float]:
         """
@@ -160,47 +535,93 @@ class RoutingEngine:
         Returns:
             Tuple of (path, cost)
         """
-        nodes = list(self.topology.graph.nodes())
-        if source not in nodes or target not in nodes:
+        # Edge list of operational links (both directions), packed by row
+        tails, heads, weights = self._edge_arrays()
+        nodes, index = self._csr[3], self._csr[4]
+        if source not in index or target not in index:
             return None, float('inf')
 
         # Initialize distances
-        distance = {node: float('inf') for node in nodes}
-        predecessor = {node: None for node in nodes}
-        distance[source] = 0
-
-        # Relax edges |V| - 1 times
-        for _ in range(len(nodes) - 1):
-            for u, v in self.topology.graph.edges():
-                link = self.topology.get_link(u, v)
-                if not link or not link.status:
-                    continue
-
-                edge_cost = self._calculate_link_cost(link)
-                if distance[u] + edge_cost < distance[v]:
-                    distance[v] = distance[u] + edge_cost
-                    predecessor[v] = u
-
-        # Check for negative cycles (shouldn't happen in our case)
-        for u, v in self.topology.graph.edges():
-            link = self.topology.get_link(u, v)
-            if link and link.status:
-                edge_cost = self._calculate_link_cost(link)
-                if distance[u] + edge_cost < distance[v]:
-                    return None, float('inf')  # Negative cycle
+        distance = np.full(len(nodes), np.inf)
+        predecessor = np.full(len(nodes), -1, dtype=np.int32)
+        distance[index[source]] = 0.0
+
+        # Relax edges at once, at most |V| - 1 rounds; a round without
+        # improvements means distances have converged. Only edges leaving a
+        # node improved in the previous round can improve anything (SPFA).
+        active = np.zeros(len(nodes), dtype=bool)
+        active[index[source]] = True
+        for _ in range(len(nodes)):
+            live = np.flatnonzero(active[tails])
+            live_tails = tails[live]
+            live_heads = heads[live]
+            candidate = distance[live_tails] + weights[live]
+            better = candidate < distance[live_heads]
+            if not better.any():
+                break
+            np.minimum.at(distance, live_heads[better], candidate[better])
+            # Several edges may improve one head; keep the one that won
+            won = better & (candidate == distance[live_heads])
+            predecessor[live_heads[won]] = live_tails[won]
+            active[:] = False
+            active[live_heads[better]] = True
+        else:
+            return None, float('inf')  # Negative cycle (shouldn't happen in our case)
 
-        if distance[target] == float('inf'):
+        target_index = index[target]
+        if distance[target_index] == np.inf:
             return None, float('inf')
 
         # Reconstruct path
         path = []
-        current = target
-        while current is not None:
-            path.append(current)
+        current = target_index
+        while current != -1:
+            path.append(nodes[current])
             current = predecessor[current]
         path.reverse()
 
-        return path, distance[target]
+        return path, float(distance[target_index])
+
+    def _link_costs(self) -> Dict[Tuple[str, str], float]:
+        """
+        Get the cached link costs, rebuilding them if stale.
+
+        Returns:
+            Dictionary mapping directed (u, v) pairs to link cost
+        """
+        key = (self.topology._version, link_state_epoch(),
+               tuple(sorted(self.qos_weights.items())))
+        if key != self._cost_cache_key:
+            self._cost_cache = self._build_cost_cache()
+            self._cost_cache_key = key
+            self._cost_epoch += 1
+
+            # Bucket queue needs finite costs and a non-zero bucket width
+            max_cost = max(self._cost_cache.values(), default=0.0)
+            if 0.0 < max_cost < float('inf'):
+                self._bucket_scale = (_BUCKET_COUNT - 2) / max_cost
+            else:
+                self._bucket_scale = None
+        return self._cost_cache
+
+    def _build_cost_cache(self) -> Dict[Tuple[str, str], float]:
+        """
+        Compute the cost of every operational link in both directions.
+
+        Returns:
+            Dictionary mapping directed (u, v) pairs to link cost
+        """
+        cache = {}
+        for link in self.topology.get_all_links():
+            if not link.status:
+                continue
+            cache[(link.node_a, link.node_b)] = cache[(link.node_b, link.node_a)] = self._calculate_link_cost(link)
+        return cache
+
+    def invalidate_cost_cache(self):
+        """Drop cached link costs and routes, e.g. after changing a link outside its topology."""
+        self._cost_cache_key = None
+        self._apsp_cache = None
 
     def _calculate_link_cost(self, link) -> float:
         """
@@ -234,27 +655,267 @@ class RoutingEngine:
         Returns:
             Heuristic distance
         """
-        coords_a = self.topology.get_node_coordinates(node_a)
-        coords_b = self.topology.get_node_coordinates(node_b)
+        coords, node_index = self._coordinate_table()
+        i = node_index.get(node_a)
+        j = node_index.get(node_b)
+        if i is None or j is None:
+            return 0.0  # No heuristic information
 
-        if not coords_a or not coords_b:
+        dx = coords[i, 0] - coords[j, 0]
+        dy = coords[i, 1] - coords[j, 1]
+        if dx != dx or dy != dy:
             return 0.0  # No heuristic information
+        return float((dx * dx + dy * dy)**0.5)
+
+    def _heuristic_is_consistent(self) -> bool:
+        """
+        Check that the Euclidean heuristic is consistent for every target.
+
+        By the triangle inequality this holds when no link is shorter in
+        cost than the straight-line distance between its endpoints, and
+        either both or neither endpoint has coordinates.
+
+        Returns:
+            True if A* may close expanded nodes
+        """
+        edge_tails, edge_heads, weights = self._edge_arrays()
+        coords = self._coordinate_table()[0]
+        key = (self._cost_epoch, self._coords_key)
+        if self._consistency_cache is not None and self._consistency_cache[0] == key:
+            return self._consistency_cache[1]
+
+        # Coordinate rows share the CSR order
+        tails = coords[edge_tails]
+        heads = coords[edge_heads]
+        tail_known = ~np.isnan(tails[:, 0])
+        head_known = ~np.isnan(heads[:, 0])
+
+        consistent = not (tail_known != head_known).any()
+        if consistent:
+            delta = (tails - heads)[tail_known]
+            distances = np.sqrt(delta[:, 0] * delta[:, 0] + delta[:, 1] * delta[:, 1])
+            # Margin so rounding in the estimates can't break the inequality
+            consistent = bool(np.all(distances * (1 + 1e-9) <= weights[tail_known]))
+
+        self._consistency_cache = (key, consistent)
+        return consistent
+
+    def _coordinate_table(self) -> Tuple[np.ndarray, Dict[str, int]]:
+        """
+        Get node coordinates in structure-of-arrays form, rebuilding if stale.
+
+        Returns:
+            Tuple of ((n, 2) coordinate array with NaN for unset nodes,
+            node ID to row mapping)
+        """
+        key = (self.topology._version, self.topology._coords_version)
+        if key != self._coords_key:
+            coordinates = self.topology.node_coordinates
+            # Same row order as the CSR arrays
+            nodes = sorted(self.topology.graph.nodes())
+            self._coords = np.array([coordinates.get(node) or (np.nan, np.nan) for node in nodes],
+                                    dtype=np.float64).reshape(len(nodes), 2)
+            self._node_index = {node: i for i, node in enumerate(nodes)}
+            self._coords_key = key
+        return self._coords, self._node_index
+
+    def compute_routes_from_source(self, algorithm: str, source: str) -> Dict[str, Tuple[Optional[List[str]], float]]:
+        """
+        Compute routes from one source to every other node.
+
+        Dijkstra settles all destinations in a single search; other
+        algorithms are run once per destination.
+
+        Args:
+            algorithm: Algorithm name
+            source: Source node ID
+
+        Returns:
+            Dictionary mapping target to (path, cost), or (None, inf) if no path
+        """
+        nodes = list(self.topology.graph.nodes())
+        if algorithm.lower() != "dijkstra":
+            return {target: self.compute_route(algorithm, source, target)
+                    for target in nodes if target != source}
+
+        node_index = self._ensure_csr()[4]
+        source_row = node_index.get(source)
+        if source_row is None:
+            return {target: (None, float('inf')) for target in nodes if target != source}
+
+        return self._routes_from_tree(source, *self._dijkstra_sssp(source_row))
+
+    def compute_routes_from_all_sources(self, algorithm: str) -> Dict[str, Dict[str, Tuple[Optional[List[str]], float]]]:
+        """
+        Compute routes from every node to every other node.
+
+        Large Dijkstra workloads are spread over a process pool (see
+        sssp_workers); everything else runs compute_routes_from_source.
+
+        Args:
+            algorithm: Algorithm name
+
+        Returns:
+            Dictionary mapping source to its routes by target
+        """
+        sources = list(self.topology.graph.nodes())
+        if algorithm.lower() != "dijkstra" or not self._use_sssp_pool(len(sources)):
+            return {source: self.compute_routes_from_source(algorithm, source) for source in sources}
+
+        node_index = self._ensure_csr()[4]
+        workers = self.sssp_workers or os.cpu_count() or 1
+        size = -(-len(sources) // workers)
+        routes = {}
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_sssp_worker,
+                                 initargs=(self._adj_py, self._bucket_scale)) as pool:
+            jobs = []
+            for i in range(0, len(sources), size):
+                chunk = sources[i:i + size]
+                jobs.append((chunk, pool.submit(_sssp_worker, [node_index[source] for source in chunk])))
+
+            for chunk, future in jobs:
+                for source, (dist, pred) in zip(chunk, future.result()):
+                    routes[source] = self._routes_from_tree(source, dist, pred)
+        return routes
+
+    def _use_sssp_pool(self, num_sources: int) -> bool:
+        """
+        Decide whether all-source Dijkstra is worth a process pool.
+
+        Args:
+            num_sources: Number of source nodes
+
+        Returns:
+            True to run the searches in worker processes
+        """
+        if self.sssp_workers is not None:
+            return self.sssp_workers > 1
+        # The compiled kernel is already fast serially; otherwise pool
+        # start-up and pickling only pay off on large graphs
+        if _dijkstra_csr_jit is not None:
+            return False
+        return (os.cpu_count() or 1) > 1 and num_sources * len(self._ensure_csr()[1]) >= _PARALLEL_SSSP_MIN_WORK
+
+    def _routes_from_tree(self, source: str, dist: Sequence[Any],
+                          pred: Sequence[int]) -> Dict[str, Tuple[Optional[List[str]], float]]:
+        """
+        Expand a shortest-path tree over CSR rows into routes by target.
 
-        dx = coords_a[0] - coords_b[0]
-        dy = coords_a[1] - coords_b[1]
-        return (dx**2 + dy**2)**0.5
+        Args:
+            source: Source node ID
+            dist: Cost per row
+            pred: Predecessor row per row, -1 for none
 
-    def compute_all_pairs_shortest_paths(self, algorithm: str = "dijkstra") -> Dict[Tuple[str, str], Tuple[List[str], float]]:
+        Returns:
+            Dictionary mapping target to (path, cost), or (None, inf) if no path
+        """
+        if isinstance(pred, np.ndarray):
+            dist, pred = dist.tolist(), pred.tolist()
+        elif not isinstance(pred, list):
+            dist, pred = list(dist), list(pred)
+        node_index = self._csr[4]
+        source_row = node_index[source]
+
+        # Extend each predecessor's path, walking back only to the first
+        # node whose path is already known
+        row_nodes = self._csr[3]
+        paths: List[Optional[List[str]]] = [None] * len(row_nodes)
+        paths[source_row] = [source]
+        routes = {}
+        for target in self.topology.graph.nodes():
+            if target == source:
+                continue
+            target_row = node_index[target]
+            if pred[target_row] == -1:
+                routes[target] = (None, float('inf'))
+                continue
+            pending = []
+            current = target_row
+            while paths[current] is None:
+                pending.append(current)
+                current = pred[current]
+            for row in reversed(pending):
+                paths[row] = paths[current] + [row_nodes[row]]
+                current = row
+            routes[target] = (paths[target_row], dist[target_row])
+
+        return routes
+
+    def compute_all_pairs_shortest_paths(self, algorithm: str = "dijkstra",
+                                         force_algorithm: Optional[str] = None) -> Dict[Tuple[str, str], Tuple[List[str], float]]:
         """
         Compute shortest paths between all pairs of nodes.
 
         Args:
             algorithm: Algorithm to use
+            force_algorithm: For dijkstra, "floyd_warshall" or "sssp" to bypass
+                the density-based choice between them (e.g. for testing)
+
+        Returns:
+            Dictionary mapping (source, target) to (path, cost); the result is
+            cached and shared between calls, so callers must not modify it
+        """
+        algorithm = algorithm.lower()
+        key = self._apsp_key(algorithm, force_algorithm)
+        if self._apsp_cache is not None and self._apsp_cache[0] == key:
+            return self._apsp_cache[1]
+
+        all_pairs = self._compute_all_pairs(algorithm, force_algorithm)
+        self._apsp_cache = (key, all_pairs)
+        return all_pairs
+
+    def _apsp_key(self, algorithm: str, force_algorithm: Optional[str] = None) -> Tuple[Any, ...]:
+        """
+        Build the all-pairs cache key for the current link costs.
+
+        Refreshes the cost cache first, so the key reflects any pending
+        topology or link-state change.
+
+        Args:
+            algorithm: Lower-case algorithm name
+            force_algorithm: Strategy override passed to the all-pairs computation
+
+        Returns:
+            Cache key tuple
+        """
+        self._link_costs()
+        return (algorithm, force_algorithm, self._cost_epoch,
+                (self.topology._version, link_state_epoch(), self.topology._coords_version))
+
+    def _compute_all_pairs(self, algorithm: str,
+                           force_algorithm: Optional[str] = None) -> Dict[Tuple[str, str], Tuple[List[str], float]]:
+        """
+        Compute shortest paths between all pairs of nodes, bypassing the cache.
+
+        Args:
+            algorithm: Algorithm to use
+            force_algorithm: "floyd_warshall" or "sssp" to override the
+                dijkstra strategy
 
         Returns:
             Dictionary mapping (source, target) to (path, cost)
         """
+        algorithm = algorithm.lower()
         nodes = list(self.topology.graph.nodes())
+        if algorithm == "dijkstra":
+            if force_algorithm is None:
+                n = len(nodes)
+                links = len(self._ensure_csr()[1]) // 2
+                density = 2 * links / (n * (n - 1)) if n > 1 else 0.0
+                use_floyd_warshall = density > _FLOYD_WARSHALL_MIN_DENSITY and n < _FLOYD_WARSHALL_MAX_NODES
+            else:
+                use_floyd_warshall = force_algorithm == "floyd_warshall"
+
+            # Floyd-Warshall can't route over infinite-cost links and
+            # declines them; one search per source handles everything
+            all_pairs = self._all_pairs_floyd_warshall(nodes) if use_floyd_warshall else None
+            if all_pairs is None:
+                all_pairs = {}
+                for source, routes in self.compute_routes_from_all_sources(algorithm).items():
+                    for target, route in routes.items():
+                        all_pairs[(source, target)] = route
+            return all_pairs
+
         all_pairs = {}
 
         for source in nodes:
@@ -265,6 +926,64 @@ class RoutingEngine:
 
         return all_pairs
 
+    def _all_pairs_floyd_warshall(self, nodes: List[str]) -> Optional[Dict[Tuple[str, str], Tuple[List[str], float]]]:
+        """
+        Vectorized Floyd-Warshall over a dense cost matrix.
+
+        Args:
+            nodes: Node IDs, in matrix order
+
+        Returns:
+            Dictionary mapping (source, target) to (path, cost), or None if
+            some link has infinite cost (Dijkstra still routes over those)
+        """
+        tails, heads, weights = self._edge_arrays()
+        if np.isinf(weights).any():
+            return None
+        rows = self._csr[3]
+        index = self._csr[4]
+        costs = self._link_costs()
+        n = len(rows)
+
+        # Matrix rows follow the CSR order
+        distance = np.full((n, n), np.inf)
+        next_hop = np.full((n, n), -1, dtype=np.int32)
+        distance[tails, heads] = weights
+        next_hop[tails, heads] = heads
+        np.fill_diagonal(distance, 0.0)
+
+        for k in range(n):
+            through = distance[:, k:k + 1] + distance[k:k + 1, :]
+            shorter = through < distance
+            distance = np.where(shorter, through, distance)
+            next_hop = np.where(shorter, next_hop[:, k:k + 1], next_hop)
+
+        all_pairs = {}
+        next_hop = next_hop.tolist()
+        for source in nodes:
+            i = index[source]
+            hops = next_hop[i]
+            for target in nodes:
+                j = index[target]
+                if i == j:
+                    continue
+                if hops[j] == -1:
+                    all_pairs[(source, target)] = (None, float('inf'))
+                    continue
+
+                # Walk next hops, summing costs from the source like Dijkstra
+                path = [source]
+                cost = 0
+                current = i
+                while current != j:
+                    step = next_hop[current][j]
+                    cost += costs[(rows[current], rows[step])]
+                    path.append(rows[step])
+                    current = step
+                all_pairs[(source, target)] = (path, cost)
+
+        return all_pairs
+
     def get_network_diameter(self, algorithm: str = "dijkstra") -> Tuple[int, float]:
         """
         Calculate network diameter (longest shortest path).
@@ -275,8 +994,19 @@ class RoutingEngine:
         Returns:
             Tuple of (diameter_hops, diameter_cost)
         """
-        all_pairs = self.compute_all_pairs_shortest_paths(algorithm)
+        return self._diameter(self.compute_all_pairs_shortest_paths(algorithm))
+
+    @staticmethod
+    def _diameter(all_pairs: Dict[Tuple[str, str], Tuple[List[str], float]]) -> Tuple[int, float]:
+        """
+        Longest shortest path over precomputed all-pairs routes.
+
+        Args:
+            all_pairs: Dictionary mapping (source, target) to (path, cost)
 
+        Returns:
+            Tuple of (diameter_hops, diameter_cost)
+        """
         max_hops = 0
         max_cost = 0.0
 
@@ -326,11 +1056,27 @@ class RoutingEngine:
         Returns:
             List of critical link tuples
         """
-        original_diameter = self.get_network_diameter(algorithm)[1]
+        algorithm = algorithm.lower()
+        all_pairs = self.compute_all_pairs_shortest_paths(algorithm)
+        original_diameter = self._diameter(all_pairs)[1]
         critical_links = []
 
+        # With exact shortest paths, removing a link that no chosen path uses
+        # leaves every route (and so the diameter) unchanged. A* is not exact
+        # with its coordinate heuristic, so every link is checked for it.
+        used_links = None
+        if algorithm != "astar":
+            used_links = set()
+            for path, _ in all_pairs.values():
+                if path:
+                    used_links.update(zip(path, path[1:]))
+
         for link in self.topology.get_all_links():
-            # Temporarily disable link
+            if used_links is not None and (link.node_a, link.node_b) not in used_links \
+                    and (link.node_b, link.node_a) not in used_links:
+                continue
+
+            # Temporarily disable link; the status write invalidates the costs
             original_status = link.status
             link.status = False
 
@@ -342,6 +1088,8 @@ class RoutingEngine:
                 # Restore link status
                 link.status = original_status
 
+        # Every link is back, so the original routes are current again
+        self._apsp_cache = (self._apsp_key(algorithm), all_pairs)
         return critical_links
 
     def compare_algorithms(self, source: str, target: str) -> Dict[str, Dict[str, Any]]:
@@ -7,9 +7,17 @@ and manages routing table computations.
 
 import time
 from typing import Dict, List, Tuple, Optional, Any
+import math
+import numpy as np  # pyright: ignore[reportMissingModuleSource]
 from src.core import Topology
 from src.routing_algorithms import RoutingEngine as RoutingAlgorithmEngine
 
+# Optional fast JSON encoder; without orjson the stdlib json module is used
+try:
+    import orjson  # pyright: ignore[reportMissingModuleSource]
+except ImportError:
+    orjson = None
+
 class RoutingEngine:
     """
     Manages routing computations and protocol interactions.
@@ -20,6 +28,16 @@ class RoutingEngine:
         self.routing_tables = {}  # node_id -> routing_table
         self.last_update = time.time()
 
+        # Worker processes for compute_all_routes; None picks automatically
+        self.sssp_workers: Optional[int] = None
+
+        # Integer id per link, in both orientations; ids are never reused so
+        # routes over since-removed links can still be matched
+        self._edge_ids: Dict[Tuple[str, str], int] = {}
+        # Flattened link ids of every route path, for invalidate_routes:
+        # (route keys, path objects, flat edge ids, per-route path edge counts)
+        self._route_index: Optional[Tuple[List[Tuple[str, str]], List[Any], np.ndarray, np.ndarray]] = None
+
         # Initialize routing tables for all nodes
         for node_id in self.topology.graph.nodes():
             self.routing_tables[node_id] = {}
@@ -37,21 +55,23 @@ class RoutingEngine:
             Dictionary mapping source nodes to their routing tables
         """
         routing_engine = RoutingAlgorithmEngine(self.topology, qos_weights)
+        routing_engine.sssp_workers = self.sssp_workers
 
+        # One single-source search per node rather than one per pair
+        all_routes = routing_engine.compute_routes_from_all_sources(algorithm)
         for source in self.topology.graph.nodes():
             routing_table = {}
-            for destination in self.topology.graph.nodes():
-                if source != destination:
-                    path, cost = routing_engine.compute_route(algorithm, source, destination)
-                    if path:
-                        next_hop = path[1] if len(path) > 1 else destination
-                        routing_table[destination] = {
-                            "next_hop": next_hop,
-                            "cost": cost,
-                            "path": path
-                        }
+            for destination, (path, cost) in all_routes[source].items():
+                if path:
+                    next_hop = path[1] if len(path) > 1 else destination
+                    routing_table[destination] = {
+                        "next_hop": next_hop,
+                        "cost": cost,
+                        "path": path
+                    }
             self.routing_tables[source] = routing_table
 
+        self._route_index = None
         self.last_update = time.time()
         return self.routing_tables
 
@@ -90,6 +110,8 @@ class RoutingEngine:
         for node in current_nodes - existing_nodes:
             self.routing_tables[node] = {}
 
+        self._route_index = None
+
     def get_routing_table(self, node_id: str) -> Dict[str, Any]:
         """
         Get the complete routing table for a node.
@@ -118,24 +140,91 @@ class RoutingEngine:
         Args:
             affected_links: List of (u, v) link tuples that are affected
         """
-        affected_links_set = set(tuple(sorted(link)) for link in affected_links)
+        # Tables are public and may have been edited since the index was built
+        if self._route_index is None or not self._route_index_current():
+            self._route_index = self._build_route_index()
+        route_keys, paths, path_edges, path_lengths = self._route_index
+
+        # Links no route has used yet have no id and can't affect anything
+        affected_ids = [self._edge_ids[link] for link in map(tuple, affected_links) if link in self._edge_ids]
+        if not affected_ids:
+            return
+        affected_bits = np.zeros(len(self._edge_ids), dtype=bool)
+        affected_bits[affected_ids] = True
+
+        # Count affected links per path via prefix sums over the flat array
+        hits = np.concatenate(([0], np.cumsum(affected_bits[path_edges])))
+        ends = np.cumsum(path_lengths)
+        path_affected = hits[ends] > hits[ends - path_lengths]
+
+        for i in np.flatnonzero(path_affected).tolist():
+            source, dest = route_keys[i]
+            del self.routing_tables[source][dest]
+
+        # Drop the removed routes from the index
+        keep = ~path_affected
+        kept = keep.tolist()
+        self._route_index = ([key for key, k in zip(route_keys, kept) if k],
+                             [path for path, k in zip(paths, kept) if k],
+                             path_edges[np.repeat(keep, path_lengths)], path_lengths[keep])
+
+    def _edge_id(self, node_a: str, node_b: str) -> int:
+        """
+        Get the integer id of a link, assigning one on first use.
+
+        Args:
+            node_a: First node ID
+            node_b: Second node ID
+
+        Returns:
+            Link id, shared by both orientations
+        """
+        edge_id = self._edge_ids.get((node_a, node_b))
+        if edge_id is None:
+            edge_id = len(self._edge_ids)
+            self._edge_ids[(node_a, node_b)] = self._edge_ids[(node_b, node_a)] = edge_id
+        return edge_id
 
+    def _route_index_current(self) -> bool:
+        """
+        Check the route index still describes the routing tables.
+
+        Routes are matched by the identity of their path, so a route added,
+        removed or replaced since the index was built makes it stale.
+
+        Returns:
+            True if the index can be used as is
+        """
+        route_keys, paths, _, _ = self._route_index
+        if len(route_keys) != sum(map(len, self.routing_tables.values())):
+            return False
+        for (source, dest), path in zip(route_keys, paths):
+            route_info = self.routing_tables.get(source, {}).get(dest)
+            if route_info is None or route_info.get("path") is not path:
+                return False
+        return True
+
+    def _build_route_index(self) -> Tuple[List[Tuple[str, str]], List[Any], np.ndarray, np.ndarray]:
+        """
+        Flatten the link ids of every routing table path.
+
+        Returns:
+            Tuple of (route keys, path objects, flat edge ids, per-route path edge counts)
+        """
+        route_keys = []
+        paths = []
+        path_edges = []
+        path_lengths = []
         for source, routing_table in self.routing_tables.items():
-            routes_to_remove = []
             for dest, route_info in routing_table.items():
-                path = route_info.get("path", [])
-                # Check if any link in the path is affected
-                path_affected = False
-                for i in range(len(path) - 1):
-                    link = tuple(sorted((path[i], path[i+1])))
-                    if link in affected_links_set:
-                        path_affected = True
-                        break
-                if path_affected:
-                    routes_to_remove.append(dest)
-
-            for dest in routes_to_remove:
-                del routing_table[dest]
+                path = route_info.get("path")
+                route_keys.append((source, dest))
+                paths.append(path)
+                path = path or []
+                path_edges.extend(self._edge_id(a, b) for a, b in zip(path, path[1:]))
+                path_lengths.append(max(len(path) - 1, 0))
+        return (route_keys, paths, np.array(path_edges, dtype=np.int64),
+                np.array(path_lengths, dtype=np.int64))
 
     def get_convergence_time(self) -> float:
         """
@@ -153,10 +242,21 @@ class RoutingEngine:
         Args:
             filename: Output filename
         """
-        import json
         data = {
             "timestamp": time.time(),
             "routing_tables": self.routing_tables
         }
+
+        # orjson writes infinite costs as null where json writes Infinity,
+        # so tables with unusable (zero-bandwidth) routes keep the stdlib path
+        if orjson is not None and all(math.isfinite(route.get("cost", 0.0))
+                                      for table in self.routing_tables.values()
+                                      for route in table.values()):
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                                     default=str))
+            return
+
+        import json
         with open(filename, 'w') as f:
             json.dump(data, f, indent=2, default=str)
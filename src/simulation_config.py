@@ -4,40 +4,399 @@ Simulation Configuration Module
 This module provides configuration classes for network simulation experiments.
 """
 
-from typing import Dict, List, Any, Optional, Union
-from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple, Union
+from dataclasses import MISSING, dataclass, field, fields, is_dataclass
+from functools import lru_cache
+from operator import attrgetter
 import json
+import math
 import os
+import sys
 
+import numpy as np  # pyright: ignore[reportMissingModuleSource]
 
-@dataclass
+# Optional fast JSON codec; without orjson the stdlib json module is used
+try:
+    import orjson  # pyright: ignore[reportMissingModuleSource]
+except ImportError:
+    orjson = None
+
+# Optional packed binary codec for shipping configs between processes
+try:
+    import msgpack  # pyright: ignore[reportMissingModuleSource]
+except ImportError:
+    msgpack = None
+
+# Buffer size for config file I/O, so a dump issues few large writes
+_IO_BUFFER_SIZE = 65536
+
+# validate() results keyed by the values it checks; cleared when full
+_VALIDATION_CACHE: Dict[tuple, List[str]] = {}
+_VALIDATION_CACHE_MAX = 1024
+
+
+def _check(is_invalid, message: str):
+    """
+    Build a validation check for a single value.
+
+    Args:
+        is_invalid: Predicate that is true for a bad value
+        message: Error reported for a bad value
+
+    Returns:
+        Function mapping a value to a tuple of error messages
+    """
+    failed = (message,)
+    return lambda value: failed if is_invalid(value) else ()
+
+
+# Predicates below work on scalars and on NumPy arrays alike
+def _negative(value):
+    return value < 0
+
+
+def _not_positive(value):
+    return value <= 0
+
+
+def _below_zero_or_above_one(value):
+    return (value < 0) | (value > 1)
+
+
+def _outside_unit_interval(value):
+    # Unlike the bound check above, NaN is rejected (value != value)
+    return (value < 0) | (value > 1) | (value != value)
+
+
+_QOS_PATH = 'routing.qos_weights'
+
+# Per-field rules as (attribute path, is_invalid, message), in report order
+_FIELD_RULES = (
+    ('topology.num_end_devices', _negative, "Number of end devices must be non-negative"),
+    ('topology.num_routers', _negative, "Number of routers must be non-negative"),
+    ('topology.num_switches', _negative, "Number of switches must be non-negative"),
+    ('topology.num_hubs', _negative, "Number of hubs must be non-negative"),
+    ('routing.qos_weights.alpha', _negative, "QoS alpha weight must be non-negative"),
+    ('routing.qos_weights.beta', _negative, "QoS beta weight must be non-negative"),
+    ('routing.qos_weights.gamma', _negative, "QoS gamma weight must be non-negative"),
+    ('traffic.load_factor', _below_zero_or_above_one, "Traffic load factor must be between 0 and 1"),
+    ('traffic.duration', _not_positive, "Simulation duration must be positive"),
+    ('failure.failure_probability', _outside_unit_interval, "Failure probability must be between 0 and 1"),
+    ('failure.recovery_probability', _outside_unit_interval, "Recovery probability must be between 0 and 1"),
+    ('attack.attack_probability', _outside_unit_interval, "Attack probability must be between 0 and 1"),
+    ('attack.attack_intensity', _outside_unit_interval, "Attack intensity must be between 0 and 1"),
+)
+
+# QoS rules relative to the QoSConfig
+_QOS_RULES = tuple(
+    (attrgetter(path[len(_QOS_PATH) + 1:]), is_invalid, message)
+    for path, is_invalid, message in _FIELD_RULES
+    if path.startswith(_QOS_PATH + '.')
+)
+
+# Fetches every rule's value in one call, for batch validation
+_field_values = attrgetter(*(path for path, _, _ in _FIELD_RULES))
+
+
+@lru_cache(maxsize=256)
+def _validate_qos(qos: 'QoSConfig') -> Tuple[str, ...]:
+    """
+    Validate QoS weights; memoized since QoSConfig is frozen and hashable.
+
+    Args:
+        qos: QoS weights to check
+
+    Returns:
+        Tuple of validation error messages
+    """
+    return tuple(message for get, is_invalid, message in _QOS_RULES if is_invalid(get(qos)))
+
+
+def _build_validation_rules() -> Tuple[Tuple[str, Any], ...]:
+    """
+    Group the per-field rules into validate() checks.
+
+    The QoS rules collapse into one check on the whole QoSConfig.
+
+    Returns:
+        Tuple of (attribute path, check) pairs, in report order
+    """
+    rules = []
+    for path, is_invalid, message in _FIELD_RULES:
+        if not path.startswith(_QOS_PATH + '.'):
+            rules.append((path, _check(is_invalid, message)))
+        elif rules[-1][0] != _QOS_PATH:
+            rules.append((_QOS_PATH, _validate_qos))
+    return tuple(rules)
+
+
+# validate() rules as (attribute path, check), in report order
+_VALIDATION_RULES = _build_validation_rules()
+
+# Fetches every validated value in one call, in rule order
+_validated_values = attrgetter(*(path for path, _ in _VALIDATION_RULES))
+_VALIDATION_CHECKS = tuple(check for _, check in _VALIDATION_RULES)
+
+# Slotted config instances (no per-instance __dict__) where supported;
+# dataclass(slots=True) needs Python 3.10+
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class _PendingConfig:
+    """Undecoded sub-config: its class and the input dict to build it from."""
+
+    __slots__ = ("config_type", "data")
+
+    def __init__(self, config_type: type, data: Dict[str, Any]):
+        self.config_type = config_type
+        self.data = data
+
+
+class _LazyConfigField:
+    """
+    Descriptor for a nested config field that may hold a _PendingConfig.
+
+    The pending value is decoded on first read and stored back, so a lazily
+    loaded config only builds the sub-configs that are actually used.
+    """
+
+    __slots__ = ("name", "slot")
+
+    def __init__(self, name: str, slot: Any):
+        self.name = name
+        # Member descriptor of a slotted class, or None when instances
+        # keep their fields in __dict__
+        self.slot = slot
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        if self.slot is not None:
+            value = self.slot.__get__(instance, owner)
+        else:
+            try:
+                value = instance.__dict__[self.name]
+            except KeyError:
+                raise AttributeError(self.name) from None
+        if type(value) is _PendingConfig:
+            value = value.config_type.from_dict(value.data)
+            self.__set__(instance, value)
+        return value
+
+    def __set__(self, instance, value):
+        if self.slot is not None:
+            self.slot.__set__(instance, value)
+        else:
+            instance.__dict__[self.name] = value
+
+
+def _to_msgpack(self) -> bytes:
+    """
+    Encode to msgpack bytes.
+
+    Returns:
+        Packed to_dict() of the config
+    """
+    if msgpack is None:
+        raise ImportError("msgpack is required for binary config encoding")
+    return msgpack.packb(self.to_dict(), use_bin_type=True)
+
+
+def _from_msgpack(cls, raw: bytes):
+    """
+    Create from msgpack bytes written by to_msgpack.
+
+    Args:
+        raw: Packed config
+
+    Returns:
+        Config instance
+    """
+    if msgpack is None:
+        raise ImportError("msgpack is required for binary config decoding")
+    return cls.from_dict(msgpack.unpackb(raw, raw=False))
+
+
+def _generate_codec(cls):
+    """
+    Attach generated to_dict/from_dict methods to a config dataclass.
+
+    The methods are compiled once per class from its fields, so a call is a
+    single dict display or constructor call instead of a loop over fields.
+    Slotted classes also get pickle state methods built the same way, and
+    every class gets to_msgpack/from_msgpack on top of the dict codec.
+    Fields typed as another config dataclass are encoded and decoded
+    through that class's own methods; from_dict defers decoding them until
+    first access unless called with eager=True.
+
+    Args:
+        cls: Config dataclass
+
+    Returns:
+        The same class
+    """
+    # Field names cached on the class, so nothing re-introspects fields()
+    cls._FIELD_NAMES = tuple(f.name for f in fields(cls))
+    # Immutable defaults merged under the input in from_dict; fields with a
+    # default_factory are left out so each instance gets a fresh value
+    cls._DEFAULTS = {}
+
+    namespace: Dict[str, Any] = {
+        "_FIELD_NAMES": cls._FIELD_NAMES,
+        "_DEFAULTS": cls._DEFAULTS,
+        "_setattr": object.__setattr__,
+        "_Pending": _PendingConfig,
+    }
+    encode = []
+    decode = []
+    for f in fields(cls):
+        name = f.name
+        if is_dataclass(f.type):
+            namespace[f"_type_{name}"] = f.type
+            default_dict = f.default.to_dict() if f.default is not MISSING else None
+            if default_dict is not None and not any(
+                isinstance(value, (dict, list)) for value in default_dict.values()
+            ):
+                # The shared default encodes to a flat dict, so a copy of it
+                # stands in for a fresh to_dict() call
+                namespace[f"_default_dict_{name}"] = default_dict
+                encode.append(
+                    f"{name!r}: (_default_dict_{name}.copy() if self.{name} is _default_{name} "
+                    f"else self.{name}.to_dict())"
+                )
+            else:
+                encode.append(f"{name!r}: self.{name}.to_dict()")
+            nested = (
+                f"(_type_{name}.from_dict(merged[{name!r}], True) if eager "
+                f"else _Pending(_type_{name}, merged[{name!r}]))"
+            )
+            if f.default is not MISSING:
+                # Shared immutable default, used as is when the key is absent
+                namespace[f"_default_{name}"] = f.default
+                nested = f"{nested} if {name!r} in merged else _default_{name}"
+            else:
+                cls._DEFAULTS[name] = {}
+            decode.append(nested)
+        elif f.default is not MISSING:
+            cls._DEFAULTS[name] = f.default
+            encode.append(f"{name!r}: self.{name}")
+            decode.append(f"merged[{name!r}]")
+        else:
+            namespace[f"_factory_{name}"] = f.default_factory
+            encode.append(f"{name!r}: self.{name}")
+            decode.append(f"merged[{name!r}] if {name!r} in merged else _factory_{name}()")
+
+    source = (
+        "def to_dict(self):\n"
+        f"    return {{{', '.join(encode)}}}\n"
+        # Positional arguments, in field order
+        "def from_dict(cls, data, eager=False):\n"
+        "    merged = {**_DEFAULTS, **data}\n"
+        f"    return cls({', '.join(decode)})\n"
+        # Pickle state of slotted instances; the dataclass default calls
+        # fields() on every get/set
+        "def __getstate__(self):\n"
+        f"    return [{', '.join(f'self.{name}' for name in cls._FIELD_NAMES)}]\n"
+        "def __setstate__(self, state):\n"
+        "    for name, value in zip(_FIELD_NAMES, state):\n"
+        "        _setattr(self, name, value)\n"
+    )
+    exec(compile(source, f"<{cls.__name__} codec>", "exec"), namespace)
+
+    for method in ("to_dict", "from_dict", "__getstate__", "__setstate__"):
+        namespace[method].__qualname__ = f"{cls.__qualname__}.{method}"
+    namespace["to_dict"].__doc__ = "Convert to dictionary."
+    namespace["from_dict"].__doc__ = "Create from dictionary."
+
+    cls.to_dict = namespace["to_dict"]
+    cls.from_dict = classmethod(namespace["from_dict"])
+    cls.to_msgpack = _to_msgpack
+    cls.from_msgpack = classmethod(_from_msgpack)
+    slotted = "__slots__" in cls.__dict__
+    for f in fields(cls):
+        if is_dataclass(f.type):
+            # Without slots the class attribute, if any, is just the default
+            slot = cls.__dict__[f.name] if slotted else None
+            setattr(cls, f.name, _LazyConfigField(f.name, slot))
+    if slotted:
+        cls.__getstate__ = namespace["__getstate__"]
+        cls.__setstate__ = namespace["__setstate__"]
+    return cls
+
+
+def _loads(raw: bytes) -> Any:
+    """
+    Parse JSON bytes, with orjson when available.
+
+    Args:
+        raw: Encoded JSON document
+
+    Returns:
+        Decoded value
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except ValueError:
+            pass  # orjson rejects the NaN/Infinity literals json.dump may write
+    return json.loads(raw)
+
+
+@lru_cache(maxsize=128)
+def _read_file(filename: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Read a whole config file; memoized on its stat so reloads skip the disk.
+
+    Args:
+        filename: Input filename
+        mtime_ns: Modification time of the file, part of the cache key
+        size: Size of the file, part of the cache key
+
+    Returns:
+        File contents
+    """
+    with open(filename, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+        return f.read()
+
+
+def _all_finite(value: Any) -> bool:
+    """
+    Check that a JSON-like value holds no NaN or infinite floats.
+
+    Args:
+        value: Dict/list/scalar structure as produced by to_dict
+
+    Returns:
+        True if every float in it is finite
+    """
+    if isinstance(value, float):
+        return math.isfinite(value)
+    if isinstance(value, dict):
+        return all(_all_finite(item) for item in value.values())
+    if isinstance(value, list):
+        return all(_all_finite(item) for item in value)
+    return True
+
+
+@_generate_codec
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class QoSConfig:
     """
     Configuration for QoS (Quality of Service) parameters.
+
+    Immutable, so a single default instance is shared by every
+    RoutingConfig that does not set its own weights.
     """
     alpha: float = 1.0  # Weight for delay
     beta: float = 1.0   # Weight for bandwidth (inverse)
     gamma: float = 1.0  # Weight for packet loss
 
-    def to_dict(self) -> Dict[str, float]:
-        """Convert to dictionary."""
-        return {
-            "alpha": self.alpha,
-            "beta": self.beta,
-            "gamma": self.gamma
-        }
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, float]) -> 'QoSConfig':
-        """Create from dictionary."""
-        return cls(
-            alpha=data.get("alpha", 1.0),
-            beta=data.get("beta", 1.0),
-            gamma=data.get("gamma", 1.0)
-        )
+_DEFAULT_QOS = QoSConfig()
 
 
-@dataclass
+@_generate_codec
+@dataclass(**_DATACLASS_OPTIONS)
 class TrafficConfig:
     """
     Configuration for traffic generation.
@@ -59,39 +418,9 @@ class TrafficConfig:
     # Poisson specific
     poisson_rate: float = 100.0    # average packets per second
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "traffic_type": self.traffic_type,
-            "load_factor": self.load_factor,
-            "packet_size": self.packet_size,
-            "duration": self.duration,
-            "cbr_rate": self.cbr_rate,
-            "burst_rate": self.burst_rate,
-            "idle_rate": self.idle_rate,
-            "burst_duration": self.burst_duration,
-            "idle_duration": self.idle_duration,
-            "poisson_rate": self.poisson_rate
-        }
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'TrafficConfig':
-        """Create from dictionary."""
-        return cls(
-            traffic_type=data.get("traffic_type", "CBR"),
-            load_factor=data.get("load_factor", 0.5),
-            packet_size=data.get("packet_size", 64),
-            duration=data.get("duration", 60.0),
-            cbr_rate=data.get("cbr_rate", 100.0),
-            burst_rate=data.get("burst_rate", 500.0),
-            idle_rate=data.get("idle_rate", 10.0),
-            burst_duration=data.get("burst_duration", 1.0),
-            idle_duration=data.get("idle_duration", 4.0),
-            poisson_rate=data.get("poisson_rate", 100.0)
-        )
-
 
-@dataclass
+@_generate_codec
+@dataclass(**_DATACLASS_OPTIONS)
 class TopologyConfig:
     """
     Configuration for network topology generation.
@@ -111,69 +440,21 @@ class TopologyConfig:
     default_bandwidth: float = 1e9   # 1 Gbps
     default_loss: float = 0.0        # packet loss probability
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "topology_type": self.topology_type,
-            "num_end_devices": self.num_end_devices,
-            "num_routers": self.num_routers,
-            "num_switches": self.num_switches,
-            "num_hubs": self.num_hubs,
-            "canvas_width": self.canvas_width,
-            "canvas_height": self.canvas_height,
-            "default_delay": self.default_delay,
-            "default_bandwidth": self.default_bandwidth,
-            "default_loss": self.default_loss
-        }
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'TopologyConfig':
-        """Create from dictionary."""
-        return cls(
-            topology_type=data.get("topology_type", "Hierarchical"),
-            num_end_devices=data.get("num_end_devices", 4),
-            num_routers=data.get("num_routers", 2),
-            num_switches=data.get("num_switches", 2),
-            num_hubs=data.get("num_hubs", 0),
-            canvas_width=data.get("canvas_width", 800),
-            canvas_height=data.get("canvas_height", 600),
-            default_delay=data.get("default_delay", 10.0),
-            default_bandwidth=data.get("default_bandwidth", 1e9),
-            default_loss=data.get("default_loss", 0.0)
-        )
-
 
-@dataclass
+@_generate_codec
+@dataclass(**_DATACLASS_OPTIONS)
 class RoutingConfig:
     """
     Configuration for routing algorithms.
     """
     algorithm: str = "dijkstra"  # dijkstra, astar, bellman_ford, rip
-    qos_weights: QoSConfig = field(default_factory=QoSConfig)
+    qos_weights: QoSConfig = _DEFAULT_QOS
     convergence_timeout: float = 30.0  # seconds
     update_interval: float = 10.0      # seconds for dynamic protocols
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "algorithm": self.algorithm,
-            "qos_weights": self.qos_weights.to_dict(),
-            "convergence_timeout": self.convergence_timeout,
-            "update_interval": self.update_interval
-        }
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'RoutingConfig':
-        """Create from dictionary."""
-        return cls(
-            algorithm=data.get("algorithm", "dijkstra"),
-            qos_weights=QoSConfig.from_dict(data.get("qos_weights", {})),
-            convergence_timeout=data.get("convergence_timeout", 30.0),
-            update_interval=data.get("update_interval", 10.0)
-        )
-
-
-@dataclass
+@_generate_codec
+@dataclass(**_DATACLASS_OPTIONS)
 class FailureConfig:
     """
     Configuration for failure simulation.
@@ -184,29 +465,9 @@ class FailureConfig:
     mean_failure_duration: float = 60.0  # seconds
     recovery_probability: float = 0.1   # probability per time step
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "enable_link_failures": self.enable_link_failures,
-            "enable_node_failures": self.enable_node_failures,
-            "failure_probability": self.failure_probability,
-            "mean_failure_duration": self.mean_failure_duration,
-            "recovery_probability": self.recovery_probability
-        }
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'FailureConfig':
-        """Create from dictionary."""
-        return cls(
-            enable_link_failures=data.get("enable_link_failures", False),
-            enable_node_failures=data.get("enable_node_failures", False),
-            failure_probability=data.get("failure_probability", 0.01),
-            mean_failure_duration=data.get("mean_failure_duration", 60.0),
-            recovery_probability=data.get("recovery_probability", 0.1)
-        )
-
-
-@dataclass
+@_generate_codec
+@dataclass(**_DATACLASS_OPTIONS)
 class AttackConfig:
     """
     Configuration for attack simulation.
@@ -217,29 +478,9 @@ class AttackConfig:
     mean_attack_duration: float = 30.0  # seconds
     attack_intensity: float = 0.5       # attack strength (0.0 to 1.0)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "enable_attacks": self.enable_attacks,
-            "attack_types": self.attack_types,
-            "attack_probability": self.attack_probability,
-            "mean_attack_duration": self.mean_attack_duration,
-            "attack_intensity": self.attack_intensity
-        }
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'AttackConfig':
-        """Create from dictionary."""
-        return cls(
-            enable_attacks=data.get("enable_attacks", False),
-            attack_types=data.get("attack_types", ["link_flooding"]),
-            attack_probability=data.get("attack_probability", 0.005),
-            mean_attack_duration=data.get("mean_attack_duration", 30.0),
-            attack_intensity=data.get("attack_intensity", 0.5)
-        )
-
 
-@dataclass
+@_generate_codec
+@dataclass(**_DATACLASS_OPTIONS)
 class SimulationConfig:
     """
     Main configuration class for network simulations.
@@ -265,45 +506,6 @@ class SimulationConfig:
     enable_visualization: bool = True
     animation_speed: float = 1.0  # multiplier for animation speed
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert configuration to dictionary."""
-        return {
-            "name": self.name,
-            "description": self.description,
-            "topology": self.topology.to_dict(),
-            "routing": self.routing.to_dict(),
-            "traffic": self.traffic.to_dict(),
-            "failure": self.failure.to_dict(),
-            "attack": self.attack.to_dict(),
-            "duration": self.duration,
-            "time_step": self.time_step,
-            "random_seed": self.random_seed,
-            "output_dir": self.output_dir,
-            "log_level": self.log_level,
-            "enable_visualization": self.enable_visualization,
-            "animation_speed": self.animation_speed
-        }
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'SimulationConfig':
-        """Create configuration from dictionary."""
-        return cls(
-            name=data.get("name", "default_simulation"),
-            description=data.get("description", ""),
-            topology=TopologyConfig.from_dict(data.get("topology", {})),
-            routing=RoutingConfig.from_dict(data.get("routing", {})),
-            traffic=TrafficConfig.from_dict(data.get("traffic", {})),
-            failure=FailureConfig.from_dict(data.get("failure", {})),
-            attack=AttackConfig.from_dict(data.get("attack", {})),
-            duration=data.get("duration", 60.0),
-            time_step=data.get("time_step", 0.1),
-            random_seed=data.get("random_seed"),
-            output_dir=data.get("output_dir", "output"),
-            log_level=data.get("log_level", "INFO"),
-            enable_visualization=data.get("enable_visualization", True),
-            animation_speed=data.get("animation_speed", 1.0)
-        )
-
     def save_to_file(self, filename: str):
         """
         Save configuration to JSON file.
@@ -312,23 +514,83 @@ class SimulationConfig:
             filename: Output filename
         """
         data = self.to_dict()
-        with open(filename, 'w') as f:
+        # orjson writes NaN/Infinity as null, so such configs keep the stdlib path
+        if orjson is not None and _all_finite(data):
+            with open(filename, 'wb', buffering=_IO_BUFFER_SIZE) as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            return
+
+        with open(filename, 'w', buffering=_IO_BUFFER_SIZE) as f:
             json.dump(data, f, indent=2)
 
+    @staticmethod
+    def save_many(configs: List['SimulationConfig'], filename: str):
+        """
+        Save several configurations to a JSON Lines file, one per line.
+
+        Args:
+            configs: Configurations to save
+            filename: Output filename
+        """
+        with open(filename, 'wb', buffering=_IO_BUFFER_SIZE) as f:
+            for config in configs:
+                data = config.to_dict()
+                if orjson is not None and _all_finite(data):
+                    f.write(orjson.dumps(data))
+                else:
+                    f.write(json.dumps(data).encode())
+                f.write(b"\n")
+
+    @classmethod
+    def load_many(cls, filename: str) -> List['SimulationConfig']:
+        """
+        Load configurations saved by save_many.
+
+        Args:
+            filename: Input filename
+
+        Returns:
+            List of SimulationConfig instances
+        """
+        configs = []
+        with open(filename, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+            for line in f:
+                if line.strip():
+                    configs.append(cls.from_dict(_loads(line)))
+        return configs
+
     @classmethod
-    def load_from_file(cls, filename: str) -> 'SimulationConfig':
+    def load_from_file(cls, filename: str, use_cache: bool = True) -> 'SimulationConfig':
         """
         Load configuration from JSON file.
 
         Args:
             filename: Input filename
+            use_cache: Reuse the contents of an earlier read of the file if
+                its modification time and size are unchanged
+
+        Returns:
+            SimulationConfig instance
+        """
+        if use_cache:
+            stat = os.stat(filename)
+            return cls.load_from_bytes(_read_file(filename, stat.st_mtime_ns, stat.st_size))
+
+        with open(filename, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+            return cls.load_from_bytes(f.read())
+
+    @classmethod
+    def load_from_bytes(cls, raw: bytes) -> 'SimulationConfig':
+        """
+        Load configuration from an in-memory JSON document.
+
+        Args:
+            raw: Encoded JSON document, as written by save_to_file
 
         Returns:
             SimulationConfig instance
         """
-        with open(filename, 'r') as f:
-            data = json.load(f)
-        return cls.from_dict(data)
+        return cls.from_dict(_loads(raw))
 
     @classmethod
     def create_default(cls) -> 'SimulationConfig':
@@ -369,51 +631,80 @@ class SimulationConfig:
         config.duration = 90.0
         return config
 
-    def validate(self) -> List[str]:
+    def validate(self, use_cache: bool = True) -> List[str]:
         """
         Validate the configuration for consistency.
 
+        Args:
+            use_cache: Reuse the result of an earlier validation of the
+                same values
+
         Returns:
             List of validation error messages (empty if valid)
         """
-        errors = []
-
-        # Validate topology
-        if self.topology.num_end_devices < 0:
-            errors.append("Number of end devices must be non-negative")
-        if self.topology.num_routers < 0:
-            errors.append("Number of routers must be non-negative")
-        if self.topology.num_switches < 0:
-            errors.append("Number of switches must be non-negative")
-        if self.topology.num_hubs < 0:
-            errors.append("Number of hubs must be non-negative")
-
-        # Validate QoS weights
-        if self.routing.qos_weights.alpha < 0:
-            errors.append("QoS alpha weight must be non-negative")
-        if self.routing.qos_weights.beta < 0:
-            errors.append("QoS beta weight must be non-negative")
-        if self.routing.qos_weights.gamma < 0:
-            errors.append("QoS gamma weight must be non-negative")
-
-        # Validate traffic
-        if self.traffic.load_factor < 0 or self.traffic.load_factor > 1:
-            errors.append("Traffic load factor must be between 0 and 1")
-        if self.traffic.duration <= 0:
-            errors.append("Simulation duration must be positive")
-
-        # Validate probabilities
-        if not (0 <= self.failure.failure_probability <= 1):
-            errors.append("Failure probability must be between 0 and 1")
-        if not (0 <= self.failure.recovery_probability <= 1):
-            errors.append("Recovery probability must be between 0 and 1")
-        if not (0 <= self.attack.attack_probability <= 1):
-            errors.append("Attack probability must be between 0 and 1")
-        if not (0 <= self.attack.attack_intensity <= 1):
-            errors.append("Attack intensity must be between 0 and 1")
+        key = None
+        if use_cache:
+            key = self._validation_key()
+            cached = _VALIDATION_CACHE.get(key)
+            if cached is not None:
+                return list(cached)
+
+        errors = self._run_validation()
+
+        if key is not None:
+            if len(_VALIDATION_CACHE) >= _VALIDATION_CACHE_MAX:
+                _VALIDATION_CACHE.clear()
+            _VALIDATION_CACHE[key] = errors
+            return list(errors)
+        return errors
+
+    @staticmethod
+    def validate_many(configs: List['SimulationConfig']) -> List[List[str]]:
+        """
+        Validate a batch of configurations at once.
+
+        The checked fields are stacked into one array and every rule is
+        applied to a whole column, so the per-config work is a single
+        attribute fetch.
+
+        Args:
+            configs: Configurations to validate
 
+        Returns:
+            Validation error messages for each configuration, in input order
+        """
+        errors: List[List[str]] = [[] for _ in configs]
+        if not errors:
+            return errors
+
+        values = np.array([_field_values(config) for config in configs], dtype=np.float64)
+        for column, (_, is_invalid, message) in zip(values.T, _FIELD_RULES):
+            for index in np.flatnonzero(is_invalid(column)):
+                errors[index].append(message)
         return errors
 
+    def _validation_key(self) -> tuple:
+        """
+        Collect the values validate() checks, as a cache key.
+
+        Returns:
+            Tuple of the validated field values
+        """
+        return _validated_values(self)
+
+    def _run_validation(self) -> List[str]:
+        """
+        Run the validation checks without consulting the cache.
+
+        Returns:
+            List of validation error messages (empty if valid)
+        """
+        return [
+            message
+            for value, check in zip(_validated_values(self), _VALIDATION_CHECKS)
+            for message in check(value)
+        ]
+
     def __str__(self) -> str:
         """String representation of the configuration."""
         return f"SimulationConfig(name='{self.name}', topology='{self.topology.topology_type}', duration={self.duration}s)"
@@ -7,9 +7,52 @@ This module provides various algorithms for generating network topologies.
 import random
 import math
 import re
-from typing import List, Tuple, Dict, Optional, Any
+from collections import deque
+from typing import Callable, List, Tuple, Dict, Optional, Any
+import numpy as np  # pyright: ignore[reportMissingModuleSource]
 from src.core import Topology, Node, Link
 
+# Optional KD-tree for nearest-node queries; without SciPy a linear scan is used
+try:
+    from scipy.spatial import cKDTree  # pyright: ignore[reportMissingModuleSource]
+except ImportError:
+    cKDTree = None
+
+# Optional JIT for the linear nearest-node scan
+try:
+    from numba import njit  # pyright: ignore[reportMissingModuleSource]
+except ImportError:
+    njit = None
+
+
+def _nearest_index(px: float, py: float, xs: np.ndarray, ys: np.ndarray) -> int:
+    """
+    Linear nearest-point scan over coordinate arrays.
+
+    Compares the same rounded Euclidean distances as the Python scan, so
+    ties resolve to the earliest point.
+
+    Args:
+        px: Query x
+        py: Query y
+        xs: Candidate x coordinates (non-empty)
+        ys: Candidate y coordinates
+
+    Returns:
+        Index of the nearest candidate
+    """
+    best = 0
+    best_distance = np.inf
+    for i in range(xs.shape[0]):
+        d = math.sqrt((px - xs[i]) ** 2 + (py - ys[i]) ** 2)
+        if d < best_distance:
+            best_distance = d
+            best = i
+    return best
+
+
+_nearest_index_jit = njit(cache=True)(_nearest_index) if njit is not None else None
+
 
 class TopologyGenerator:
     """
@@ -26,6 +69,26 @@ class TopologyGenerator:
         if random_seed is not None:
             random.seed(random_seed)
 
+    def _circle_coordinates(self, count: int, angle_step: float, center_x: float,
+                            center_y: float, radius: float) -> List[Tuple[int, int]]:
+        """
+        Compute evenly stepped positions on a circle in one vectorized pass.
+
+        Args:
+            count: Number of positions
+            angle_step: Angle between consecutive positions (radians)
+            center_x: Circle center x
+            center_y: Circle center y
+            radius: Circle radius
+
+        Returns:
+            List of (x, y) integer coordinates, truncated like int()
+        """
+        angles = np.arange(count) * angle_step
+        xs = np.trunc(center_x + radius * np.cos(angles)).astype(np.int64).tolist()
+        ys = np.trunc(center_y + radius * np.sin(angles)).astype(np.int64).tolist()
+        return list(zip(xs, ys))
+
     def _assign_ip_addresses(self, topology: Topology):
         """
         Assign IP addresses and gateways to nodes based on connectivity.
@@ -44,13 +107,16 @@ class TopologyGenerator:
                     host_idx += 1
             return
 
+        # Adjacency index and node types up front; the walk below works on IDs
+        adj = topology.get_adjacency()
+        type_of = {nid: node.node_type for nid, node in topology.nodes.items()}
+
         # Assign subnets to router interfaces
         visited_switches = set()
         
         for router in routers:
-            neighbors = topology.get_neighbors(router.node_id)
-            for neighbor in neighbors:
-                if neighbor.node_type in ["switch", "hub"] and neighbor.node_id not in visited_switches:
+            for neighbor_id in adj[router.node_id]:
+                if type_of[neighbor_id] in ("switch", "hub") and neighbor_id not in visited_switches:
                     # New subnet for this switch segment
                     subnet = f"192.168.{subnet_idx}"
                     subnet_idx += 1
@@ -62,28 +128,28 @@ class TopologyGenerator:
                     router.interfaces[intf_name] = {"ip": router_ip, "mask": "255.255.255.0"}
                     
                     # BFS/DFS to find all downstream hosts from this switch
-                    queue = [neighbor]
-                    visited_switches.add(neighbor.node_id)
+                    queue = deque([neighbor_id])
+                    visited_switches.add(neighbor_id)
                     host_idx = 2
                     
-                    segment_visited = {neighbor.node_id}
+                    segment_visited = {neighbor_id}
                     
                     while queue:
-                        curr = queue.pop(0)
-                        curr_neighbors = topology.get_neighbors(curr.node_id)
+                        curr_id = queue.popleft()
                         
-                        for n in curr_neighbors:
-                            if n.node_id in segment_visited: continue
-                            if n.node_type == "router": continue # Don't cross routers
+                        for nid in adj[curr_id]:
+                            if nid in segment_visited: continue
+                            n_type = type_of[nid]
+                            if n_type == "router": continue # Don't cross routers
                             
-                            segment_visited.add(n.node_id)
+                            segment_visited.add(nid)
                             
-                            if n.node_type == "host":
-                                n.interfaces = {"eth0": {"ip": f"{subnet}.{host_idx}", "mask": "255.255.255.0", "gateway": router_ip}}
+                            if n_type == "host":
+                                topology.nodes[nid].interfaces = {"eth0": {"ip": f"{subnet}.{host_idx}", "mask": "255.255.255.0", "gateway": router_ip}}
                                 host_idx += 1
-                            elif n.node_type in ["switch", "hub"]:
-                                visited_switches.add(n.node_id)
-                                queue.append(n)
+                            elif n_type in ("switch", "hub"):
+                                visited_switches.add(nid)
+                                queue.append(nid)
 
     def validate_topology(self, topology: Topology) -> List[str]:
         """
@@ -98,23 +164,28 @@ class TopologyGenerator:
         if not topology.is_connected():
             warnings.append("Topology is not fully connected (isolated islands exist).")
 
+        adj = topology.get_adjacency()
+
         # Check isolated nodes
         for node_id in topology.nodes:
-            if not topology.get_neighbors(node_id):
+            if not adj[node_id]:
                 warnings.append(f"Node {node_id} is isolated.")
 
         # Check Switches without uplinks (to routers)
         routers = [n.node_id for n in topology.nodes.values() if n.node_type == "router"]
         if routers:
+            # One BFS from all routers at once marks every node with a path to one
+            reachable = set(routers)
+            queue = deque(routers)
+            while queue:
+                for nid in adj[queue.popleft()]:
+                    if nid not in reachable:
+                        reachable.add(nid)
+                        queue.append(nid)
+
             for node in topology.nodes.values():
-                if node.node_type == "switch":
-                    has_path = False
-                    for r in routers:
-                        if topology.get_shortest_path(node.node_id, r):
-                            has_path = True
-                            break
-                    if not has_path:
-                        warnings.append(f"Switch {node.node_id} has no path to a router.")
+                if node.node_type == "switch" and node.node_id not in reachable:
+                    warnings.append(f"Switch {node.node_id} has no path to a router.")
 
         return warnings
 
@@ -366,11 +437,10 @@ class TopologyGenerator:
         if n_spokes > 0:
             radius = min(250, center_y - 50)
             angle_step = (2 * math.pi) / n_spokes
+            coords = self._circle_coordinates(n_spokes, angle_step, center_x, center_y, radius)
 
             for i, name in enumerate(other_devices):
-                angle = angle_step * i
-                x = int(center_x + radius * math.cos(angle))
-                y = int(center_y + radius * math.sin(angle))
+                x, y = coords[i]
 
                 # Determine node type
                 if name.startswith("PC"):
@@ -454,12 +524,11 @@ class TopologyGenerator:
         n_ring = len(ring_devices)
         radius = 150
         angle_step = (2 * math.pi) / n_ring
+        coords = self._circle_coordinates(n_ring, angle_step, center_x, center_y, radius)
 
         # Place ring devices
         for i, name in enumerate(ring_devices):
-            angle = angle_step * i
-            x = int(center_x + radius * math.cos(angle))
-            y = int(center_y + radius * math.sin(angle))
+            x, y = coords[i]
 
             node_type = "router" if name.startswith("R") else "switch"
             node = Node(name, node_type, (x, y))
@@ -492,18 +561,18 @@ class TopologyGenerator:
         n_other = len(other_devices)
         radius_outer = 250
         angle_step_outer = (2 * math.pi) / n_other
+        coords = self._circle_coordinates(n_other, angle_step_outer, center_x, center_y, radius_outer)
+        find_nearest_ring = self._nearest_node_finder(topology, ring_devices)
 
         for i, name in enumerate(other_devices):
-            angle = angle_step_outer * i
-            x = int(center_x + radius_outer * math.cos(angle))
-            y = int(center_y + radius_outer * math.sin(angle))
+            x, y = coords[i]
 
             node_type = "hub" if name.startswith("Hub") else "server" if name.startswith("Server") else "host"
             node = Node(name, node_type, (x, y))
             topology.add_node(node)
 
             # Connect to nearest ring device
-            nearest_ring = self._find_nearest_node(topology, name, ring_devices)
+            nearest_ring = find_nearest_ring(name)
             if nearest_ring:
                 link = Link(name, nearest_ring)
                 topology.add_link(link)
@@ -564,22 +633,19 @@ class TopologyGenerator:
         n_ring = num_routers
         radius = 150
         angle_step = (2 * math.pi) / n_ring
+        coords = self._circle_coordinates(n_ring, angle_step, center_x, center_y, radius)
 
-        # Place routers in a circle and connect all pairs
+        # Place routers in a circle
         for i in range(num_routers):
             name = f"R{i}"
-            angle = angle_step * i
-            x = int(center_x + radius * math.cos(angle))
-            y = int(center_y + radius * math.sin(angle))
+            x, y = coords[i]
 
             router = Node(name, "router", (x, y))
             topology.add_node(router)
             routers.append(name)
 
-            # Connect to all previous routers
-            for j in range(i):
-                link = Link(name, routers[j])
-                topology.add_link(link)
+        # Connect every router to all previous ones in a single batch
+        topology.extend_links([Link(routers[i], routers[j]) for i in range(num_routers) for j in range(i)])
         
         # Connect FW to Mesh (e.g., R0)
         if fws and routers:
@@ -597,18 +663,19 @@ class TopologyGenerator:
         if n_lan > 0:
             radius_lan = 250
             angle_step_lan = (2 * math.pi) / n_lan
+            coords = self._circle_coordinates(n_lan, angle_step_lan, center_x, center_y, radius_lan)
+            existing_ids = set(topology.nodes)
 
             for i, name in enumerate(lan_devices):
-                if name in [r.node_id for r in topology.get_all_nodes()]:
+                if name in existing_ids:
                     continue  # Already a router
 
-                angle = angle_step_lan * i
-                x = int(center_x + radius_lan * math.cos(angle))
-                y = int(center_y + radius_lan * math.sin(angle))
+                x, y = coords[i]
 
                 node_type = "switch" if name.startswith("Switch") else "hub"
                 node = Node(name, node_type, (x, y))
                 topology.add_node(node)
+                existing_ids.add(name)
 
                 # Connect to a router
                 router = routers[i % num_routers]
@@ -619,12 +686,11 @@ class TopologyGenerator:
         if num_pcs > 0 and n_lan > 0:
             radius_pc = 350
             angle_step_pc = (2 * math.pi) / num_pcs
+            coords = self._circle_coordinates(num_pcs, angle_step_pc, center_x, center_y, radius_pc)
 
             for i in range(num_pcs):
                 name = f"PC{i}"
-                angle = angle_step_pc * i
-                x = int(center_x + radius_pc * math.cos(angle))
-                y = int(center_y + radius_pc * math.sin(angle))
+                x, y = coords[i]
 
                 pc = Node(name, "host", (x, y))
                 topology.add_node(pc)
@@ -636,10 +702,11 @@ class TopologyGenerator:
         
         # Place Servers (connected to routers for mesh)
         if num_servers > 0:
+            # Random-ish placement: one radian apart
+            coords = self._circle_coordinates(num_servers, 1.0, center_x, center_y, 300)
             for i in range(num_servers):
                 name = f"Server{i}"
-                x = int(center_x + 300 * math.cos(i)) # Random-ish placement
-                y = int(center_y + 300 * math.sin(i))
+                x, y = coords[i]
                 node = Node(name, "server", (x, y))
                 topology.add_node(node)
                 topology.add_link(Link(name, routers[i % len(routers)]))
@@ -707,14 +774,15 @@ class TopologyGenerator:
         y_offset = 150
         for i in range(1, num_routers):
             name = f"R{i}"
-            level = int(math.log2(i + 1))
+            level = (i + 1).bit_length() - 1
             y = 150 + level * 100
 
             # Calculate horizontal position
-            level_start = 2 ** level - 1
-            level_count = min(2 ** level, num_routers - level_start)
+            level_width = 1 << level
+            level_start = level_width - 1
+            level_count = min(level_width, num_routers - level_start)
             index_in_level = i - level_start
-            spacing = 500 / (2 ** level) if level > 0 else 0
+            spacing = 500 / level_width if level > 0 else 0
             x = center_x + (index_in_level - (level_count - 1) / 2) * spacing
 
             router = Node(name, "router", (x, y))
@@ -761,6 +829,7 @@ class TopologyGenerator:
 
         # Add PCs at the bottom
         pc_y = 500
+        find_nearest = self._nearest_node_finder(topology, lan_devices if lan_devices else leaf_routers)
         for i in range(num_pcs):
             name = f"PC{i}"
             pc_spacing = (canvas_width - 100) / max(1, num_pcs - 1) if num_pcs > 1 else 0
@@ -770,10 +839,7 @@ class TopologyGenerator:
             topology.add_node(pc)
 
             # Connect to nearest LAN device or leaf router
-            if lan_devices:
-                nearest = self._find_nearest_node(topology, name, lan_devices)
-            else:
-                nearest = self._find_nearest_node(topology, name, leaf_routers)
+            nearest = find_nearest(name)
 
             if nearest:
                 link = Link(name, nearest)
@@ -993,22 +1059,74 @@ class TopologyGenerator:
         Returns:
             Nearest node ID or None
         """
-        target_coords = topology.get_node_coordinates(target_node)
-        if not target_coords:
-            return None
+        return self._nearest_node_finder(topology, candidate_nodes)(target_node)
 
-        min_distance = float('inf')
-        nearest = None
+    def _nearest_node_finder(self, topology: Topology,
+                             candidate_nodes: List[str]) -> Callable[[str], Optional[str]]:
+        """
+        Build a nearest-candidate lookup for repeated queries.
 
+        The candidates are indexed once (in a KD-tree when SciPy is
+        available, else as arrays for a Numba-compiled scan), so placing
+        many nodes against the same candidates does not redo the setup per
+        query. Candidate coordinates must not change
+        while the lookup is in use. Ties go to the earliest candidate.
+
+        Args:
+            topology: Network topology
+            candidate_nodes: List of candidate node IDs
+
+        Returns:
+            Function mapping a target node ID to the nearest candidate ID,
+            or None
+        """
+        located = []
         for candidate in candidate_nodes:
             candidate_coords = topology.get_node_coordinates(candidate)
             if candidate_coords:
-                distance = math.sqrt(
-                    (target_coords[0] - candidate_coords[0]) ** 2 +
-                    (target_coords[1] - candidate_coords[1]) ** 2
-                )
-                if distance < min_distance:
-                    min_distance = distance
-                    nearest = candidate
-
-        return nearest
+                located.append((candidate, candidate_coords))
+
+        def distance(a, b) -> float:
+            return math.sqrt((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2)
+
+        if cKDTree is None and _nearest_index_jit is not None and located:
+            xs = np.array([coords[0] for _, coords in located], dtype=np.float64)
+            ys = np.array([coords[1] for _, coords in located], dtype=np.float64)
+
+            def find(target_node: str) -> Optional[str]:
+                target_coords = topology.get_node_coordinates(target_node)
+                if not target_coords:
+                    return None
+                return located[_nearest_index_jit(float(target_coords[0]), float(target_coords[1]), xs, ys)][0]
+            return find
+
+        if cKDTree is None or not located:
+            def find(target_node: str) -> Optional[str]:
+                target_coords = topology.get_node_coordinates(target_node)
+                if not target_coords:
+                    return None
+
+                min_distance = float('inf')
+                nearest = None
+                for candidate, candidate_coords in located:
+                    d = distance(target_coords, candidate_coords)
+                    if d < min_distance:
+                        min_distance = d
+                        nearest = candidate
+                return nearest
+            return find
+
+        tree = cKDTree(np.array([coords for _, coords in located], dtype=np.float64))
+
+        def find(target_node: str) -> Optional[str]:
+            target_coords = topology.get_node_coordinates(target_node)
+            if not target_coords:
+                return None
+
+            d, _ = tree.query(target_coords)
+            # Re-rank everything at (about) the nearest distance with the
+            # exact formula, so ties resolve to the earliest candidate
+            close = tree.query_ball_point(target_coords, d * (1 + 1e-9) + 1e-9)
+            best = min(close, key=lambda k: (distance(target_coords, located[k][1]), k))
+            return located[best][0]
+        return find
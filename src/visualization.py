@@ -10,6 +10,7 @@ import networkx as nx # pyright: ignore[reportMissingModuleSource]
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg # pyright: ignore[reportMissingModuleSource]
 import tkinter as tk
 from tkinter import ttk
+import tkinter.font as tkfont
 from typing import Dict, List, Tuple, Optional, Any, Set
 import time
 import threading
@@ -23,6 +24,10 @@ class NetworkVisualizer:
     Visualizes network topology and traffic.
     """
 
+    # Named label fonts shared by every visualizer on the same Tk interpreter,
+    # so Tk resolves each font once instead of parsing a description per item
+    _fonts = {}
+
     def __init__(self, topology, canvas=None, tag_prefix="node", theme=None):
         """
         Initialize network visualizer.
@@ -56,6 +61,10 @@ class NetworkVisualizer:
         self.dragged_node = None
         self.link_items = {}  # link_key -> line_item_id
         self.link_label_items = {}  # link_key -> label_item_id
+        self.link_glow_items = {}  # link_key -> glow_item_id (optimal path only)
+        self.node_items = {}  # node_id -> [item_id, ...] for icon and label
+        self.culled_nodes = set()  # node IDs skipped by the last draw (off-screen)
+        self.culled_links = set()  # link keys skipped by the last draw (off-screen)
         self.last_mouse_pos = (0, 0) # Store last mouse position for dragging
 
         # Default colors
@@ -135,6 +144,11 @@ class NetworkVisualizer:
         self.canvas.delete("all")
         self.link_items = {}
         self.link_label_items = {}
+        self.link_glow_items = {}
+        self.node_items = {}
+        self.culled_nodes = set()
+        self.culled_links = set()
+        view = self._visible_bounds()
 
         # Draw links
         drawn_links = set()
@@ -149,90 +163,15 @@ class NetworkVisualizer:
             if not pos_a or not pos_b:
                 continue
 
-            # Get link properties
-            link = self.topology.get_link(node_a, node_b)
-            if link:
-                delay = link.delay
-                bandwidth = link.bandwidth / 1e6  # Convert to Mbps
-                loss = link.loss * 100  # Convert to percentage
-                is_broken = not link.status or (failed_links and link_key in failed_links)
-                is_inferred = link.is_inferred
-            else:
-                delay, bandwidth, loss = 10.0, 1000.0, 0.0
-                is_broken = failed_links and link_key in failed_links
-
-            # Determine link color and style
-            link_tag = f"link_{'_'.join(sorted(link_key))}"
-            color = self.theme["link_inactive"] # Default non-optimal
-            width = 1
-            dash = None
-
-            if is_broken:
-                color = self.link_colors["broken"]
-                dash = (5, 5)  # Dashed line
-                width = 2
-            else:
-                # Congestion Visualization
-                if link_utilization and link_key in link_utilization:
-                    util = link_utilization[link_key]
-                    if util > 0.8: color = "red"
-                    elif util > 0.5: color = "orange"
-                    elif util > 0.0: color = "green"
-
-                # Check if link is in optimal path
-                is_optimal = False
-                if optimal_path:
-                    for i in range(len(optimal_path) - 1):
-                        if (optimal_path[i] == node_a and optimal_path[i+1] == node_b) or \
-                           (optimal_path[i] == node_b and optimal_path[i+1] == node_a):
-                            is_optimal = True
-                            break
-
-                is_highlighted = False
-                if not is_optimal and highlight_paths:
-                    for path in highlight_paths:
-                        for i in range(len(path) - 1):
-                            if (path[i] == node_a and path[i+1] == node_b) or \
-                               (path[i] == node_b and path[i+1] == node_a):
-                                is_highlighted = True
-                                break
-
-                if is_optimal:
-                    # Glow effect (thick transparent-like line behind)
-                    self.canvas.create_line(pos_a[0], pos_a[1], pos_b[0], pos_b[1],
-                                          fill=self.theme["glow"], width=8, tags=(link_tag, "glow"))
-                    color = optimal_color
-                    width = 4
-                elif is_inferred:
-                    dash = (4, 4)  # Dashed line for inferred access links
-                    color = "gray60"
-                    width = 1
-                elif is_highlighted:
-                    color = "red"
-                    width = 1
-
-            # Draw link line
-            line_item = self.canvas.create_line(pos_a[0], pos_a[1], pos_b[0], pos_b[1],
-                                              fill=color, width=width, dash=dash, tags=(link_tag,))
-            self.link_items[link_key] = line_item
-
-            if show_link_labels:
-                # Draw link metrics at midpoint
-                mid_x = (pos_a[0] + pos_b[0]) / 2
-                mid_y = (pos_a[1] + pos_b[1]) / 2
-                
-                cost_str = ""
-                if link_costs and link_key in link_costs:
-                    cost_str = f"\nCost: {link_costs[link_key]:.1f}"
-                
-                bw_str = f"{bandwidth:.0f}M" if bandwidth < 1000 else f"{bandwidth/1000:.1f}G"
-                metrics_text = f"D:{delay:.0f}ms B:{bw_str} L:{loss:.1f}%{cost_str}"
-                
-                label_tag = f"link_label_{'_'.join(sorted(link_key))}"
-                label_item = self.canvas.create_text(mid_x, mid_y, text=metrics_text,
-                                                   font=("Arial", 7), fill=self.theme["link_text"], justify="center", tags=(label_tag,))
-                self.link_label_items[link_key] = label_item
+            # Skip links whose bounding box lies entirely outside the viewport
+            if view and (max(pos_a[0], pos_b[0]) < view[0] or min(pos_a[0], pos_b[0]) > view[2] or
+                         max(pos_a[1], pos_b[1]) < view[1] or min(pos_a[1], pos_b[1]) > view[3]):
+                self.culled_links.add(link_key)
+                drawn_links.add(link_key)
+                continue
 
+            self._draw_link(node_a, node_b, link_key, pos_a, pos_b, highlight_paths, failed_links, link_costs,
+                            optimal_path, optimal_color, link_utilization, show_link_labels)
             drawn_links.add(link_key)
 
         # Draw nodes
@@ -241,29 +180,233 @@ class NetworkVisualizer:
             if not node:
                 continue
 
-            # Draw device icon based on type
-            is_highlighted = highlight_nodes and node_id in highlight_nodes
-            self._draw_device_icon(node, pos, highlight=is_highlighted)
-
-            # Draw Queue Bar
-            if node_queues and node_id in node_queues:
-                q_level = node_queues[node_id]
-                bar_x = pos[0] + 20
-                bar_y = pos[1] - 15
-                bar_h = 30
-                bar_w = 6
-                
-                # Background
-                self.canvas.create_rectangle(bar_x, bar_y, bar_x + bar_w, bar_y + bar_h, fill=self.theme["queue_bg"], outline=self.theme["queue_outline"])
-                # Fill
-                fill_h = bar_h * min(max(q_level, 0), 1)
-                fill_color = "green" if q_level < 0.5 else "orange" if q_level < 0.8 else "red"
-                self.canvas.create_rectangle(bar_x, bar_y + (bar_h - fill_h), bar_x + bar_w, bar_y + bar_h, fill=fill_color, outline="")
-
-            # Node label near the icon
-            device_tag = f"device_{node_id}"
-            self.canvas.create_text(pos[0], pos[1] + 35, text=node_id, fill=self.theme["text"],
-                                  font=("Arial", 9, "bold"), tags=("device", device_tag, node.node_id))
+            if view and not (view[0] <= pos[0] <= view[2] and view[1] <= pos[1] <= view[3]):
+                self.culled_nodes.add(node_id)
+                continue
+
+            self._draw_node(node, pos, node_queues, highlight_nodes)
+
+    def draw_node(self, node):
+        """
+        Add a node to the topology and draw it without redrawing the rest of the canvas.
+
+        Args:
+            node: Node object, positioned at its coordinates
+        """
+        self.topology.add_node(node)
+        self.node_positions[node.node_id] = node.coordinates
+        if self.canvas:
+            self._draw_node(node, node.coordinates)
+
+    def draw_link(self, link, link_cost=None):
+        """
+        Add a link to the topology and draw it beneath the existing nodes.
+
+        Args:
+            link: Link object
+            link_cost: Cost shown in the link label, if any
+        """
+        self.topology.add_link(link)
+        link_key = tuple(sorted((link.node_a, link.node_b)))
+        pos_a = self.node_positions.get(link.node_a)
+        pos_b = self.node_positions.get(link.node_b)
+        if not self.canvas or not pos_a or not pos_b:
+            return
+
+        link_costs = {link_key: link_cost} if link_cost is not None else None
+        self._draw_link(link.node_a, link.node_b, link_key, pos_a, pos_b, link_costs=link_costs)
+
+        # Links sit below every node, as in a full redraw
+        label_item = self.link_label_items.get(link_key)
+        if label_item:
+            self.canvas.tag_lower(label_item)
+        self.canvas.tag_lower(self.link_items[link_key])
+
+    def erase_link(self, node_a, node_b):
+        """
+        Remove a link from the topology and delete its canvas items.
+
+        Args:
+            node_a: First node ID
+            node_b: Second node ID
+        """
+        self.topology.remove_link(node_a, node_b)
+        link_key = tuple(sorted((node_a, node_b)))
+        self.culled_links.discard(link_key)
+        for items in (self.link_items, self.link_label_items, self.link_glow_items):
+            item = items.pop(link_key, None)
+            if item and self.canvas:
+                self.canvas.delete(item)
+
+    def _draw_link(self, node_a, node_b, link_key, pos_a, pos_b, highlight_paths=None, failed_links=None,
+                   link_costs=None, optimal_path=None, optimal_color="green", link_utilization=None,
+                   show_link_labels=True):
+        """
+        Draw a single link line, its glow (on the optimal path) and its metrics label.
+
+        Args:
+            node_a: First endpoint
+            node_b: Second endpoint
+            link_key: Sorted (node_a, node_b) tuple
+            pos_a: Position of node_a
+            pos_b: Position of node_b
+            Remaining arguments are as for draw_topology
+        """
+        # Get link properties
+        link = self.topology.get_link(node_a, node_b)
+        if link:
+            delay = link.delay
+            bandwidth = link.bandwidth / 1e6  # Convert to Mbps
+            loss = link.loss * 100  # Convert to percentage
+            is_broken = not link.status or (failed_links and link_key in failed_links)
+            is_inferred = link.is_inferred
+        else:
+            delay, bandwidth, loss = 10.0, 1000.0, 0.0
+            is_broken = failed_links and link_key in failed_links
+
+        # Determine link color and style
+        link_tag = f"link_{'_'.join(sorted(link_key))}"
+        color = self.theme["link_inactive"] # Default non-optimal
+        width = 1
+        dash = None
+
+        if is_broken:
+            color = self.link_colors["broken"]
+            dash = (5, 5)  # Dashed line
+            width = 2
+        else:
+            # Congestion Visualization
+            if link_utilization and link_key in link_utilization:
+                util = link_utilization[link_key]
+                if util > 0.8: color = "red"
+                elif util > 0.5: color = "orange"
+                elif util > 0.0: color = "green"
+
+            # Check if link is in optimal path
+            is_optimal = False
+            if optimal_path:
+                for i in range(len(optimal_path) - 1):
+                    if (optimal_path[i] == node_a and optimal_path[i+1] == node_b) or \
+                       (optimal_path[i] == node_b and optimal_path[i+1] == node_a):
+                        is_optimal = True
+                        break
+
+            is_highlighted = False
+            if not is_optimal and highlight_paths:
+                for path in highlight_paths:
+                    for i in range(len(path) - 1):
+                        if (path[i] == node_a and path[i+1] == node_b) or \
+                           (path[i] == node_b and path[i+1] == node_a):
+                            is_highlighted = True
+                            break
+
+            if is_optimal:
+                # Glow effect (thick transparent-like line behind)
+                self.link_glow_items[link_key] = self.canvas.create_line(pos_a[0], pos_a[1], pos_b[0], pos_b[1],
+                                      fill=self.theme["glow"], width=8, tags=(link_tag, "glow"))
+                color = optimal_color
+                width = 4
+            elif is_inferred:
+                dash = (4, 4)  # Dashed line for inferred access links
+                color = "gray60"
+                width = 1
+            elif is_highlighted:
+                color = "red"
+                width = 1
+
+        # Draw link line
+        line_item = self.canvas.create_line(pos_a[0], pos_a[1], pos_b[0], pos_b[1],
+                                          fill=color, width=width, dash=dash, tags=(link_tag,))
+        self.link_items[link_key] = line_item
+
+        if show_link_labels:
+            # Draw link metrics at midpoint
+            mid_x = (pos_a[0] + pos_b[0]) / 2
+            mid_y = (pos_a[1] + pos_b[1]) / 2
+            
+            cost_str = ""
+            if link_costs and link_key in link_costs:
+                cost_str = f"\nCost: {link_costs[link_key]:.1f}"
+            
+            bw_str = f"{bandwidth:.0f}M" if bandwidth < 1000 else f"{bandwidth/1000:.1f}G"
+            metrics_text = f"D:{delay:.0f}ms B:{bw_str} L:{loss:.1f}%{cost_str}"
+            
+            label_tag = f"link_label_{'_'.join(sorted(link_key))}"
+            label_item = self.canvas.create_text(mid_x, mid_y, text=metrics_text,
+                                               font=self._font(7), fill=self.theme["link_text"], justify="center", tags=(label_tag,))
+            self.link_label_items[link_key] = label_item
+
+    def _draw_node(self, node, pos, node_queues=None, highlight_nodes=None):
+        """
+        Draw a node's icon, queue bar and name label.
+
+        Args:
+            node: Node object
+            pos: (x, y) position tuple
+            node_queues: Dictionary of node queue levels (0.0 to 1.0)
+            highlight_nodes: Set of node IDs to highlight
+        """
+        node_id = node.node_id
+
+        # Draw device icon based on type
+        is_highlighted = highlight_nodes and node_id in highlight_nodes
+        self._draw_device_icon(node, pos, highlight=is_highlighted)
+
+        # Draw Queue Bar
+        if node_queues and node_id in node_queues:
+            q_level = node_queues[node_id]
+            bar_x = pos[0] + 20
+            bar_y = pos[1] - 15
+            bar_h = 30
+            bar_w = 6
+            
+            # Background
+            self.canvas.create_rectangle(bar_x, bar_y, bar_x + bar_w, bar_y + bar_h, fill=self.theme["queue_bg"], outline=self.theme["queue_outline"])
+            # Fill
+            fill_h = bar_h * min(max(q_level, 0), 1)
+            fill_color = "green" if q_level < 0.5 else "orange" if q_level < 0.8 else "red"
+            self.canvas.create_rectangle(bar_x, bar_y + (bar_h - fill_h), bar_x + bar_w, bar_y + bar_h, fill=fill_color, outline="")
+
+        # Node label near the icon
+        device_tag = f"device_{node_id}"
+        label_item = self.canvas.create_text(pos[0], pos[1] + 35, text=node_id, fill=self.theme["text"],
+                              font=self._font(9, "bold"), tags=("device", device_tag, node.node_id))
+        self.node_items[node_id].append(label_item)
+
+    def _font(self, size, weight="normal"):
+        """
+        Get a shared Arial font for canvas text.
+
+        Args:
+            size: Point size
+            weight: "normal" or "bold"
+
+        Returns:
+            tkinter.font.Font bound to this canvas's interpreter
+        """
+        key = (id(self.canvas.tk), size, weight)
+        font = NetworkVisualizer._fonts.get(key)
+        if font is None:
+            font = tkfont.Font(root=self.canvas, family="Arial", size=size, weight=weight)
+            NetworkVisualizer._fonts[key] = font
+        return font
+
+    def _visible_bounds(self, margin=60):
+        """
+        Get the visible canvas region, padded so icons and labels near the edge still draw.
+
+        Args:
+            margin: Padding in pixels added on every side
+
+        Returns:
+            (x0, y0, x1, y1) in canvas coordinates, or None before the canvas is mapped
+        """
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            return None
+        return (self.canvas.canvasx(0) - margin, self.canvas.canvasy(0) - margin,
+                self.canvas.canvasx(width) + margin, self.canvas.canvasy(height) + margin)
 
     def _draw_device_icon(self, node, pos, highlight=False):
         """
@@ -277,120 +420,121 @@ class NetworkVisualizer:
         x, y = pos
         node_type = node.node_type
         device_tag = f"device_{node.node_id}"
+        items = self.node_items.setdefault(node.node_id, [])
 
         if highlight:
             # Draw glow effect
             glow_radius = 30
-            self.canvas.create_oval(x-glow_radius, y-glow_radius, x+glow_radius, y+glow_radius,
-                                  fill="yellow", outline="", stipple="gray50", tags=("device", device_tag, node.node_id, "glow"))
+            items.append(self.canvas.create_oval(x-glow_radius, y-glow_radius, x+glow_radius, y+glow_radius,
+                                  fill="yellow", outline="", stipple="gray50", tags=("device", device_tag, node.node_id, "glow")))
 
         if node_type == "router":
             # Router (blue, circular)
-            self.canvas.create_oval(x-22, y-22, x+22, y+22,
-                                  fill="#4da6ff", outline="black", width=2, tags=("device", device_tag, node.node_id))
+            items.append(self.canvas.create_oval(x-22, y-22, x+22, y+22,
+                                  fill="#4da6ff", outline="black", width=2, tags=("device", device_tag, node.node_id)))
             # Inner arrows symbol (simplified)
-            self.canvas.create_oval(x-15, y-15, x+15, y+15,
-                                  fill="lightblue", outline="black", width=1, tags=("device", device_tag, node.node_id))
+            items.append(self.canvas.create_oval(x-15, y-15, x+15, y+15,
+                                  fill="lightblue", outline="black", width=1, tags=("device", device_tag, node.node_id)))
             # Central dot
-            self.canvas.create_oval(x-3, y-3, x+3, y+3,
-                                  fill="black", tags=("device", device_tag, node.node_id))
+            items.append(self.canvas.create_oval(x-3, y-3, x+3, y+3,
+                                  fill="black", tags=("device", device_tag, node.node_id)))
 
         elif node_type == "switch":
             # Switch (green, rectangular)
-            self.canvas.create_rectangle(x-25, y-15, x+25, y+15,
+            items.append(self.canvas.create_rectangle(x-25, y-15, x+25, y+15,
                                        fill="#90EE90", outline="black", width=2,
-                                       tags=("device", device_tag, node.node_id))
+                                       tags=("device", device_tag, node.node_id)))
             # Port dots
             for i in range(4):
                 px = x - 18 + i * 12
-                self.canvas.create_oval(px-2, y-8, px+2, y-4,
-                                      fill="black", tags=("device", device_tag, node.node_id))
-                self.canvas.create_oval(px-2, y+4, px+2, y+8,
-                                      fill="black", tags=("device", device_tag, node.node_id))
+                items.append(self.canvas.create_oval(px-2, y-8, px+2, y-4,
+                                      fill="black", tags=("device", device_tag, node.node_id)))
+                items.append(self.canvas.create_oval(px-2, y+4, px+2, y+8,
+                                      fill="black", tags=("device", device_tag, node.node_id)))
 
         elif node_type == "host":
             # PC (gray)
             # Screen
-            self.canvas.create_rectangle(x-15, y-18, x+15, y-4,
+            items.append(self.canvas.create_rectangle(x-15, y-18, x+15, y-4,
                                        fill="#e0e0e0", outline="black", width=2,
-                                       tags=("device", device_tag, node.node_id))
+                                       tags=("device", device_tag, node.node_id)))
             # Screen content (simple lines)
-            self.canvas.create_line(x-10, y-14, x+10, y-14, fill="black", tags=("device", device_tag, node.node_id))
-            self.canvas.create_line(x-10, y-10, x+10, y-10, fill="black", tags=("device", device_tag, node.node_id))
+            items.append(self.canvas.create_line(x-10, y-14, x+10, y-14, fill="black", tags=("device", device_tag, node.node_id)))
+            items.append(self.canvas.create_line(x-10, y-10, x+10, y-10, fill="black", tags=("device", device_tag, node.node_id)))
             # Base
-            self.canvas.create_rectangle(x-10, y-4, x+10, y+6,
+            items.append(self.canvas.create_rectangle(x-10, y-4, x+10, y+6,
                                        fill="#a0a0a0", outline="black", width=1,
-                                       tags=("device", device_tag, node.node_id))
+                                       tags=("device", device_tag, node.node_id)))
 
         elif node_type == "hub":
             # Hub (orange)
-            self.canvas.create_rectangle(x-22, y-12, x+22, y+12,
+            items.append(self.canvas.create_rectangle(x-22, y-12, x+22, y+12,
                                        fill="lightyellow", outline="black", width=2,
-                                       tags=("device", device_tag, node.node_id))
+                                       tags=("device", device_tag, node.node_id)))
             # Port indicators
             for i in range(4):
                 angle = i * 90
                 px = x + 14 * (1 if i % 2 == 0 else -1)
                 py = y + 14 * (1 if i < 2 else -1)
-                self.canvas.create_oval(px-2, py-2, px+2, py+2,
-                                      fill="orange", tags=("device", device_tag, node.node_id))
+                items.append(self.canvas.create_oval(px-2, py-2, px+2, py+2,
+                                      fill="orange", tags=("device", device_tag, node.node_id)))
 
         elif node_type == "server":
             # Server (Tower)
-            self.canvas.create_rectangle(x-15, y-25, x+15, y+25,
+            items.append(self.canvas.create_rectangle(x-15, y-25, x+15, y+25,
                                        fill="#9370DB", outline="black", width=2,
-                                       tags=("device", device_tag, node.node_id))
+                                       tags=("device", device_tag, node.node_id)))
             # Rack lines
             for i in range(3):
                 py = y - 15 + i * 15
-                self.canvas.create_line(x-10, py, x+10, py, fill="black", tags=("device", device_tag, node.node_id))
+                items.append(self.canvas.create_line(x-10, py, x+10, py, fill="black", tags=("device", device_tag, node.node_id)))
             # LEDs
-            self.canvas.create_oval(x-10, y-20, x-6, y-16, fill="green", tags=("device", device_tag, node.node_id))
+            items.append(self.canvas.create_oval(x-10, y-20, x-6, y-16, fill="green", tags=("device", device_tag, node.node_id)))
 
         elif node_type == "firewall":
             # Firewall (Brick Wall)
-            self.canvas.create_rectangle(x-20, y-15, x+20, y+15,
+            items.append(self.canvas.create_rectangle(x-20, y-15, x+20, y+15,
                                        fill="#CD5C5C", outline="black", width=2,
-                                       tags=("device", device_tag, node.node_id))
+                                       tags=("device", device_tag, node.node_id)))
             # Brick pattern
-            self.canvas.create_line(x-20, y, x+20, y, fill="white", tags=("device", device_tag, node.node_id))
-            self.canvas.create_line(x, y-15, x, y, fill="white", tags=("device", device_tag, node.node_id))
-            self.canvas.create_line(x-10, y, x-10, y+15, fill="white", tags=("device", device_tag, node.node_id))
-            self.canvas.create_line(x+10, y, x+10, y+15, fill="white", tags=("device", device_tag, node.node_id))
+            items.append(self.canvas.create_line(x-20, y, x+20, y, fill="white", tags=("device", device_tag, node.node_id)))
+            items.append(self.canvas.create_line(x, y-15, x, y, fill="white", tags=("device", device_tag, node.node_id)))
+            items.append(self.canvas.create_line(x-10, y, x-10, y+15, fill="white", tags=("device", device_tag, node.node_id)))
+            items.append(self.canvas.create_line(x+10, y, x+10, y+15, fill="white", tags=("device", device_tag, node.node_id)))
 
         elif node_type == "isp":
             # ISP (Cloud)
-            self.canvas.create_oval(x-30, y-10, x+10, y+20, fill="#D3D3D3", outline="", tags=("device", device_tag, node.node_id))
-            self.canvas.create_oval(x-10, y-20, x+30, y+10, fill="#D3D3D3", outline="", tags=("device", device_tag, node.node_id))
-            self.canvas.create_oval(x-20, y-5, x+20, y+25, fill="#D3D3D3", outline="", tags=("device", device_tag, node.node_id))
-            self.canvas.create_text(x, y, text="ISP", font=("Arial", 8, "bold"), tags=("device", device_tag, node.node_id))
+            items.append(self.canvas.create_oval(x-30, y-10, x+10, y+20, fill="#D3D3D3", outline="", tags=("device", device_tag, node.node_id)))
+            items.append(self.canvas.create_oval(x-10, y-20, x+30, y+10, fill="#D3D3D3", outline="", tags=("device", device_tag, node.node_id)))
+            items.append(self.canvas.create_oval(x-20, y-5, x+20, y+25, fill="#D3D3D3", outline="", tags=("device", device_tag, node.node_id)))
+            items.append(self.canvas.create_text(x, y, text="ISP", font=self._font(8, "bold"), tags=("device", device_tag, node.node_id)))
 
         elif node_type == "ap":
             # Access Point
-            self.canvas.create_rectangle(x-15, y-10, x+15, y+10,
+            items.append(self.canvas.create_rectangle(x-15, y-10, x+15, y+10,
                                        fill="#00CED1", outline="black", width=2,
-                                       tags=("device", device_tag, node.node_id))
+                                       tags=("device", device_tag, node.node_id)))
             # Antenna
-            self.canvas.create_line(x, y-10, x, y-25, width=2, fill="black", tags=("device", device_tag, node.node_id))
+            items.append(self.canvas.create_line(x, y-10, x, y-25, width=2, fill="black", tags=("device", device_tag, node.node_id)))
             # Signal waves
-            self.canvas.create_arc(x-10, y-30, x+10, y-10, start=45, extent=90, style="arc", outline="blue", tags=("device", device_tag, node.node_id))
-            self.canvas.create_arc(x-20, y-40, x+20, y, start=45, extent=90, style="arc", outline="blue", tags=("device", device_tag, node.node_id))
+            items.append(self.canvas.create_arc(x-10, y-30, x+10, y-10, start=45, extent=90, style="arc", outline="blue", tags=("device", device_tag, node.node_id)))
+            items.append(self.canvas.create_arc(x-20, y-40, x+20, y, start=45, extent=90, style="arc", outline="blue", tags=("device", device_tag, node.node_id)))
 
         elif node_type == "load_balancer":
             # Load Balancer
-            self.canvas.create_oval(x-20, y-20, x+20, y+20,
+            items.append(self.canvas.create_oval(x-20, y-20, x+20, y+20,
                                   fill="#FF69B4", outline="black", width=2,
-                                  tags=("device", device_tag, node.node_id))
+                                  tags=("device", device_tag, node.node_id)))
             # Arrows
-            self.canvas.create_line(x-10, y, x+10, y-10, arrow=tk.LAST, tags=("device", device_tag, node.node_id))
-            self.canvas.create_line(x-10, y, x+10, y+10, arrow=tk.LAST, tags=("device", device_tag, node.node_id))
+            items.append(self.canvas.create_line(x-10, y, x+10, y-10, arrow=tk.LAST, tags=("device", device_tag, node.node_id)))
+            items.append(self.canvas.create_line(x-10, y, x+10, y+10, arrow=tk.LAST, tags=("device", device_tag, node.node_id)))
 
         else:
             # Default rectangle for unknown types
             fill_color = self.node_colors.get(node_type, "gray")
-            self.canvas.create_rectangle(x-20, y-15, x+20, y+15,
+            items.append(self.canvas.create_rectangle(x-20, y-15, x+20, y+15,
                                        fill=fill_color, outline="black", width=2,
-                                       tags=("device", device_tag, node.node_id))
+                                       tags=("device", device_tag, node.node_id)))
 
     def animate_packet(self, path, color="blue", speed=10.0):
         """
@@ -568,8 +712,7 @@ class NetworkVisualizer:
         self.node_positions[self.dragged_node] = (new_x, new_y)
 
         # Move all canvas items associated with this node by the incremental change
-        node_items = self.canvas.find_withtag(self.dragged_node)
-        for item in node_items:
+        for item in self.node_items.get(self.dragged_node, ()):
             self.canvas.move(item, dx, dy)
 
         # Update connected links
@@ -620,8 +763,7 @@ class NetworkVisualizer:
         dy = new_pos[1] - old_pos[1]
 
         # Move all canvas items associated with this node
-        node_items = self.canvas.find_withtag(node_id)
-        for item in node_items:
+        for item in self.node_items.get(node_id, ()):
             self.canvas.move(item, dx, dy)
 
         # Update connected links
@@ -0,0 +1,238 @@
+import sys
+import os
+import random
+from array import array
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import networkx as nx
+import pytest
+
+import src.protocols as protocols
+from src.core import Link, Node, Topology
+from src.protocols import OSPFNetwork, OSPFRouter, RIPNetwork, intern_id
+
+
+def make_topology(num_routers=25, num_links=45, num_hosts=5, seed=1):
+    """Random connected router core with hosts hanging off it."""
+    rng = random.Random(seed)
+    topology = Topology()
+    for i in range(num_routers):
+        topology.add_node(Node(f"R{i}", "router"))
+
+    def random_link(a, b):
+        return Link(a, b, bandwidth=rng.choice([10e6, 100e6, 1e9, 2e6, 50e6]))
+
+    for i in range(1, num_routers):
+        topology.add_link(random_link(f"R{rng.randrange(i)}", f"R{i}"))
+    while len(topology.links) < num_links:
+        a, b = rng.sample(range(num_routers), 2)
+        if not topology.get_link(f"R{a}", f"R{b}"):
+            topology.add_link(random_link(f"R{a}", f"R{b}"))
+    for i in range(num_hosts):
+        topology.add_node(Node(f"H{i}", "host"))
+        topology.add_link(random_link(f"R{rng.randrange(num_routers)}", f"H{i}"))
+    return topology
+
+
+def ospf_reference(network):
+    """Directed OSPF cost graph of the topology: only routers forward."""
+    router = next(iter(network.routers.values()))
+    graph = nx.DiGraph()
+    for link in network.topology.get_all_links():
+        cost = router._calculate_link_cost(link)
+        for u, v in (link.nodes, link.nodes[::-1]):
+            if u in network.routers:
+                graph.add_edge(u, v, weight=cost)
+    return graph
+
+
+def route_costs(router):
+    return {dest: route[1] for dest, route in router.get_routing_table().items()}
+
+
+def assert_tables_match(network, graph):
+    for router_id, router in network.routers.items():
+        expected = nx.single_source_dijkstra_path_length(graph, router_id)
+        del expected[router_id]
+        assert route_costs(router) == pytest.approx(expected)
+        for dest, route in router.get_routing_table().items():
+            # The next hop starts a shortest path to the destination
+            next_hop, cost = route[0], route[1]
+            if next_hop == dest:
+                assert graph.edges[router_id, dest]["weight"] == pytest.approx(cost)
+            else:
+                assert graph.edges[router_id, next_hop]["weight"] + \
+                    nx.dijkstra_path_length(graph, next_hop, dest) == pytest.approx(cost)
+
+
+def test_ospf_matches_networkx():
+    network = OSPFNetwork(make_topology())
+    network.run_protocol()
+    assert_tables_match(network, ospf_reference(network))
+
+
+def test_ospf_compiled_spf_matches_networkx(monkeypatch):
+    if protocols.csgraph_dijkstra is None:
+        pytest.skip("scipy not installed")
+    monkeypatch.setattr(protocols, "_COMPILED_SPF_MIN_NODES", 0)
+    network = OSPFNetwork(make_topology(seed=2))
+    network.run_protocol()
+    assert_tables_match(network, ospf_reference(network))
+
+
+def test_ospf_pooled_spf_matches_serial():
+    topology = make_topology(seed=3)
+    serial = OSPFNetwork(topology)
+    serial.run_protocol()
+    pooled = OSPFNetwork(topology)
+    pooled.spf_workers = 2
+    pooled.run_protocol()
+    assert {k: dict(v) for k, v in pooled.get_routing_tables().items()} == \
+        {k: dict(v) for k, v in serial.get_routing_tables().items()}
+
+
+def lsa_links(lsa):
+    """Neighbor ID -> cost advertised in an LSA."""
+    names = protocols._ID_REV
+    return {names[neighbor]: cost for neighbor, cost in zip(lsa.neighbors, lsa.costs)}
+
+
+def newer_lsa(lsa, links):
+    """The next LSA from the same router, advertising links instead."""
+    return lsa._replace(neighbors=array('i', map(intern_id, links)),
+                        costs=array(lsa.costs.typecode, links.values()),
+                        sequence_number=lsa.sequence_number + 1)
+
+
+def lsdb_reference(router):
+    """Directed cost graph of one router's LSDB."""
+    graph = nx.DiGraph()
+    for router_id, lsa in router.lsdb.items():
+        for neighbor, cost in lsa_links(lsa).items():
+            graph.add_edge(router_id, neighbor, weight=cost)
+    return graph
+
+
+def assert_matches_lsdb(router):
+    expected = nx.single_source_dijkstra_path_length(lsdb_reference(router), router.router_id)
+    del expected[router.router_id]
+    assert route_costs(router) == pytest.approx(expected)
+
+
+def readvertise(network, router_id, extra=(), drop=()):
+    """Flood a newer LSA for router_id with links added and/or removed."""
+    router = network.routers[router_id]
+    lsa = router.get_lsa()
+    links = {neighbor: cost for neighbor, cost in lsa_links(lsa).items() if neighbor not in drop}
+    links.update(extra)
+    router.update_lsdb(newer_lsa(lsa, links))
+    network.run_protocol()
+
+
+def test_ospf_incremental_spf_matches_full(monkeypatch):
+    network = OSPFNetwork(make_topology(seed=4))
+    network.run_protocol()
+
+    calls = []
+    incremental = OSPFRouter._incremental_spf
+    monkeypatch.setattr(OSPFRouter, "_incremental_spf",
+                        lambda self, changed: calls.append(self.router_id) or incremental(self, changed))
+
+    # A new cheap shortcut only lowers costs, so SPF is applied incrementally
+    readvertise(network, "R0", extra=[("R24", 1)])
+    readvertise(network, "R24", extra=[("R0", 1)])
+    assert calls
+    for router in network.routers.values():
+        assert_matches_lsdb(router)
+
+
+def test_ospf_link_removal_reruns_full_spf():
+    network = OSPFNetwork(make_topology(seed=5))
+    network.run_protocol()
+
+    router = network.routers["R1"]
+    dropped = next(iter(lsa_links(router.get_lsa())))
+    readvertise(network, "R1", drop=[dropped])
+    assert_matches_lsdb(router)
+    assert router.get_routing_table().get(dropped, (None,))[0] != dropped
+
+
+def test_ospf_spf_sized_by_network_not_interned_ids():
+    for i in range(20000):
+        intern_id(f"unrelated-{i}")
+    topology = make_topology(seed=7)
+    network = OSPFNetwork(topology)
+    network.run_protocol()
+    assert_tables_match(network, ospf_reference(network))
+    assert all(len(router._spf_dist) == len(topology.nodes) for router in network.routers.values())
+
+    # A router new to the graph is appended to its numbering incrementally
+    readvertise(network, "R3", extra=[("R-new", 1)])
+    router = network.routers["R3"]
+    assert_matches_lsdb(router)
+    assert router.get_path("R-new") == ["R3", "R-new"]
+    assert len(router._spf_dist) == len(topology.nodes) + 1
+
+
+def rip_reference(network):
+    """Converged RIP hop counts: routers forward, every other node is a leaf."""
+    graph = nx.DiGraph()
+    for router_id, router in network.routers.items():
+        for neighbor_id in router.neighbors:
+            graph.add_edge(router_id, neighbor_id)
+    return graph
+
+
+def assert_rip_converged(network):
+    graph = rip_reference(network)
+    for router_id, table in network.get_routing_tables().items():
+        expected = {dest: hops for dest, hops in nx.single_source_shortest_path_length(graph, router_id).items()
+                    if hops < 16}
+        assert {dest: cost for dest, (_, cost, _) in table.items()} == expected
+        for dest, (next_hop, cost, _) in table.items():
+            if dest != router_id:
+                assert next_hop in network.routers[router_id].neighbors
+                assert expected.get(next_hop, 0) == 1
+                assert cost == 1 + (0 if next_hop == dest else
+                                    nx.shortest_path_length(graph, next_hop, dest))
+
+
+def test_rip_matches_networkx():
+    network = RIPNetwork(make_topology(seed=6))
+    network.run_protocol()
+    assert_rip_converged(network)
+
+
+def line_network(length=6):
+    topology = Topology()
+    for i in range(length):
+        topology.add_node(Node(f"R{i}", "router"))
+    for i in range(1, length):
+        topology.add_link(Link(f"R{i - 1}", f"R{i}"))
+    network = RIPNetwork(topology)
+    network.run_protocol()
+    return network
+
+
+def test_rip_honours_removed_neighbor_on_rerun():
+    network = line_network()
+    routers = network.routers
+    routers["R0"].remove_neighbor("R1")
+    routers["R1"].remove_neighbor("R0")
+    network.run_protocol()
+
+    assert dict(routers["R0"].get_routing_table()).keys() == {"R0"}
+    assert all(next_hop != "R0" for next_hop, _, _ in routers["R1"].get_routing_table().values()
+               if next_hop != "R1")
+
+
+def test_rip_honours_added_neighbor_on_rerun():
+    network = line_network()
+    routers = network.routers
+    routers["R0"].add_neighbor("R5")
+    routers["R5"].add_neighbor("R0")
+    network.run_protocol()
+
+    assert routers["R0"].get_routing_table()["R5"][:2] == ("R5", 1)
+    assert routers["R0"].get_routing_table()["R4"][:2] == ("R5", 2)
+    assert_rip_converged(network)
@@ -0,0 +1,312 @@
+import sys
+import os
+import heapq
+import random
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import networkx as nx
+import pytest
+
+import src.routing_algorithms as routing_algorithms
+from src.core import Link, Node, Topology
+from src.routing_algorithms import RoutingEngine
+from src.routing_engine import RoutingEngine as RouteTableEngine
+
+
+def make_topology(num_nodes=30, num_links=70, seed=1, located=True):
+    """Random connected topology with varied link delay, bandwidth and loss."""
+    rng = random.Random(seed)
+    topology = Topology()
+    for i in range(num_nodes):
+        coordinates = (rng.randint(0, 800), rng.randint(0, 600)) if located else None
+        topology.add_node(Node(f"N{i}", "router", coordinates))
+
+    def random_link(a, b):
+        return Link(a, b, delay=rng.uniform(1, 50), bandwidth=rng.choice([10e6, 100e6, 1e9]),
+                    loss=rng.uniform(0, 0.01))
+
+    # A spanning path keeps it connected, the rest are random chords
+    for i in range(1, num_nodes):
+        topology.add_link(random_link(f"N{i - 1}", f"N{i}"))
+    while len(topology.links) < num_links:
+        a, b = rng.sample(range(num_nodes), 2)
+        if not topology.get_link(f"N{a}", f"N{b}"):
+            topology.add_link(random_link(f"N{a}", f"N{b}"))
+    return topology
+
+
+def reference_graph(engine):
+    """networkx graph of the operational links, weighted with the engine's cost formula."""
+    graph = nx.Graph()
+    graph.add_nodes_from(engine.topology.nodes)
+    for link in engine.topology.get_all_links():
+        if link.status:
+            graph.add_edge(link.node_a, link.node_b, weight=engine._calculate_link_cost(link))
+    return graph
+
+
+def path_cost(graph, path):
+    return sum(graph.edges[u, v]["weight"] for u, v in zip(path, path[1:]))
+
+
+def assert_matches_reference(engine, algorithm, pairs):
+    graph = reference_graph(engine)
+    for source, target in pairs:
+        path, cost = engine.compute_route(algorithm, source, target)
+        if algorithm.lower() == "astar":
+            # The pixel-distance heuristic overestimates link costs, so A*
+            # is checked against A* rather than against exact shortest paths
+            expected = reference_astar_cost(engine, graph, source, target)
+        else:
+            expected = nx.dijkstra_path_length(graph, source, target)
+        assert cost == pytest.approx(expected)
+        assert path[0] == source and path[-1] == target
+        assert path_cost(graph, path) == pytest.approx(expected)
+
+
+def reference_astar_cost(engine, graph, source, target):
+    """Textbook A* (nodes may be reopened) with the engine's Euclidean heuristic."""
+    coords = engine.topology.node_coordinates
+    tx, ty = coords[target]
+    estimate = {node: ((x - tx) ** 2 + (y - ty) ** 2) ** 0.5 for node, (x, y) in coords.items()}
+    g_score = {source: 0.0}
+    queue = [(estimate[source], source)]
+    while queue:
+        f, node = heapq.heappop(queue)
+        if f > g_score[node] + estimate[node]:
+            continue
+        if node == target:
+            return g_score[node]
+        for neighbor, data in graph[node].items():
+            g = g_score[node] + data["weight"]
+            if neighbor not in g_score or g < g_score[neighbor]:
+                g_score[neighbor] = g
+                heapq.heappush(queue, (g + estimate[neighbor], neighbor))
+    return float("inf")
+
+
+def sample_pairs(topology, count=40, seed=2):
+    rng = random.Random(seed)
+    nodes = sorted(topology.nodes)
+    return [tuple(rng.sample(nodes, 2)) for _ in range(count)]
+
+
+@pytest.mark.parametrize("algorithm", ["dijkstra", "astar", "bellman_ford", "rip", "Dijkstra"])
+def test_routes_match_networkx(algorithm):
+    topology = make_topology()
+    assert_matches_reference(RoutingEngine(topology), algorithm, sample_pairs(topology))
+
+
+def test_astar_without_coordinates_is_exact():
+    topology = make_topology(seed=13, located=False)
+    engine = RoutingEngine(topology)
+    graph = reference_graph(engine)
+    for source, target in sample_pairs(topology):
+        assert engine.compute_route("astar", source, target)[1] == \
+            pytest.approx(nx.dijkstra_path_length(graph, source, target))
+
+
+def test_dijkstra_python_path_matches_networkx(monkeypatch):
+    # Without the compiled kernel Dijkstra runs over the bucket queue
+    monkeypatch.setattr(routing_algorithms, "_dijkstra_csr_jit", None)
+    topology = make_topology(seed=3)
+    engine = RoutingEngine(topology)
+    assert_matches_reference(engine, "dijkstra", sample_pairs(topology))
+    assert engine._bucket_scale is not None
+
+
+def test_dijkstra_binary_heap_matches_networkx(monkeypatch):
+    monkeypatch.setattr(routing_algorithms, "_dijkstra_csr_jit", None)
+    topology = make_topology(seed=4)
+    engine = RoutingEngine(topology)
+    engine._link_costs()
+    engine._bucket_scale = None
+    assert_matches_reference(engine, "dijkstra", sample_pairs(topology))
+
+
+def test_bucket_queue_orders_like_sorted():
+    rng = random.Random(5)
+    queue = routing_algorithms.BucketQueue((routing_algorithms._BUCKET_COUNT - 2) / 1.0,
+                                           routing_algorithms._BUCKET_COUNT)
+    popped = []
+    current = 0.0
+    # Monotone use, as in Dijkstra: new keys are at most one max edge past the last pop
+    queue.insert(0.0, "start")
+    pushed = [0.0]
+    while len(queue):
+        current, _ = queue.extract_min()
+        popped.append(current)
+        if len(pushed) < 500:
+            for _ in range(rng.randint(0, 3)):
+                key = current + rng.uniform(0, 1.0)
+                queue.insert(key, str(len(pushed)))
+                pushed.append(key)
+    assert popped == sorted(pushed)
+
+
+def all_pairs_reference(engine):
+    graph = reference_graph(engine)
+    return dict(nx.all_pairs_dijkstra_path_length(graph))
+
+
+@pytest.mark.parametrize("force_algorithm", [None, "floyd_warshall", "sssp"])
+def test_all_pairs_match_networkx(force_algorithm):
+    topology = make_topology(num_nodes=20, num_links=60, seed=6)
+    engine = RoutingEngine(topology)
+    expected = all_pairs_reference(engine)
+    all_pairs = engine.compute_all_pairs_shortest_paths("dijkstra", force_algorithm=force_algorithm)
+    pairs = {(s, t) for s in expected for t in expected[s] if s != t}
+    assert set(all_pairs) == pairs
+    for (source, target), (path, cost) in all_pairs.items():
+        assert cost == pytest.approx(expected[source][target])
+        assert path[0] == source and path[-1] == target
+
+
+def test_pooled_all_sources_match_serial():
+    topology = make_topology(seed=7)
+    serial = RoutingEngine(topology).compute_routes_from_all_sources("dijkstra")
+    engine = RoutingEngine(topology)
+    engine.sssp_workers = 2
+    pooled = engine.compute_routes_from_all_sources("dijkstra")
+    assert pooled.keys() == serial.keys()
+    for source in serial:
+        for target, (_, cost) in serial[source].items():
+            assert pooled[source][target][1] == pytest.approx(cost)
+
+
+def test_route_avoids_link_taken_down_in_place():
+    topology = make_topology(seed=8)
+    engine = RoutingEngine(topology)
+    source, target = "N0", "N29"
+    path, _ = engine.compute_route("dijkstra", source, target)
+
+    topology.get_link(path[0], path[1]).status = False
+    new_path, _ = engine.compute_route("dijkstra", source, target)
+    assert (path[0], path[1]) not in zip(new_path, new_path[1:])
+    assert_matches_reference(engine, "dijkstra", sample_pairs(topology))
+    assert_matches_reference(engine, "astar", sample_pairs(topology))
+
+
+def test_edit_to_link_shared_with_another_topology_updates_route():
+    topology = Topology()
+    for name in "ABC":
+        topology.add_node(Node(name, "router"))
+    links = [Link("A", "B", delay=1), Link("B", "C", delay=1), Link("A", "C", delay=50)]
+    for link in links:
+        topology.add_link(link)
+    engine = RoutingEngine(topology)
+    assert engine.compute_route("dijkstra", "A", "C")[0] == ["A", "B", "C"]
+
+    # A display copy holding the same Link objects must not hide the edit
+    display = Topology()
+    for link in links:
+        display.add_link(link)
+    links[0].delay = 100
+    assert engine.compute_route("dijkstra", "A", "C")[0] == ["A", "C"]
+
+
+def test_delay_edit_updates_cached_all_pairs():
+    topology = make_topology(num_nodes=15, num_links=30, seed=9)
+    engine = RoutingEngine(topology)
+    before = engine.get_network_diameter()
+
+    for link in topology.get_all_links():
+        link.delay *= 3
+    expected = max(d for lengths in all_pairs_reference(engine).values() for d in lengths.values())
+    after = engine.get_network_diameter()
+    assert after[1] == pytest.approx(expected)
+    assert after[1] > before[1]
+
+
+def test_critical_links_match_brute_force():
+    topology = make_topology(num_nodes=12, num_links=16, seed=10)
+    engine = RoutingEngine(topology)
+
+    # Brute force: every link taken out of the networkx graph in turn
+    def diameter(graph):
+        return max((d for lengths in dict(nx.all_pairs_dijkstra_path_length(graph)).values()
+                    for d in lengths.values()), default=0.0)
+
+    graph = reference_graph(engine)
+    original = diameter(graph)
+    expected = []
+    for link in topology.get_all_links():
+        pruned = graph.copy()
+        pruned.remove_edge(link.node_a, link.node_b)
+        if diameter(pruned) > original * 1.5:
+            expected.append((link.node_a, link.node_b))
+
+    assert engine.find_critical_links("DIJKSTRA") == expected
+    assert all(link.status for link in topology.get_all_links())
+
+
+def test_critical_links_keep_all_pairs_cache(monkeypatch):
+    topology = make_topology(num_nodes=12, num_links=16, seed=10)
+    engine = RoutingEngine(topology)
+    engine.find_critical_links("DIJKSTRA")
+
+    # Every link is back up, so the restored routes are reused as they are
+    calls = []
+    compute = engine._compute_all_pairs
+    monkeypatch.setattr(engine, "_compute_all_pairs", lambda *args: calls.append(args) or compute(*args))
+    engine.compute_all_pairs_shortest_paths("dijkstra")
+    assert calls == []
+
+    topology.get_all_links()[0].status = False
+    engine.compute_all_pairs_shortest_paths("dijkstra")
+    assert len(calls) == 1
+
+
+def build_route_tables(topology):
+    tables = RouteTableEngine(topology)
+    tables.compute_all_routes("dijkstra")
+    return tables
+
+
+def test_invalidate_routes_matches_brute_force():
+    topology = make_topology(num_nodes=15, num_links=25, seed=11)
+    tables = build_route_tables(topology)
+    affected = [link.nodes for link in topology.get_all_links()[:3]]
+    affected_edges = {frozenset(link) for link in affected}
+
+    expected = {source: {dest: route for dest, route in table.items()
+                         if not any(frozenset(edge) in affected_edges
+                                    for edge in zip(route["path"], route["path"][1:]))}
+                for source, table in tables.routing_tables.items()}
+    tables.invalidate_routes(affected)
+    assert tables.routing_tables == expected
+
+
+def test_invalidate_routes_after_table_edits():
+    topology = make_topology(num_nodes=10, num_links=15, seed=12)
+    tables = build_route_tables(topology)
+    tables.invalidate_routes([])
+
+    # Drop routes behind the index's back, then invalidate across them
+    route = tables.routing_tables["N0"]["N9"]
+    del tables.routing_tables["N0"]["N9"]
+    del tables.routing_tables["N1"]
+    tables.invalidate_routes([tuple(route["path"][:2])])
+    assert "N9" not in tables.routing_tables["N0"]
+    assert "N1" not in tables.routing_tables
+
+
+def test_invalidate_routes_sees_routes_written_later():
+    topology = Topology()
+    for name in "ABCD":
+        topology.add_node(Node(name, "router"))
+    for a, b in ("AB", "BC", "CD"):
+        topology.add_link(Link(a, b))
+    tables = build_route_tables(topology)
+    tables.invalidate_routes([("C", "D")])
+    assert "D" not in tables.routing_tables["A"]
+
+    # A route added after the index was built is still invalidated
+    tables.routing_tables["A"]["D"] = {"next_hop": "B", "cost": 3.0, "path": ["A", "B", "C", "D"]}
+    # and a replaced route is judged by its new path only
+    tables.routing_tables["B"]["A"] = {"next_hop": "A", "cost": 1.0, "path": ["B", "A"]}
+    tables.routing_tables["A"]["C"] = {"next_hop": "C", "cost": 1.0, "path": ["A", "C"]}
+    tables.invalidate_routes([("B", "C")])
+    assert "D" not in tables.routing_tables["A"]
+    assert "C" in tables.routing_tables["A"]
+    assert "B" in tables.routing_tables["A"]
@@ -0,0 +1,97 @@
+import sys
+import os
+import pickle
+import dataclasses
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from src.simulation_config import (
+    AttackConfig, QoSConfig, RoutingConfig, SimulationConfig, TopologyConfig
+)
+
+
+def sample_configs():
+    custom = SimulationConfig(name="custom", random_seed=7, duration=5.0)
+    custom.routing.qos_weights = QoSConfig(alpha=2.0, beta=0.5, gamma=3.0)
+    custom.attack.attack_types = ["blackhole", "link_flooding"]
+    custom.topology = TopologyConfig(topology_type="Ring", num_routers=6)
+    return [
+        SimulationConfig.create_default(),
+        SimulationConfig.create_mesh_experiment(),
+        SimulationConfig.create_failure_experiment(),
+        SimulationConfig.create_attack_experiment(),
+        custom,
+    ]
+
+
+@pytest.mark.parametrize("config", sample_configs(), ids=lambda config: config.name)
+def test_to_dict_matches_asdict(config):
+    assert config.to_dict() == dataclasses.asdict(config)
+
+
+@pytest.mark.parametrize("eager", [False, True])
+@pytest.mark.parametrize("config", sample_configs(), ids=lambda config: config.name)
+def test_from_dict_round_trip(config, eager):
+    loaded = SimulationConfig.from_dict(config.to_dict(), eager)
+    assert loaded == config
+    assert loaded.to_dict() == config.to_dict()
+
+
+def test_from_dict_fills_defaults_and_fresh_factories():
+    first = SimulationConfig.from_dict({"name": "partial", "routing": {"algorithm": "astar"}})
+    second = SimulationConfig.from_dict({})
+    assert first.name == "partial"
+    assert first.routing == RoutingConfig(algorithm="astar")
+    assert first.topology == TopologyConfig()
+    assert first.attack.attack_types is not second.attack.attack_types
+    assert AttackConfig.from_dict({}).attack_types == ["link_flooding"]
+
+
+def test_lazy_sub_config_mutation_survives_round_trip():
+    config = SimulationConfig.from_dict(SimulationConfig.create_mesh_experiment().to_dict())
+    config.traffic.load_factor = 0.9
+    assert SimulationConfig.from_dict(config.to_dict()).traffic.load_factor == 0.9
+
+
+@pytest.mark.parametrize("config", sample_configs(), ids=lambda config: config.name)
+def test_pickle_round_trip(config):
+    assert pickle.loads(pickle.dumps(config)) == config
+    lazy = SimulationConfig.from_dict(config.to_dict())
+    assert pickle.loads(pickle.dumps(lazy)) == config
+
+
+def test_msgpack_round_trip():
+    pytest.importorskip("msgpack")
+    for config in sample_configs():
+        assert SimulationConfig.from_msgpack(config.to_msgpack()) == config
+
+
+def test_validate_many_matches_validate():
+    configs = sample_configs()
+    invalid = SimulationConfig(duration=-1.0, time_step=0.0)
+    invalid.traffic.load_factor = 1.5
+    invalid.failure.failure_probability = -0.1
+    invalid.routing.qos_weights = QoSConfig(alpha=-1.0)
+    configs.append(invalid)
+    assert SimulationConfig.validate_many(configs) == [config.validate(use_cache=False) for config in configs]
+    assert invalid.validate()
+
+
+def test_load_from_file_sees_rewrites(tmp_path):
+    filename = str(tmp_path / "config.json")
+    first, second = sample_configs()[:2]
+    first.save_to_file(filename)
+    assert SimulationConfig.load_from_file(filename) == first
+    assert SimulationConfig.load_from_file(filename) == first
+
+    second.save_to_file(filename)
+    assert SimulationConfig.load_from_file(filename) == second
+    assert SimulationConfig.load_from_file(filename, use_cache=False) == second
+
+
+def test_save_many_round_trip(tmp_path):
+    filename = str(tmp_path / "configs.jsonl")
+    configs = sample_configs()
+    SimulationConfig.save_many(configs, filename)
+    assert SimulationConfig.load_many(filename) == configs
@@ -0,0 +1,83 @@
+import sys
+import os
+import math
+import random
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import networkx as nx
+import pytest
+
+import src.topology_generation as topology_generation
+from src.core import Link, Node, Topology
+from src.topology_generation import TopologyGenerator
+
+GENERATOR_COUNTS = dict(num_pcs=8, num_routers=4, num_switches=2, num_hubs=1,
+                        num_servers=2, num_firewalls=1, num_isps=1)
+
+
+def test_adjacency_follows_structural_changes():
+    topology = Topology()
+    for name in "ABCD":
+        topology.add_node(Node(name, "router"))
+    topology.add_link(Link("A", "B"))
+    assert topology.get_neighbor_ids("A") == ["B"]
+
+    topology.add_link(Link("A", "C"))
+    assert sorted(topology.get_neighbor_ids("A")) == ["B", "C"]
+    topology.remove_link("A", "B")
+    assert topology.get_neighbor_ids("A") == ["C"]
+    topology.remove_node("C")
+    assert topology.get_adjacency() == {"A": [], "B": [], "D": []}
+
+
+def test_extend_links_matches_add_link():
+    links = [("A", "B"), ("B", "C"), ("A", "C"), ("C", "D"), ("B", "A")]
+    one_by_one, bulk = Topology(), Topology()
+    for topology in (one_by_one, bulk):
+        for name in "ABCD":
+            topology.add_node(Node(name, "router"))
+    for a, b in links:
+        one_by_one.add_link(Link(a, b, delay=len(a + b)))
+    bulk.extend_links(Link(a, b, delay=len(a + b)) for a, b in links)
+
+    assert bulk.links == one_by_one.links
+    assert nx.utils.graphs_equal(bulk.graph, one_by_one.graph)
+    assert bulk.get_adjacency() == one_by_one.get_adjacency()
+
+
+def nearest_by_scan(topology, candidates, target):
+    tx, ty = topology.get_node_coordinates(target)
+    return min(candidates,
+               key=lambda c: (math.dist((tx, ty), topology.get_node_coordinates(c)), candidates.index(c)))
+
+
+@pytest.mark.parametrize("tier", ["kdtree", "jit", "python"])
+def test_nearest_node_finder_tiers_agree(monkeypatch, tier):
+    if tier == "kdtree" and topology_generation.cKDTree is None:
+        pytest.skip("scipy not installed")
+    if tier == "jit" and topology_generation._nearest_index_jit is None:
+        pytest.skip("numba not installed")
+    if tier != "kdtree":
+        monkeypatch.setattr(topology_generation, "cKDTree", None)
+    if tier == "python":
+        monkeypatch.setattr(topology_generation, "_nearest_index_jit", None)
+
+    rng = random.Random(1)
+    topology = Topology()
+    # A coarse grid forces plenty of equal-distance ties
+    for i in range(200):
+        topology.add_node(Node(f"N{i}", "host", (rng.randrange(0, 100, 10), rng.randrange(0, 100, 10))))
+    candidates = [f"N{i}" for i in range(0, 200, 7)]
+    find = TopologyGenerator()._nearest_node_finder(topology, candidates)
+    for target in topology.nodes:
+        assert find(target) == nearest_by_scan(topology, candidates, target)
+
+
+@pytest.mark.parametrize("method", ["generate_hierarchical", "generate_star", "generate_ring",
+                                    "generate_mesh", "generate_tree"])
+def test_generated_topologies_validate(method):
+    generator = TopologyGenerator(random_seed=3)
+    topology = getattr(generator, method)(**GENERATOR_COUNTS)
+    assert topology.is_connected()
+    assert generator.validate_topology(topology) == []
+    assert topology.get_adjacency() == {node: list(topology.graph.adj[node]) for node in topology.graph}